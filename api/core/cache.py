@@ -0,0 +1,155 @@
+"""In-process caching primitives."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class LRUCache(Generic[K]):
+    """Thread-safe LRU mapping bounded by the total weight of its entries.
+
+    Each entry carries a weight (1 by default, or e.g. a size in bytes). When
+    the total weight exceeds ``max_weight`` the least recently used entries
+    are evicted. A single entry heavier than ``max_weight`` is still kept, so
+    the most recent value is always available. The cache is generic in its
+    key type K.
+    """
+
+    def __init__(self, max_weight: int):
+        """Initialize cache.
+
+        Args:
+            max_weight: Maximum total weight of cached entries
+        """
+        self.max_weight = max_weight
+        self._entries: OrderedDict[K, tuple[Any, int]] = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K, default: Optional[Any] = None) -> Any:
+        """Get a value and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: K, default: Optional[Any] = None) -> Any:
+        """Get a value without updating recency or hit/miss counters.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return default if entry is None else entry[0]
+
+    def put(self, key: K, value: Any, weight: int = 1) -> None:
+        """Insert or replace a value, evicting old entries if needed.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            weight: Entry weight counted against max_weight
+        """
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._weight -= old[1]
+
+            self._entries[key] = (value, weight)
+            self._weight += weight
+
+            while self._weight > self.max_weight and len(self._entries) > 1:
+                _, (_, evicted_weight) = self._entries.popitem(last=False)
+                self._weight -= evicted_weight
+                self.evictions += 1
+
+    def pop(self, key: K, default: Optional[Any] = None) -> Any:
+        """Remove a value.
+
+        Args:
+            key: Cache key
+            default: Value returned if key is absent
+
+        Returns:
+            Removed value or default
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._weight -= entry[1]
+            return entry[0]
+
+    def pop_where(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every entry whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key; True removes the entry
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                _, weight = self._entries.pop(key)
+                self._weight -= weight
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    @property
+    def weight(self) -> int:
+        """Total weight of cached entries."""
+        return self._weight
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dict with entries, weight, hits, misses and evictions
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "weight": self._weight,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,103 @@
+"""Single-flight coalescing of identical concurrent requests.
+
+When many clients ask for the same prediction at once (a race page going
+live), only the first request computes it. Requests with the same key that
+arrive while it is in flight await that computation and share its result,
+or its exception. Nothing is kept once the computation finishes; caching
+results is the prediction store's job.
+"""
+
+import asyncio
+import json
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def coalesce_key(endpoint: str, **parts: Any) -> tuple:
+    """Build a canonical coalescing key.
+
+    Keyword order does not matter, and dict/list values (e.g. counterfactual
+    changes) are serialized with sorted keys, so equivalent requests map to
+    the same key.
+
+    Args:
+        endpoint: Endpoint name
+        **parts: Request parameters identifying the result
+
+    Returns:
+        Hashable key
+    """
+
+    def _canonical(value: Any) -> Hashable:
+        if isinstance(value, (dict, list, tuple, set)):
+            if isinstance(value, set):
+                value = sorted(value, key=repr)
+            return json.dumps(value, sort_keys=True, default=str)
+        return value
+
+    return (endpoint, *sorted((name, _canonical(value)) for name, value in parts.items()))
+
+
+class SingleFlight:
+    """Shares one in-flight computation between concurrent identical requests."""
+
+    def __init__(self):
+        """Initialize coalescer."""
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.executed = 0
+        self.merged = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await the in-flight computation for ``key``, or start it.
+
+        The computation runs as its own task and is shielded from callers,
+        so a client disconnecting does not cancel it for the others.
+
+        Args:
+            key: Coalescing key (see coalesce_key)
+            fn: Coroutine factory computing the result on a miss
+
+        Returns:
+            The computation's result
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            # Futures are bound to their loop; never share one across loops
+            if future is not None and future.get_loop() is loop:
+                self.merged += 1
+            else:
+                future = asyncio.ensure_future(fn())
+                self._in_flight[key] = future
+                self.executed += 1
+                future.add_done_callback(lambda done: self._discard(key, done))
+
+        return await asyncio.shield(future)
+
+    def _discard(self, key: Hashable, future: asyncio.Future) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def stats(self) -> dict[str, int]:
+        """Return coalescing counters.
+
+        Returns:
+            Dict with calls, executed (computations started), merged
+            (calls that joined an in-flight computation) and in_flight
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executed": self.executed,
+                "merged": self.merged,
+                "in_flight": len(self._in_flight),
+            }
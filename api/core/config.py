@@ -27,6 +27,11 @@ class Settings(BaseSettings):
     # Data Storage Directories
     data_dir: str = Field(default="./data", description="Root data directory")
     cache_dir: str = Field(default="./data/cache", description="Cache directory for processed data")
+    features_mmap_dir: Optional[str] = Field(
+        default="./data/cache/features",
+        description="Directory for memory-mapped Arrow copies of the features "
+        "(None = each worker loads the parquet into its own memory)",
+    )
     model_dir: str = Field(default="./models", description="Model artifacts directory")
     reports_dir: str = Field(default="./reports", description="Reports output directory")
 
@@ -59,6 +64,77 @@ class Settings(BaseSettings):
         default=0.01, description="Feature importance threshold for selection"
     )
 
+    # Model Serving
+    model_cache_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        description="Upper bound on cached model artifact bytes held in memory",
+    )
+    model_cache_revalidate_seconds: float = Field(
+        default=5.0,
+        description="Seconds between artifact mtime checks for cached models (0 = every request)",
+    )
+    model_tree_backend: str = Field(
+        default="compiled",
+        description="Inference backend for tree models: compiled (flat arrays) or native",
+    )
+
+    # Prediction Store
+    prediction_store_enabled: bool = Field(
+        default=True, description="Persist computed race predictions to disk"
+    )
+    prediction_store_dir: str = Field(
+        default="./data/cache/predictions", description="Directory for stored race predictions"
+    )
+    prediction_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, description="In-memory bytes of serialized predictions"
+    )
+    prediction_cache_max_age: int = Field(
+        default=300, description="Cache-Control max-age (seconds) for race predictions"
+    )
+    explanation_cache_size: int = Field(
+        default=256, description="Races whose explanations (all drivers) are kept in memory"
+    )
+    race_catalog_max_age: int = Field(
+        default=300, description="Cache-Control max-age (seconds) for race listings"
+    )
+
+    # Compute Executors
+    compute_threads: Optional[int] = Field(
+        default=None, description="Thread pool size for model inference (None = CPU count)"
+    )
+    compute_processes: int = Field(
+        default=2,
+        description="Process pool size for SHAP/permutation work (0 = run on the thread pool)",
+    )
+    compute_thread_queue_size: int = Field(
+        default=64, description="Requests allowed to wait for a compute thread before 503"
+    )
+    compute_process_queue_size: int = Field(
+        default=16, description="Requests allowed to wait for a compute process before 503"
+    )
+
+    # Startup Warm-up
+    warmup_enabled: bool = Field(
+        default=True, description="Preload features, models and explainers at startup"
+    )
+    warmup_models: Optional[list[str]] = Field(
+        default=None, description="Models to preload (None = all models with artifacts)"
+    )
+    warmup_explainers: bool = Field(
+        default=True,
+        description="Warm compute processes (SHAP import, model load, tree explainers)",
+    )
+    explainer_persist: bool = Field(
+        default=False,
+        description="Save SHAP tree explainers next to model artifacts and reuse them",
+    )
+
+    # Hot Reload
+    reload_interval_seconds: float = Field(
+        default=10.0,
+        description="Seconds between features/model artifact change checks (0 = disabled)",
+    )
+
     # Backtesting
     backtest_start_year: int = Field(default=2022, description="Backtest start year")
     backtest_end_year: int = Field(default=2024, description="Backtest end year")
@@ -66,6 +142,10 @@ class Settings(BaseSettings):
     # Monitoring & Logging
     enable_metrics: bool = Field(default=True, description="Enable metrics collection")
     metrics_dir: str = Field(default="./metrics", description="Metrics output directory")
+    metrics_textfile_interval_seconds: float = Field(
+        default=15.0,
+        description="Seconds between textfile snapshots in metrics_dir (0 = at shutdown only)",
+    )
 
     class Config:
         """Pydantic configuration."""
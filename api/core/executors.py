@@ -0,0 +1,194 @@
+"""Executor layer for CPU-bound request work.
+
+Route handlers are ``async def`` but the work behind them (pandas, sklearn,
+XGBoost, torch, SHAP) is synchronous. Running it inline blocks the event
+loop, so one slow explanation stalls every other request on the worker,
+including /health. Handlers instead await one of two pools:
+
+- a thread pool for model calls that release the GIL (NumPy, tree
+  boosters, torch), where threads scale with cores without copying data;
+- a process pool for pure-Python-heavy paths (SHAP, permutation
+  importance) that would otherwise serialize on the GIL.
+
+Each pool admits at most ``workers + queue_size`` tasks. Past that, the
+request fails fast with 503 and Retry-After instead of piling up behind a
+queue it would time out in.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional, TypeVar
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorBusyError(HTTPException):
+    """Raised when a pool's bounded queue is full (503 Service Unavailable)."""
+
+    def __init__(self, pool: str):
+        super().__init__(
+            status_code=503,
+            detail=f"Server busy: {pool} pool queue is full, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+class _Slots:
+    """Non-blocking counter bounding in-flight tasks for one pool."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, *_: Any) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+class ComputeExecutors:
+    """Bounded thread and process pools for request work."""
+
+    def __init__(
+        self,
+        threads: Optional[int] = None,
+        processes: int = 2,
+        thread_queue_size: int = 64,
+        process_queue_size: int = 16,
+        start_method: str = "spawn",
+    ):
+        """Initialize executors.
+
+        The process pool is created on first use. ``spawn`` is the default
+        start method because forking a process that already runs torch and
+        BLAS threads can deadlock the child.
+
+        Args:
+            threads: Thread pool size (None = CPU count)
+            processes: Process pool size (0 = run process work on threads)
+            thread_queue_size: Tasks allowed to wait for a thread
+            process_queue_size: Tasks allowed to wait for a process
+            start_method: multiprocessing start method for the process pool
+        """
+        self.threads = threads or os.cpu_count() or 1
+        self.processes = processes
+        self.start_method = start_method
+
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="f1-compute"
+        )
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_lock = threading.Lock()
+
+        self._thread_slots = _Slots(self.threads + thread_queue_size)
+        self._process_slots = _Slots(processes + process_queue_size)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._process_lock:
+            if self._process_pool is None:
+                logger.info(f"Starting process pool ({self.processes} {self.start_method} workers)")
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+            return self._process_pool
+
+    async def _submit(
+        self, pool: Executor, slots: _Slots, name: str, fn: Callable[..., T], *args, **kwargs
+    ) -> T:
+        if not slots.try_acquire():
+            logger.warning(f"{name} pool saturated ({slots.in_flight}/{slots.capacity})")
+            raise ExecutorBusyError(name)
+
+        try:
+            future = pool.submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            slots.release()
+            raise
+
+        future.add_done_callback(slots.release)
+        return await asyncio.wrap_future(future)
+
+    async def run_thread(self, fn: Callable[..., T], /, *args, **kwargs) -> T:
+        """Run a function on the thread pool.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's result
+
+        Raises:
+            ExecutorBusyError: If the thread pool queue is full
+        """
+        return await self._submit(
+            self._thread_pool, self._thread_slots, "thread", fn, *args, **kwargs
+        )
+
+    async def run_process(self, fn: Callable[..., T], /, *args, **kwargs) -> T:
+        """Run a function on the process pool.
+
+        The function and its arguments must be picklable (module-level
+        functions, DataFrames, plain data). Falls back to the thread pool
+        when the process pool is disabled.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's result
+
+        Raises:
+            ExecutorBusyError: If the process pool queue is full
+        """
+        if self.processes <= 0:
+            return await self.run_thread(fn, *args, **kwargs)
+
+        return await self._submit(
+            self._get_process_pool(), self._process_slots, "process", fn, *args, **kwargs
+        )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Pool sizes, in-flight (running + queued) and queued task counts."""
+        pools = {
+            "thread": (self.threads, self._thread_slots),
+            "process": (self.processes, self._process_slots),
+        }
+        return {
+            name: {
+                "workers": workers,
+                "in_flight": slots.in_flight,
+                "queued": max(slots.in_flight - workers, 0),
+                "capacity": slots.capacity,
+            }
+            for name, (workers, slots) in pools.items()
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down both pools."""
+        self._thread_pool.shutdown(wait=wait)
+        with self._process_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=wait)
+                self._process_pool = None
@@ -0,0 +1,54 @@
+"""HTTP helpers for conditional (ETag) responses."""
+
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison required for If-None-Match (RFC 9110 13.1.2),
+    so a ``W/`` prefix added by a proxy still matches.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may be None)
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client's cached representation is current
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    current = _opaque(etag)
+    return any(_opaque(candidate) == current for candidate in if_none_match.split(","))
+
+
+def conditional_json_response(
+    request: Request, payload: bytes, etag: str, max_age: int
+) -> Response:
+    """Build a JSON response, or 304 if the client already has this ETag.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        payload: Serialized JSON body
+        etag: Strong ETag of the payload
+        max_age: Cache-Control max-age in seconds
+
+    Returns:
+        200 response with body, or 304 without body
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=payload, media_type="application/json", headers=headers)
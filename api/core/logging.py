@@ -4,11 +4,13 @@ import json
 import logging
 import sys
 import time
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from api.core.metrics import Metrics
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON structured logging formatter."""
@@ -58,7 +60,17 @@ def setup_logging(log_level: str = "info") -> None:
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for structured request/response logging."""
+    """Middleware for structured request/response logging and latency metrics."""
+
+    def __init__(self, app, metrics: Optional[Metrics] = None):
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application
+            metrics: Optional metrics recording request durations by route
+        """
+        super().__init__(app)
+        self.metrics = metrics
 
     async def dispatch(self, request: Request, call_next):
         """Log request and response with timing."""
@@ -82,6 +94,13 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             response: Response = await call_next(request)
             duration_ms = (time.time() - start_time) * 1000
 
+            if self.metrics is not None:
+                # Route template, not the raw path, to bound label cardinality
+                route = getattr(request.scope.get("route"), "path", "unmatched")
+                self.metrics.observe_request(
+                    request.method, route, response.status_code, duration_ms / 1000
+                )
+
             # Log response
             logger.info(
                 f"Response {response.status_code}",
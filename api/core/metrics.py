@@ -0,0 +1,302 @@
+"""Prometheus-compatible latency metrics.
+
+Histograms are kept in-process and rendered in the Prometheus text
+exposition format at /metrics, so no client library or push gateway is
+needed. Each worker process exposes its own series; scrape every worker
+(or collect the textfile snapshots each worker rewrites periodically in
+``metrics_dir``).
+
+Stage timings come from ``f1.profiling.stage`` hooks in the library code.
+Work sent to a compute pool is wrapped in ``measured``, which collects the
+stages where the work runs (thread or process) and returns them with the
+result, so the API process can record them.
+"""
+
+import asyncio
+import bisect
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+from f1.profiling import collect_stages
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Latency buckets in seconds, 1ms .. 30s
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def measured(fn: Callable[..., T], /, *args, **kwargs) -> tuple[T, list[tuple[str, float]]]:
+    """Call ``fn`` and return its result with the stage timings it recorded.
+
+    Module-level so it can be sent to the process pool. ``compute`` (the
+    whole call, as seen by the worker) is appended to the stages.
+
+    Args:
+        fn: Function to call
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Tuple of (result, [(stage, seconds), ...])
+    """
+    start = time.perf_counter()
+    with collect_stages() as stages:
+        result = fn(*args, **kwargs)
+    stages.append(("compute", time.perf_counter() - start))
+    return result, stages
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram with label sets."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        """Initialize histogram.
+
+        Args:
+            name: Metric name
+            description: HELP text
+            label_names: Names of the labels, in order
+            buckets: Upper bounds in ascending order (+Inf is implicit)
+        """
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        # label values -> (per-bucket counts incl. +Inf, sum)
+        self._series: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value (seconds)
+            *label_values: One value per label name
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.get(label_values, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._series[label_values] = (counts, total + value)
+
+    def count(self, *label_values: str) -> int:
+        """Number of observations for a label set."""
+        with self._lock:
+            series = self._series.get(label_values)
+            return sum(series[0]) if series is not None else 0
+
+    def render(self) -> list[str]:
+        """Render the histogram in Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((k, (list(v[0]), v[1])) for k, v in self._series.items())
+
+        for label_values, (counts, total) in series:
+            labels = dict(zip(self.label_names, label_values))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f"{self.name}_bucket{_format_labels({**labels, 'le': le})} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Metrics:
+    """Request and prediction-stage latency metrics for one process."""
+
+    def __init__(self, enabled: bool = True):
+        """Initialize metrics.
+
+        Args:
+            enabled: Record observations (False = all calls are no-ops)
+        """
+        self.enabled = enabled
+        self.requests = Histogram(
+            "f1_http_request_duration_seconds",
+            "HTTP request duration by route and status",
+            ("method", "route", "status"),
+        )
+        self.stages = Histogram(
+            "f1_stage_duration_seconds",
+            "Duration of prediction-path stages by operation",
+            ("operation", "stage"),
+        )
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Record an HTTP request duration."""
+        if self.enabled:
+            self.requests.observe(seconds, method, route, str(status))
+
+    def observe_stages(self, operation: str, stages: Iterable[tuple[str, float]]) -> None:
+        """Record stage timings for one operation."""
+        if self.enabled:
+            for name, seconds in stages:
+                self.stages.observe(seconds, operation, name)
+
+    async def run(
+        self,
+        operation: str,
+        submit: Callable[..., Awaitable[Any]],
+        fn: Callable[..., T],
+        /,
+        *args,
+        **kwargs,
+    ) -> T:
+        """Run ``fn`` on a compute pool and record its stage timings.
+
+        Besides the stages recorded by ``fn``, records ``total`` (as seen
+        by the caller) and ``executor_wait`` (total minus the time the
+        worker spent computing, i.e. queueing and transfer).
+
+        Args:
+            operation: Operation label (e.g. 'predict_race')
+            submit: Pool entry point, e.g. executors.run_thread
+            fn: Function to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's result
+        """
+        start = time.perf_counter()
+        result, stages = await submit(measured, fn, *args, **kwargs)
+        total = time.perf_counter() - start
+
+        compute = next((seconds for name, seconds in stages if name == "compute"), total)
+        self.observe_stages(
+            operation,
+            [*stages, ("total", total), ("executor_wait", max(total - compute, 0.0))],
+        )
+        return result
+
+    def render(
+        self,
+        gauges: Optional[dict[str, tuple[str, str, dict[str, float]]]] = None,
+        counters: Optional[dict[str, tuple[str, str, dict[str, float]]]] = None,
+    ) -> str:
+        """Render all metrics in Prometheus text format.
+
+        Args:
+            gauges: Extra gauges as name -> (HELP text, label name,
+                {label value: gauge value})
+            counters: Monotonic counts in the same shape as gauges; names
+                are given without the ``_total`` suffix, which is appended
+
+        Returns:
+            Exposition text
+        """
+        lines = self.requests.render() + self.stages.render()
+        series = [(name, "gauge", *entry) for name, entry in (gauges or {}).items()]
+        series += [(f"{name}_total", "counter", *entry) for name, entry in (counters or {}).items()]
+        for name, metric_type, description, label_name, values in series:
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+            for label_value, value in values.items():
+                lines.append(f"{name}{_format_labels({label_name: label_value})} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, metrics_dir: Path, text: str) -> Path:
+        """Write a snapshot for a node_exporter textfile collector.
+
+        Args:
+            metrics_dir: Target directory
+            text: Rendered exposition text
+
+        Returns:
+            Path of the written file (one per worker process)
+        """
+        metrics_dir = Path(metrics_dir)
+        metrics_dir.mkdir(parents=True, exist_ok=True)
+        path = metrics_dir / f"api_{os.getpid()}.prom"
+        tmp_path = path.with_suffix(".prom.tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+        return path
+
+    async def export_textfile(
+        self, metrics_dir: Path, render: Callable[[], str], interval_seconds: float
+    ) -> None:
+        """Rewrite the textfile snapshot forever until cancelled.
+
+        Args:
+            metrics_dir: Target directory
+            render: Returns the current exposition text
+            interval_seconds: Seconds between snapshots
+        """
+        logger.info(f"Writing metrics snapshots to {metrics_dir} every {interval_seconds}s")
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                self.write_textfile(metrics_dir, render())
+            except OSError as e:
+                logger.error(f"Metrics snapshot failed: {e}")
+
+
+def process_memory() -> dict[str, int]:
+    """Resident memory of this process in bytes, from /proc/self/status.
+
+    ``anonymous`` is private heap memory (what grows per worker);
+    ``file`` is file-backed pages such as memory-mapped features, which
+    are shared with every other process mapping the same file.
+
+    Returns:
+        Dict with resident, anonymous and file bytes (empty if unavailable)
+    """
+    fields = {"VmRSS": "resident", "RssAnon": "anonymous", "RssFile": "file"}
+    memory: dict[str, int] = {}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    memory[fields[name]] = int(value.split()[0]) * 1024
+    except OSError:
+        return {}
+    return memory
+
+
+def hit_ratio(stats: dict[str, int]) -> float:
+    """Compute hits / (hits + misses) from cache counters (0 if unused)."""
+    lookups = stats.get("hits", 0) + stats.get("misses", 0)
+    return stats.get("hits", 0) / lookups if lookups else 0.0
@@ -0,0 +1,90 @@
+"""Hot reload of the features file and model artifacts.
+
+A background task polls features.parquet and every loaded model artifact.
+When one changes, the new version is loaded and indexed off the event loop
+and swapped in atomically (see DataCache.refresh and ModelCache.refresh);
+requests already running keep the snapshot they started with. In-memory
+predictions pinned to the superseded version are then dropped by version
+key. Other derived caches need no action: their keys carry the versions.
+"""
+
+import asyncio
+import contextlib
+import logging
+from pathlib import Path
+from typing import Any
+
+from api.core.executors import ComputeExecutors
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactWatcher:
+    """Polls data and model artifacts and swaps in new versions."""
+
+    def __init__(
+        self,
+        features_path: Path,
+        data_cache: Any,
+        model_cache: Any,
+        prediction_cache: Any,
+        interval_seconds: float = 10.0,
+    ):
+        """Initialize watcher.
+
+        Args:
+            features_path: Path to features parquet
+            data_cache: DataCache holding the features snapshot
+            model_cache: ModelCache holding loaded models
+            prediction_cache: PredictionCache to drop superseded entries from
+            interval_seconds: Seconds between polls
+        """
+        self.features_path = Path(features_path)
+        self.data_cache = data_cache
+        self.model_cache = model_cache
+        self.prediction_cache = prediction_cache
+        self.interval_seconds = interval_seconds
+        self.reloads = 0
+
+    def check(self) -> dict[str, Any]:
+        """Poll once, reloading whatever changed.
+
+        Returns:
+            Dict with the swapped features versions (or None) and a list of
+            swapped (model_name, old_fingerprint, new_fingerprint)
+        """
+        features = None
+        # Mid-replace or removed: keep serving the loaded snapshot
+        with contextlib.suppress(FileNotFoundError):
+            features = self.data_cache.refresh(self.features_path)
+
+        if features is not None:
+            dropped = self.prediction_cache.discard(features_version=features[0])
+            logger.info(f"Features reloaded; dropped {dropped} cached predictions")
+            self.reloads += 1
+
+        models = self.model_cache.refresh()
+        for model_name, old_fingerprint, _ in models:
+            dropped = self.prediction_cache.discard(
+                model_name=model_name, model_version=old_fingerprint
+            )
+            logger.info(f"Model {model_name} reloaded; dropped {dropped} cached predictions")
+            self.reloads += 1
+
+        return {"features": features, "models": models}
+
+    async def run(self, executors: ComputeExecutors) -> None:
+        """Poll forever on the compute thread pool until cancelled.
+
+        Args:
+            executors: Compute pools to load new versions on
+        """
+        logger.info(f"Watching {self.features_path} and models every {self.interval_seconds}s")
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await executors.run_thread(self.check)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Artifact reload failed: {e}")
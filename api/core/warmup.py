@@ -0,0 +1,181 @@
+"""Startup warm-up and readiness state.
+
+Without warm-up the first request after a deploy pays for reading
+features.parquet, importing torch/SHAP and unpickling models. The warm-up
+phase does that work eagerly, in parallel on the compute pools, while the
+server already answers /health. /health/ready reports not-ready until it
+finishes, so load balancers only route traffic to hot workers.
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from api.core.executors import ComputeExecutors
+from f1.models.registry import ModelProvider, ModelRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def preload_models(
+    model_names: list[str],
+    model_dir: str,
+    model_provider: ModelProvider,
+    persist_explainers: bool = False,
+) -> list[str]:
+    """Load models through ``model_provider`` and build their explainers.
+
+    Runs in compute processes (via call_with_model_cache) so each worker
+    starts with SHAP imported, models in its own cache and a tree explainer
+    attached to each SHAP-explained model.
+
+    Args:
+        model_names: Models to load
+        model_dir: Model directory
+        model_provider: Model source (the process's model cache)
+        persist_explainers: Reuse/save explainers next to the model artifacts
+
+    Returns:
+        Names of models that were loaded
+    """
+    from f1.analysis.explain import SHAP_MODELS, tree_explainer
+
+    loaded = []
+    for model_name in model_names:
+        try:
+            model_info = model_provider(model_name, Path(model_dir), "win")
+        except FileNotFoundError:
+            continue
+        if model_name in SHAP_MODELS:
+            tree_explainer(model_info, persist=persist_explainers)
+        loaded.append(model_name)
+    return loaded
+
+
+class Warmup:
+    """Tracks warm-up progress and per-item timings."""
+
+    def __init__(self):
+        """Initialize warm-up state (not ready)."""
+        self.status = "pending"
+        self.items: dict[str, dict[str, Any]] = {}
+        self.seconds: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm-up has finished (or was skipped)."""
+        return self.status in ("ready", "disabled")
+
+    def skip(self) -> None:
+        """Mark warm-up as disabled, so the worker is ready immediately."""
+        self.status = "disabled"
+
+    async def _item(
+        self, name: str, executors: ComputeExecutors, fn: Callable[..., Any], *args, **kwargs
+    ) -> None:
+        """Run one warm-up item on the thread pool and record its timing."""
+        start = time.perf_counter()
+        try:
+            await executors.run_thread(fn, *args, **kwargs)
+            status, detail = "ok", None
+        except FileNotFoundError as e:
+            status, detail = "skipped", str(e)
+        except Exception as e:
+            status, detail = "failed", str(e)
+
+        seconds = round(time.perf_counter() - start, 3)
+        self.items[name] = {"status": status, "seconds": seconds, "detail": detail}
+        if status == "failed":
+            logger.warning(f"Warm-up {name} failed after {seconds}s: {detail}")
+        else:
+            logger.info(f"Warm-up {name}: {status} in {seconds}s")
+
+    async def _workers(
+        self, executors: ComputeExecutors, call: Callable[..., Any], **kwargs
+    ) -> None:
+        """Warm every compute process (one task per worker, best effort)."""
+        start = time.perf_counter()
+        tasks = max(executors.processes, 1)
+        try:
+            await asyncio.gather(
+                *(executors.run_process(call, preload_models, **kwargs) for _ in range(tasks))
+            )
+            status, detail = "ok", None
+        except Exception as e:
+            status, detail = "failed", str(e)
+
+        seconds = round(time.perf_counter() - start, 3)
+        self.items["explainers"] = {"status": status, "seconds": seconds, "detail": detail}
+        logger.info(f"Warm-up explainers ({tasks} workers): {status} in {seconds}s")
+
+    async def run(
+        self,
+        features_path: Path,
+        model_dir: Path,
+        model_names: list[str],
+        data_cache: Any,
+        model_cache: Any,
+        executors: ComputeExecutors,
+        worker_call: Optional[Callable[..., Any]] = None,
+        persist_explainers: bool = False,
+    ) -> None:
+        """Preload features, models and explainers in parallel.
+
+        Item failures are recorded and logged but do not keep the worker
+        out of rotation; a missing model artifact is reported as skipped.
+
+        Args:
+            features_path: Path to features parquet
+            model_dir: Model directory
+            model_names: Models to preload
+            data_cache: DataCache to load features into
+            model_cache: ModelCache to load models into
+            executors: Compute pools to run the work on
+            worker_call: Process entry point supplying each worker's model
+                cache (None = skip warming compute processes)
+            persist_explainers: Reuse/save explainers next to the model artifacts
+        """
+        self.status = "running"
+        start = time.perf_counter()
+
+        items = [self._item("features", executors, data_cache.get_index, features_path)]
+        items += [
+            self._item(f"model:{name}", executors, model_cache.get_model, name, model_dir)
+            for name in model_names
+        ]
+        if worker_call is not None:
+            items.append(
+                self._workers(
+                    executors,
+                    worker_call,
+                    model_names=model_names,
+                    model_dir=str(model_dir),
+                    persist_explainers=persist_explainers,
+                )
+            )
+
+        await asyncio.gather(*items)
+
+        self.seconds = round(time.perf_counter() - start, 3)
+        self.status = "ready"
+        logger.info(f"Warm-up finished in {self.seconds}s")
+
+    def report(self) -> dict[str, Any]:
+        """Return readiness status, total time and per-item results."""
+        return {"status": self.status, "seconds": self.seconds, "items": self.items}
+
+
+def warmup_models(model_names: Optional[list[str]]) -> list[str]:
+    """Resolve the configured warm-up model list.
+
+    Args:
+        model_names: Configured model names (None = every registry model)
+
+    Returns:
+        Valid model names to preload
+    """
+    if model_names is None:
+        return ModelRegistry.get_all_models()
+    return [name for name in model_names if ModelRegistry.is_valid_model(name)]
@@ -1,14 +1,29 @@
 """Dependency injection for FastAPI."""
 
+import json
 import logging
+import threading
+import time
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pandas as pd
+from pyarrow import ArrowException
 
+from api.core.cache import LRUCache
+from api.core.coalesce import SingleFlight
 from api.core.config import Settings, get_settings
+from api.core.executors import ComputeExecutors
+from api.core.metrics import Metrics, process_memory
+from api.core.warmup import Warmup
+from f1.data.race_catalog import RaceCatalog, schedule_signature
+from f1.data.race_index import RaceIndex
 from f1.models.registry import ModelRegistry
+from f1.profiling import stage
+from f1.schemas import PredictionResponse, RaceExplanation
+from f1.storage.feature_store import ensure_arrow, read_mapped
+from f1.storage.predictions import PredictionKey, PredictionStore, features_version, payload_etag
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +38,72 @@ def get_config() -> Settings:
 
 
 class ModelCache:
-    """Singleton cache for loaded models."""
+    """Process-wide LRU cache for loaded models.
 
-    _instance = None
-    _models: dict[str, Any] = {}
+    Entries are keyed by (model, task, model_dir, artifact fingerprint, tree
+    backend), so a retrained artifact becomes a new entry instead of a stale
+    hit. Fingerprints
+    are re-read from disk at most every ``revalidate_seconds``; within that
+    window a warm request never touches the filesystem. The cache is bounded by
+    the on-disk size of the cached artifacts, a cheap proxy for resident size.
+    """
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __init__(
+        self,
+        max_bytes: int = 512 * 1024 * 1024,
+        revalidate_seconds: float = 5.0,
+        tree_backend: str = "compiled",
+    ):
+        """Initialize model cache.
+
+        Args:
+            max_bytes: Maximum total artifact bytes to keep loaded
+            revalidate_seconds: Minimum interval between artifact mtime checks
+            tree_backend: Inference backend for tree models
+                (see ModelRegistry.TREE_BACKENDS)
+
+        Raises:
+            ValueError: If tree_backend is unknown
+        """
+        if tree_backend not in ModelRegistry.TREE_BACKENDS:
+            raise ValueError(
+                f"Invalid tree backend: {tree_backend}. "
+                f"Valid backends: {ModelRegistry.TREE_BACKENDS}"
+            )
+        self.revalidate_seconds = revalidate_seconds
+        self.tree_backend = tree_backend
+        self._models: LRUCache[tuple[str, ...]] = LRUCache(max_bytes)
+        self._fingerprints: dict[tuple[str, str, str], tuple[str, int, float]] = {}
+        self._current_keys: dict[tuple[str, str, str], tuple[str, str, str, str, str]] = {}
+        self._load_locks: dict[tuple[str, str, str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def fingerprint(self, model_name: str, model_dir: Path, task: str = "win") -> tuple[str, int]:
+        """Return the (possibly memoized) artifact fingerprint and size.
+
+        Args:
+            model_name: Name of model
+            model_dir: Model directory
+            task: Task type
+
+        Returns:
+            Tuple of (fingerprint, artifact size in bytes)
+        """
+        fp_key = (model_name, str(model_dir), task)
+        now = time.monotonic()
+
+        cached = self._fingerprints.get(fp_key)
+        if cached is not None and now - cached[2] < self.revalidate_seconds:
+            return cached[0], cached[1]
+
+        fingerprint, size = ModelRegistry.artifact_fingerprint(model_name, model_dir, task)
+        self._fingerprints[fp_key] = (fingerprint, size, now)
+        return fingerprint, size
+
+    def _load_lock(self, cache_key: tuple[str, str, str, str, str]) -> threading.Lock:
+        """Per-entry lock so concurrent misses unpickle a model only once."""
+        with self._lock:
+            return self._load_locks.setdefault(cache_key, threading.Lock())
 
     def get_model(self, model_name: str, model_dir: Path, task: str = "win"):
         """Load and cache model.
@@ -44,26 +116,199 @@ class ModelCache:
         Returns:
             Loaded model info
         """
-        cache_key = f"{model_name}_{task}"
+        model_dir = Path(model_dir)
+        fingerprint, size = self.fingerprint(model_name, model_dir, task)
+        return self._get_or_load(model_name, model_dir, task, fingerprint, size)
 
-        if cache_key not in self._models:
-            logger.info(f"Loading model: {cache_key}")
-            self._models[cache_key] = ModelRegistry.load_model(model_name, model_dir, task=task)
+    def _get_or_load(
+        self, model_name: str, model_dir: Path, task: str, fingerprint: str, size: int
+    ):
+        """Get one artifact version, loading it and retiring the previous one on a miss."""
+        cache_key = (model_name, task, str(model_dir), fingerprint, self.tree_backend)
 
-        return self._models[cache_key]
+        model_info = self._models.get(cache_key)
+        if model_info is not None:
+            return model_info
+
+        with self._load_lock(cache_key):
+            model_info = self._models.peek(cache_key)
+            if model_info is None:
+                logger.info(f"Loading model: {model_name}_{task} ({fingerprint})")
+                model_info = ModelRegistry.load_model(
+                    model_name, model_dir, task=task, tree_backend=self.tree_backend
+                )
+                self._models.put(cache_key, model_info, weight=size)
+
+                # Drop the entry for a superseded artifact version right away
+                fp_key = (model_name, str(model_dir), task)
+                with self._lock:
+                    previous = self._current_keys.get(fp_key)
+                    self._current_keys[fp_key] = cache_key
+                    if previous is not None and previous != cache_key:
+                        self._load_locks.pop(previous, None)
+                if previous is not None and previous != cache_key:
+                    self._models.pop(previous)
+
+        return model_info
+
+    def refresh(self) -> list[tuple[str, str, str]]:
+        """Reload every loaded model whose artifact changed on disk.
+
+        The new version is loaded before its fingerprint is published, so
+        requests keep getting the old model until the new one is ready;
+        requests already holding the old model are unaffected.
+
+        Returns:
+            List of (model_name, old_fingerprint, new_fingerprint) swapped in
+        """
+        with self._lock:
+            current = list(self._current_keys.items())
+
+        swapped = []
+        for (model_name, model_dir, task), cache_key in current:
+            try:
+                fingerprint, size = ModelRegistry.artifact_fingerprint(
+                    model_name, Path(model_dir), task
+                )
+            except FileNotFoundError:
+                # Artifact removed mid-retrain: keep serving the loaded one
+                continue
+
+            old_fingerprint = cache_key[3]
+            if fingerprint == old_fingerprint:
+                continue
+
+            self._get_or_load(model_name, Path(model_dir), task, fingerprint, size)
+            self._fingerprints[(model_name, model_dir, task)] = (
+                fingerprint,
+                size,
+                time.monotonic(),
+            )
+            logger.info(f"Swapped model {model_name}_{task}: {old_fingerprint} -> {fingerprint}")
+            swapped.append((model_name, old_fingerprint, fingerprint))
+
+        return swapped
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters (entries, bytes, hits, misses, evictions)."""
+        return self._models.stats()
+
+    def clear(self) -> None:
+        """Drop all cached models and fingerprints."""
+        self._models.clear()
+        with self._lock:
+            self._fingerprints.clear()
+            self._current_keys.clear()
+            self._load_locks.clear()
 
 
 class DataCache:
-    """Singleton cache for feature data."""
+    """Singleton cache for feature data and its race index.
+
+    The loaded index is held as one immutable snapshot of
+    (path, file signature, RaceIndex). ``refresh`` builds a new index in the
+    background and swaps the snapshot in a single assignment, so requests
+    that already hold the old index keep using it.
+
+    With ``mmap_dir`` set, features are memory-mapped from an Arrow copy
+    (see f1.storage.feature_store), so workers share one physical copy.
+    """
 
     _instance = None
-    _features: Optional[pd.DataFrame] = None
+    _snapshot: Optional[tuple[Path, tuple[int, int], RaceIndex]] = None
+    _lock = threading.Lock()
+    # Directory of memory-mapped Arrow copies shared by all workers
+    # (None = read the parquet into this process)
+    mmap_dir: Optional[Path] = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    @staticmethod
+    def _signature(features_path: Path) -> tuple[int, int]:
+        stat = features_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self, features_path: Path, version: str) -> pd.DataFrame:
+        if self.mmap_dir is not None:
+            try:
+                return read_mapped(ensure_arrow(features_path, self.mmap_dir, version))
+            except (OSError, ArrowException) as e:
+                logger.warning(f"Memory-mapped features unavailable, reading parquet: {e}")
+        return pd.read_parquet(features_path)
+
+    def _load(self, features_path: Path) -> RaceIndex:
+        signature = self._signature(features_path)
+        version = features_version(features_path)
+        logger.info(f"Loading features from {features_path}")
+        before = process_memory()
+        features = self._read(features_path, version)
+        index = RaceIndex(features, version=version)
+        self._snapshot = (features_path, signature, index)
+        after = process_memory()
+        logger.info(
+            f"Loaded {len(features)} samples; private memory "
+            f"{before.get('anonymous', 0) / 2**20:.0f} -> {after.get('anonymous', 0) / 2**20:.0f} "
+            f"MiB, shared {after.get('file', 0) / 2**20:.0f} MiB"
+        )
+        return index
+
+    def get_index(self, features_path: Path) -> RaceIndex:
+        """Load features and build the race index on first use.
+
+        Args:
+            features_path: Path to features parquet
+
+        Returns:
+            RaceIndex over the features
+        """
+        features_path = Path(features_path)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == features_path:
+            return snapshot[2]
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot[0] == features_path:
+                return snapshot[2]
+            return self._load(features_path)
+
+    def refresh(self, features_path: Path) -> Optional[tuple[Optional[str], Optional[str]]]:
+        """Reload the features if the file changed since it was loaded.
+
+        The (mtime, size) signature is checked first; the content hash is
+        only computed when it changed, and the index is only rebuilt when
+        the content did.
+
+        Args:
+            features_path: Path to features parquet
+
+        Returns:
+            Tuple of (old version, new version) if a new index was swapped
+            in, else None
+        """
+        features_path = Path(features_path)
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot[0] != features_path:
+                return None
+
+            _, signature, index = snapshot
+            new_signature = self._signature(features_path)
+            if new_signature == signature:
+                return None
+
+            if features_version(features_path) == index.version:
+                # Touched but unchanged: remember the new signature only
+                self._snapshot = (features_path, new_signature, index)
+                return None
+
+            new_index = self._load(features_path)
+            logger.info(f"Swapped features {index.version} -> {new_index.version}")
+            return index.version, new_index.version
+
     def get_features(self, features_path: Path) -> pd.DataFrame:
         """Load and cache features.
 
@@ -71,23 +316,354 @@ class DataCache:
             features_path: Path to features parquet
 
         Returns:
-            Features DataFrame
+            Features DataFrame (rows grouped by race)
+        """
+        return self.get_index(features_path).features
+
+    def get_race(self, features_path: Path, race_id: str) -> pd.DataFrame:
+        """Get the feature rows for one race without scanning the table.
+
+        Args:
+            features_path: Path to features parquet
+            race_id: Race identifier
+
+        Returns:
+            DataFrame with the race's rows (empty if unknown)
+        """
+        return self.get_index(features_path).race(race_id)
+
+
+class PredictionCache:
+    """Serialized race predictions in memory, backed by a PredictionStore.
+
+    Lookups go memory -> disk -> compute. A computed prediction is written to
+    both layers, so later requests (and other workers, via disk) reuse it.
+    Keys pin the features and model versions, so nothing needs clearing when
+    either changes.
+
+    The raw per-driver model outputs behind a prediction (registry.score_frame)
+    can be kept by the same key in a separate in-memory LRU, so
+    counterfactuals can re-score one driver and renormalize instead of
+    re-running the race.
+    """
+
+    def __init__(
+        self,
+        store: Optional[PredictionStore] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_score_bytes: int = 16 * 1024 * 1024,
+    ):
+        """Initialize prediction cache.
+
+        Args:
+            store: Optional on-disk store (None = memory only)
+            max_bytes: Maximum serialized bytes kept in memory
+            max_score_bytes: Maximum bytes of raw model outputs kept in memory
+        """
+        self.store = store
+        self._memory: LRUCache[PredictionKey] = LRUCache(max_bytes)
+        self._scores: LRUCache[PredictionKey] = LRUCache(max_score_bytes)
+
+    def get(self, key: PredictionKey) -> Optional[tuple[bytes, str]]:
+        """Get a serialized prediction from memory or disk.
+
+        Args:
+            key: Prediction key
+
+        Returns:
+            Tuple of (JSON payload, strong ETag), or None if not stored
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+
+        payload = self.store.get(key) if self.store is not None else None
+        if payload is None:
+            return None
+
+        entry = (payload, payload_etag(payload))
+        self._memory.put(key, entry, weight=len(payload))
+        return entry
+
+    def put(self, key: PredictionKey, response: PredictionResponse) -> tuple[bytes, str]:
+        """Serialize and store a prediction in memory and on disk.
+
+        Args:
+            key: Prediction key
+            response: Prediction to store
+
+        Returns:
+            Tuple of (JSON payload, strong ETag)
+        """
+        payload = response.model_dump_json().encode()
+        if self.store is not None:
+            try:
+                self.store.put(key, payload)
+            except OSError as e:
+                logger.warning(f"Failed to persist prediction {key}: {e}")
+
+        entry = (payload, payload_etag(payload))
+        self._memory.put(key, entry, weight=len(payload))
+        return entry
+
+    def get_or_compute(
+        self, key: PredictionKey, compute: Callable[[], PredictionResponse]
+    ) -> tuple[bytes, str]:
+        """Get a serialized prediction, computing and storing it on a miss.
+
+        Args:
+            key: Prediction key
+            compute: Callable producing the prediction on a miss
+
+        Returns:
+            Tuple of (JSON payload, strong ETag)
+        """
+        with stage("store_lookup"):
+            entry = self.get(key)
+        if entry is None:
+            prediction = compute()
+            with stage("store_write"):
+                entry = self.put(key, prediction)
+        return entry
+
+    def get_or_compute_scores(
+        self, key: PredictionKey, compute: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Get a race's raw model outputs, computing and keeping them on a miss.
+
+        Args:
+            key: Prediction key of the race
+            compute: Callable producing the raw outputs on a miss
+
+        Returns:
+            DataFrame of raw outputs; callers must copy before modifying it
+        """
+        scores = self._scores.get(key)
+        if scores is None:
+            scores = compute()
+            self._scores.put(key, scores, weight=int(scores.memory_usage(deep=True).sum()))
+        return scores
+
+    def discard(
+        self,
+        features_version: Optional[str] = None,
+        model_name: Optional[str] = None,
+        model_version: Optional[str] = None,
+    ) -> int:
+        """Drop in-memory entries pinned to a superseded data or model version.
+
+        Only entries matching the given version are removed, from both the
+        predictions and the raw outputs; the disk store keeps them under
+        their own version directory.
+
+        Args:
+            features_version: Drop entries for this features version
+            model_name: Model whose version is superseded
+            model_version: Drop entries for this version of model_name
+
+        Returns:
+            Number of entries dropped
+        """
+
+        def superseded(key: PredictionKey) -> bool:
+            if features_version is not None and key.features_version == features_version:
+                return True
+            return (
+                model_version is not None
+                and key.model_name == model_name
+                and key.model_version == model_version
+            )
+
+        return self._memory.pop_where(superseded) + self._scores.pop_where(superseded)
+
+    def stats(self) -> dict[str, int]:
+        """Return in-memory cache counters."""
+        return self._memory.stats()
+
+
+class ExplanationCache:
+    """Whole-race explanations keyed by PredictionKey.
+
+    One entry holds every driver's ranked feature impacts for a race, so
+    any driver/top_k request for that race, model and version is a lookup.
+    """
+
+    def __init__(self, max_races: int = 256):
+        """Initialize explanation cache.
+
+        Args:
+            max_races: Maximum number of race explanations kept
         """
-        if self._features is None:
-            logger.info(f"Loading features from {features_path}")
-            self._features = pd.read_parquet(features_path)
-            logger.info(f"Loaded {len(self._features)} samples")
+        self._races: LRUCache[PredictionKey] = LRUCache(max_races)
+
+    def get(self, key: PredictionKey) -> Optional[RaceExplanation]:
+        """Get a cached race explanation, or None."""
+        return self._races.get(key)
+
+    def put(self, key: PredictionKey, explanation: RaceExplanation) -> None:
+        """Store a race explanation."""
+        self._races.put(key, explanation)
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters."""
+        return self._races.stats()
+
 
-        return self._features
+class RaceCatalogCache:
+    """Race catalog for the current data version, with serialized listings.
+
+    The catalog is rebuilt only when the loaded features version or the
+    schedule files change. Listings are serialized once per (catalog
+    version, query) and served from memory with their ETag.
+    """
+
+    def __init__(self, max_responses: int = 256):
+        """Initialize race catalog cache.
+
+        Args:
+            max_responses: Maximum number of serialized listings kept
+        """
+        self._entry: Optional[tuple[tuple, RaceCatalog]] = None
+        self._responses: LRUCache[tuple] = LRUCache(max_responses)
+        self._lock = threading.Lock()
+
+    def get_catalog(
+        self, data_cache: DataCache, features_path: Path, schedule_dir: Path
+    ) -> RaceCatalog:
+        """Get the catalog, rebuilding it if its sources changed.
+
+        Args:
+            data_cache: Data cache holding the race index
+            features_path: Path to features parquet (may not exist)
+            schedule_dir: Directory containing season schedule files
+
+        Returns:
+            RaceCatalog
+        """
+        features_path = Path(features_path)
+        index = data_cache.get_index(features_path) if features_path.exists() else None
+        sources = (index.version if index is not None else None, schedule_signature(schedule_dir))
+
+        entry = self._entry
+        if entry is not None and entry[0] == sources:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry[0] == sources:
+                return entry[1]
+            catalog = RaceCatalog.build(index, schedule_dir)
+            self._entry = (sources, catalog)
+            self._responses.clear()
+            return catalog
+
+    def get_response(
+        self, catalog: RaceCatalog, query: tuple, build: Callable[[RaceCatalog], Any]
+    ) -> tuple[bytes, str]:
+        """Get a serialized listing, building it on first request.
+
+        Args:
+            catalog: Catalog the listing is built from
+            query: Hashable description of the listing (endpoint and params)
+            build: Builds the JSON-serializable listing from the catalog
+
+        Returns:
+            Tuple of (JSON payload, strong ETag)
+        """
+        key = (catalog.version, *query)
+        entry = self._responses.get(key)
+        if entry is None:
+            payload = json.dumps(build(catalog)).encode()
+            entry = (payload, payload_etag(payload))
+            self._responses.put(key, entry)
+        return entry
 
 
 @lru_cache
 def get_model_cache() -> ModelCache:
     """Get singleton model cache."""
-    return ModelCache()
+    settings = get_settings()
+    return ModelCache(
+        max_bytes=settings.model_cache_max_bytes,
+        revalidate_seconds=settings.model_cache_revalidate_seconds,
+        tree_backend=settings.model_tree_backend,
+    )
 
 
 @lru_cache
 def get_data_cache() -> DataCache:
     """Get singleton data cache."""
-    return DataCache()
+    settings = get_settings()
+    data_cache = DataCache()
+    data_cache.mmap_dir = Path(settings.features_mmap_dir) if settings.features_mmap_dir else None
+    return data_cache
+
+
+@lru_cache
+def get_prediction_cache() -> PredictionCache:
+    """Get singleton prediction cache."""
+    settings = get_settings()
+    store = (
+        PredictionStore(Path(settings.prediction_store_dir))
+        if settings.prediction_store_enabled
+        else None
+    )
+    return PredictionCache(store=store, max_bytes=settings.prediction_cache_max_bytes)
+
+
+@lru_cache
+def get_explanation_cache() -> ExplanationCache:
+    """Get singleton explanation cache."""
+    return ExplanationCache(max_races=get_settings().explanation_cache_size)
+
+
+@lru_cache
+def get_race_catalog_cache() -> RaceCatalogCache:
+    """Get singleton race catalog cache."""
+    return RaceCatalogCache()
+
+
+@lru_cache
+def get_executors() -> ComputeExecutors:
+    """Get singleton compute executors."""
+    settings = get_settings()
+    return ComputeExecutors(
+        threads=settings.compute_threads,
+        processes=settings.compute_processes,
+        thread_queue_size=settings.compute_thread_queue_size,
+        process_queue_size=settings.compute_process_queue_size,
+    )
+
+
+@lru_cache
+def get_coalescer() -> SingleFlight:
+    """Get singleton request coalescer."""
+    return SingleFlight()
+
+
+@lru_cache
+def get_metrics() -> Metrics:
+    """Get singleton latency metrics."""
+    return Metrics(enabled=get_settings().enable_metrics)
+
+
+@lru_cache
+def get_warmup() -> Warmup:
+    """Get singleton warm-up state."""
+    return Warmup()
+
+
+def call_with_model_cache(fn: Callable[..., Any], /, **kwargs) -> Any:
+    """Call ``fn`` with this process's model cache as its model_provider.
+
+    Entry point for work sent to the process pool: model objects are not
+    shipped between processes, so each worker loads and keeps its own.
+
+    Args:
+        fn: Module-level function accepting a ``model_provider`` keyword
+        **kwargs: Other keyword arguments for ``fn``
+
+    Returns:
+        The function's result
+    """
+    return fn(model_provider=get_model_cache().get_model, **kwargs)
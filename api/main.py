@@ -1,21 +1,112 @@
 """FastAPI application entry point."""
 
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.core.config import get_settings
 from api.core.logging import LoggingMiddleware, setup_logging
-from api.routers import f1, health, meta
+from api.core.reload import ArtifactWatcher
+from api.core.warmup import warmup_models
+from api.deps import (
+    call_with_model_cache,
+    get_coalescer,
+    get_data_cache,
+    get_executors,
+    get_explanation_cache,
+    get_metrics,
+    get_model_cache,
+    get_prediction_cache,
+    get_warmup,
+)
+from api.routers import f1, health, meta, metrics
+from api.routers.metrics import render_metrics
 
 # Initialize settings and logging
 settings = get_settings()
 setup_logging(settings.log_level)
 
+
+def _metrics_snapshot() -> str:
+    """Render this process's metrics as served at /metrics."""
+    return render_metrics(
+        get_metrics(),
+        get_model_cache(),
+        get_prediction_cache(),
+        get_explanation_cache(),
+        get_coalescer(),
+        get_executors(),
+    )
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Application startup and shutdown."""
+    features_path = Path(settings.data_dir) / "features" / "features.parquet"
+    warmup = get_warmup()
+    tasks = []
+    if settings.warmup_enabled:
+        # Runs in the background: /health answers while /health/ready is 503
+        tasks.append(
+            asyncio.create_task(
+                warmup.run(
+                    features_path=features_path,
+                    model_dir=Path(settings.model_dir),
+                    model_names=warmup_models(settings.warmup_models),
+                    data_cache=get_data_cache(),
+                    model_cache=get_model_cache(),
+                    executors=get_executors(),
+                    worker_call=call_with_model_cache if settings.warmup_explainers else None,
+                    persist_explainers=settings.explainer_persist,
+                )
+            )
+        )
+    else:
+        warmup.skip()
+
+    if settings.reload_interval_seconds > 0:
+        watcher = ArtifactWatcher(
+            features_path=features_path,
+            data_cache=get_data_cache(),
+            model_cache=get_model_cache(),
+            prediction_cache=get_prediction_cache(),
+            interval_seconds=settings.reload_interval_seconds,
+        )
+        tasks.append(asyncio.create_task(watcher.run(get_executors())))
+
+    if settings.enable_metrics and settings.metrics_textfile_interval_seconds > 0:
+        # Keep a live snapshot for a node_exporter textfile collector
+        tasks.append(
+            asyncio.create_task(
+                get_metrics().export_textfile(
+                    Path(settings.metrics_dir),
+                    _metrics_snapshot,
+                    settings.metrics_textfile_interval_seconds,
+                )
+            )
+        )
+
+    yield
+
+    for task in tasks:
+        task.cancel()
+    # Let in-flight compute finish, then stop worker threads and processes
+    get_executors().shutdown()
+
+    if settings.enable_metrics:
+        # Final snapshot for a node_exporter textfile collector
+        get_metrics().write_textfile(Path(settings.metrics_dir), _metrics_snapshot())
+
+
 # Create FastAPI app
 app = FastAPI(
     title="F1 Race Insights API",
     description="API for F1 race data analysis and predictions",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -28,12 +119,13 @@ app.add_middleware(
 )
 
 # Add structured logging middleware
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(LoggingMiddleware, metrics=get_metrics())
 
 # Include routers
 app.include_router(health.router)
 app.include_router(f1.router)
 app.include_router(meta.router)
+app.include_router(metrics.router)
 
 
 @app.get("/")
@@ -1,63 +1,168 @@
 """F1 prediction API endpoints."""
 
+import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
+from typing import TypeVar
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
+from api.core.coalesce import SingleFlight, coalesce_key
 from api.core.config import Settings
-from api.deps import DataCache, get_config, get_data_cache
-from f1.analysis.counterfactuals import compute_counterfactual
-from f1.models.registry import predict_race
-from f1.schemas import CounterfactualRequest, CounterfactualResponse, PredictionResponse
+from api.core.executors import ComputeExecutors
+from api.core.http import conditional_json_response
+from api.core.metrics import Metrics
+from api.deps import (
+    DataCache,
+    ExplanationCache,
+    ModelCache,
+    PredictionCache,
+    RaceCatalogCache,
+    call_with_model_cache,
+    get_coalescer,
+    get_config,
+    get_data_cache,
+    get_executors,
+    get_explanation_cache,
+    get_metrics,
+    get_model_cache,
+    get_prediction_cache,
+    get_race_catalog_cache,
+)
+from f1.analysis.counterfactuals import compute_counterfactual, compute_counterfactual_sweep
+from f1.analysis.scenarios import apply_rules, score_scenario
+from f1.data.race_catalog import RaceCatalog
+from f1.models.registry import predict_race, predict_races, score_race
+from f1.schemas import (
+    BatchPredictionError,
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    ColumnarPredictionResponse,
+    CounterfactualRequest,
+    CounterfactualResponse,
+    CounterfactualSweepRequest,
+    CounterfactualSweepResponse,
+    PredictionResponse,
+    RaceExplanation,
+    SeasonScenarioRequest,
+    SeasonScenarioResponse,
+)
+from f1.storage.predictions import PredictionKey
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 router = APIRouter(prefix="/api/f1", tags=["f1"])
 
+# Response shapes for bulk endpoints: per-driver mappings or parallel arrays
+RESPONSE_FORMATS = "^(mapping|columnar)$"
+
+
+def _to_columnar(payload: bytes) -> bytes:
+    """Re-serialize a stored PredictionResponse payload in columnar shape."""
+    prediction = PredictionResponse.model_validate_json(payload)
+    return ColumnarPredictionResponse.from_prediction(prediction).model_dump_json().encode()
+
+
+async def _run_per_model(
+    metrics: Metrics,
+    executors: ComputeExecutors,
+    operation: str,
+    models: list[str],
+    fn: Callable[..., T],
+    *args,
+    **kwargs,
+) -> tuple[dict[str, T], list[BatchPredictionError]]:
+    """Run ``fn(model, *args, **kwargs)`` for every model concurrently.
+
+    Each call runs on the compute thread pool. A model that fails with
+    ValueError, FileNotFoundError or another Exception is reported as a
+    per-model error; HTTPException and non-Exception BaseExceptions (such
+    as cancellation) are re-raised.
+
+    Args:
+        metrics: Metrics recording each call's stage timings
+        executors: Compute pools to run on
+        operation: Operation label for metrics and logs (e.g. 'predict_batch')
+        models: Model names, without duplicates
+        fn: Function taking the model name first
+        *args: Further positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Results by model (in request order) and per-model errors
+    """
+    results = await asyncio.gather(
+        *(
+            metrics.run(operation, executors.run_thread, fn, model, *args, **kwargs)
+            for model in models
+        ),
+        return_exceptions=True,
+    )
+
+    outputs: dict[str, T] = {}
+    errors: list[BatchPredictionError] = []
+    for model, result in zip(models, results):
+        if isinstance(result, HTTPException):
+            raise result
+        if isinstance(result, (ValueError, FileNotFoundError)):
+            logger.warning(f"{operation} skipped model {model}: {result}")
+            errors.append(BatchPredictionError(model_name=model, detail=str(result)))
+        elif isinstance(result, Exception):
+            logger.error(f"{operation} failed for model {model}: {result}")
+            errors.append(BatchPredictionError(model_name=model, detail=str(result)))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            outputs[model] = result
+    return outputs, errors
+
 
 @router.get("/races")
 async def get_available_races(
-    data_cache: DataCache = Depends(get_data_cache), config: Settings = Depends(get_config)
+    request: Request,
+    data_cache: DataCache = Depends(get_data_cache),
+    catalog_cache: RaceCatalogCache = Depends(get_race_catalog_cache),
+    config: Settings = Depends(get_config),
 ):
-    """Get list of available races with metadata.
+    """Get list of races that have features (i.e. can be predicted).
+
+    Served from the precomputed race catalog; the listing is serialized once
+    per data version and supports conditional requests (If-None-Match).
 
     Returns:
-        List of race information dicts with race_id, season, round, etc.
+        Dict with races (race_id, name, season, round, date) and count
 
     Example:
         GET /api/f1/races
     """
     try:
-        # Load features
         features_path = Path(config.data_dir) / "features" / "features.parquet"
-        features = data_cache.get_features(features_path)
-
-        # Get unique races with metadata
-        races = (
-            features.groupby("race_id")
-            .agg({"season": "first", "round": "first", "race_date": "first"})
-            .reset_index()
-        )
+        catalog = catalog_cache.get_catalog(data_cache, features_path, features_path.parent)
 
-        # Convert to list of dicts
-        race_list = []
-        for _, row in races.iterrows():
-            race_list.append(
+        def build(catalog: RaceCatalog) -> dict:
+            # date is the feature table's integer race_date, as this endpoint
+            # has always returned; /meta/races serves ISO dates
+            races = [
                 {
-                    "race_id": row["race_id"],
-                    "season": int(row["season"]),
-                    "round": int(row["round"]),
-                    "date": int(row["race_date"]) if "race_date" in row else None,
+                    "race_id": race["race_id"],
+                    "name": race["name"],
+                    "season": race["season"],
+                    "round": race["round"],
+                    "date": race["race_date"],
                 }
-            )
+                for race in catalog.races(featured_only=True)
+            ]
+            return {"races": races, "count": len(races)}
 
-        # Sort by season and round
-        race_list.sort(key=lambda x: (x["season"], x["round"]))
-
-        logger.info(f"Found {len(race_list)} available races")
-        return {"races": race_list, "count": len(race_list)}
+        payload, etag = catalog_cache.get_response(catalog, ("available",), build)
+        return conditional_json_response(
+            request, payload, etag, max_age=config.race_catalog_max_age
+        )
 
     except Exception as e:
         logger.error(f"Failed to load races: {e}")
@@ -99,13 +204,24 @@ async def get_backtest_report(config: Settings = Depends(get_config)):
 
 @router.get("/predict/race/{race_id}", response_model=PredictionResponse)
 async def predict_race_endpoint(
+    request: Request,
     race_id: str,
     model: str = Query("xgb", description="Model name to use for prediction"),
     data_cache: DataCache = Depends(get_data_cache),
+    model_cache: ModelCache = Depends(get_model_cache),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache),
+    executors: ComputeExecutors = Depends(get_executors),
+    metrics: Metrics = Depends(get_metrics),
+    coalescer: SingleFlight = Depends(get_coalescer),
     config: Settings = Depends(get_config),
 ):
     """Generate race predictions for all drivers.
 
+    Predictions are served from the prediction store, keyed by features and
+    model artifact versions, with a strong ETag. A matching If-None-Match
+    header returns 304 Not Modified. Concurrent requests for the same key
+    share one computation.
+
     Args:
         race_id: Race identifier (e.g., '2024_Monaco' or '2024_01')
         model: Model name (xgb, lgbm, cat, lr, rf, quali_freq, elo, nbt_tlf)
@@ -117,25 +233,48 @@ async def predict_race_endpoint(
         GET /api/f1/predict/race/2024_01?model=xgb
     """
     try:
-        # Load features
+        # Look up the race rows from the index
         features_path = Path(config.data_dir) / "features" / "features.parquet"
-        features = data_cache.get_features(features_path)
+        race_index = data_cache.get_index(features_path)
+        model_dir = Path(config.model_dir)
+
+        # Key pins both data and model versions
+        model_version, _ = model_cache.fingerprint(model, model_dir, "win")
+        key = PredictionKey(race_id, model, "win", race_index.version or "", model_version)
+
+        def compute() -> PredictionResponse:
+            logger.info(f"Generating predictions for {race_id} using {model}")
+            return predict_race(
+                race_id=race_id,
+                model_name=model,
+                race_data=race_index.race(race_id),
+                model_dir=model_dir,
+                model_provider=model_cache.get_model,
+            )
 
-        # Generate predictions
-        logger.info(f"Generating predictions for {race_id} using {model}")
-        response = predict_race(
-            race_id=race_id, model_name=model, race_data=features, model_dir=Path(config.model_dir)
+        payload, etag = await coalescer.run(
+            ("predict_race", key),
+            lambda: metrics.run(
+                "predict_race",
+                executors.run_thread,
+                prediction_cache.get_or_compute,
+                key,
+                compute,
+            ),
+        )
+        return conditional_json_response(
+            request, payload, etag, max_age=config.prediction_cache_max_age
         )
 
-        return response
-
+    except HTTPException:
+        raise
     except ValueError as e:
         # Race not found or invalid  model - return 400 with helpful message
         error_msg = str(e)
         if "not found in data" in error_msg.lower():
             # Provide list of available races
             try:
-                available_races = features["race_id"].unique().tolist()[:10]
+                available_races = race_index.race_ids[:10]
                 detail = f"Race '{race_id}' not found. Available races include: {', '.join(available_races)}"
             except Exception:
                 detail = f"Race '{race_id}' not found in data."
@@ -152,6 +291,188 @@ async def predict_race_endpoint(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post("/predict/batch", response_model=BatchPredictionResponse)
+async def predict_batch_endpoint(
+    request: BatchPredictionRequest,
+    response_format: str = Query(
+        "mapping", alias="format", pattern=RESPONSE_FORMATS, description="Response shape"
+    ),
+    data_cache: DataCache = Depends(get_data_cache),
+    model_cache: ModelCache = Depends(get_model_cache),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache),
+    executors: ComputeExecutors = Depends(get_executors),
+    metrics: Metrics = Depends(get_metrics),
+    config: Settings = Depends(get_config),
+):
+    """Generate predictions for many races and models in one call.
+
+    Work is grouped per model: races already in the prediction store are
+    served from it, and all remaining races are stacked into one feature
+    matrix and scored with a single inference call. Models run concurrently
+    on the compute thread pool.
+
+    Args:
+        request: BatchPredictionRequest with race_ids and models
+        response_format: 'mapping' (driver -> value dicts) or 'columnar'
+            (parallel arrays keyed by driver_ids)
+
+    Returns:
+        BatchPredictionResponse with predictions (model-major, request order)
+        and per-race/per-model errors
+
+    Example:
+        POST /api/f1/predict/batch?format=columnar
+        Body: {"race_ids": ["2024_01", "2024_02"], "models": ["xgb", "lgbm"]}
+    """
+    try:
+        features_path = Path(config.data_dir) / "features" / "features.parquet"
+        race_index = data_cache.get_index(features_path)
+        model_dir = Path(config.model_dir)
+    except FileNotFoundError as e:
+        logger.error(f"Features file not found: {e}")
+        raise HTTPException(status_code=404, detail=f"Model or data not found: {e}") from e
+
+    race_ids = list(dict.fromkeys(request.race_ids))
+    known_races = [race_id for race_id in race_ids if race_index.has_race(race_id)]
+    errors = [
+        BatchPredictionError(race_id=race_id, detail=f"Race '{race_id}' not found")
+        for race_id in race_ids
+        if not race_index.has_race(race_id)
+    ]
+
+    def serve_model(model: str) -> list[bytes]:
+        model_version, _ = model_cache.fingerprint(model, model_dir, "win")
+        keys = {
+            race_id: PredictionKey(race_id, model, "win", race_index.version or "", model_version)
+            for race_id in known_races
+        }
+        entries: dict[str, tuple[bytes, str]] = {}
+        for race_id, key in keys.items():
+            entry = prediction_cache.get(key)
+            if entry is not None:
+                entries[race_id] = entry
+
+        # One stacked inference call for every race not yet stored
+        missing = [race_id for race_id in known_races if race_id not in entries]
+        if missing:
+            logger.info(f"Batch predicting {len(missing)} races using {model}")
+            responses = predict_races(
+                race_ids=missing,
+                model_name=model,
+                race_data=race_index.races(missing),
+                model_dir=model_dir,
+                model_provider=model_cache.get_model,
+            )
+            for race_id in missing:
+                entries[race_id] = prediction_cache.put(keys[race_id], responses[race_id])
+
+        payloads = [entries[race_id][0] for race_id in known_races]
+        if response_format == "columnar":
+            payloads = [_to_columnar(payload) for payload in payloads]
+        return payloads
+
+    models = list(dict.fromkeys(request.models))
+    outputs, model_errors = await _run_per_model(
+        metrics, executors, "predict_batch", models, serve_model
+    )
+    errors.extend(model_errors)
+    payloads = [payload for model_payloads in outputs.values() for payload in model_payloads]
+
+    # Stored predictions are already serialized; splice them in as-is
+    errors_json = json.dumps([error.model_dump() for error in errors])
+    body = b'{"predictions":[' + b",".join(payloads) + b'],"errors":' + errors_json.encode() + b"}"
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/predict/season/{season}")
+async def predict_season_endpoint(
+    season: int,
+    model: str = Query("xgb", description="Model name to use for prediction"),
+    response_format: str = Query(
+        "mapping", alias="format", pattern=RESPONSE_FORMATS, description="Response shape"
+    ),
+    data_cache: DataCache = Depends(get_data_cache),
+    model_cache: ModelCache = Depends(get_model_cache),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache),
+    executors: ComputeExecutors = Depends(get_executors),
+    metrics: Metrics = Depends(get_metrics),
+    coalescer: SingleFlight = Depends(get_coalescer),
+    config: Settings = Depends(get_config),
+):
+    """Stream predictions for every race in a season as NDJSON.
+
+    Each line is one PredictionResponse, in round order, written as soon as
+    that race is served from the prediction store or computed. Only one race
+    is held in memory at a time, so memory stays flat however long the
+    season is. A race that fails mid-stream yields an ``{"race_id", "error"}``
+    line instead of aborting the stream.
+
+    Args:
+        season: Season year
+        model: Model name
+        response_format: 'mapping' or 'columnar' line shape
+
+    Returns:
+        StreamingResponse with media type application/x-ndjson
+
+    Example:
+        GET /api/f1/predict/season/2024?model=xgb&format=columnar
+    """
+    try:
+        features_path = Path(config.data_dir) / "features" / "features.parquet"
+        race_index = data_cache.get_index(features_path)
+        model_dir = Path(config.model_dir)
+        model_version, _ = model_cache.fingerprint(model, model_dir, "win")
+    except ValueError as e:
+        logger.warning(f"Bad request for season prediction: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except FileNotFoundError as e:
+        logger.error(f"Model or data file not found: {e}")
+        raise HTTPException(status_code=404, detail=f"Model or data not found: {e}") from e
+
+    race_ids = race_index.season_races(season)
+    if not race_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Season {season} not found. Available seasons: {race_index.seasons}",
+        )
+
+    async def serve_race(race_id: str) -> bytes:
+        # Same coalescing key as the single-race endpoint
+        key = PredictionKey(race_id, model, "win", race_index.version or "", model_version)
+        payload, _ = await coalescer.run(
+            ("predict_race", key),
+            lambda: metrics.run(
+                "predict_season",
+                executors.run_thread,
+                prediction_cache.get_or_compute,
+                key,
+                lambda: predict_race(
+                    race_id=race_id,
+                    model_name=model,
+                    race_data=race_index.race(race_id),
+                    model_dir=model_dir,
+                    model_provider=model_cache.get_model,
+                ),
+            ),
+        )
+        return payload
+
+    async def stream() -> AsyncIterator[bytes]:
+        for race_id in race_ids:
+            try:
+                payload = await serve_race(race_id)
+                if response_format == "columnar":
+                    payload = _to_columnar(payload)
+            except Exception as e:
+                logger.error(f"Season stream failed for {race_id} using {model}: {e}")
+                payload = json.dumps({"race_id": race_id, "error": str(e)}).encode()
+            yield payload + b"\n"
+
+    logger.info(f"Streaming {len(race_ids)} races of {season} using {model}")
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get("/explain/race/{race_id}")
 async def explain_prediction_endpoint(
     race_id: str,
@@ -159,10 +480,20 @@ async def explain_prediction_endpoint(
     model: str = Query("xgb", description="Model name"),
     top_k: int = Query(10, description="Number of top features to return"),
     data_cache: DataCache = Depends(get_data_cache),
+    model_cache: ModelCache = Depends(get_model_cache),
+    explanation_cache: ExplanationCache = Depends(get_explanation_cache),
+    executors: ComputeExecutors = Depends(get_executors),
+    metrics: Metrics = Depends(get_metrics),
+    coalescer: SingleFlight = Depends(get_coalescer),
     config: Settings = Depends(get_config),
 ):
     """Explain prediction for a specific driver.
 
+    The first request for a race explains every driver in it (one SHAP call
+    over the race) on the compute process pool and caches the result per
+    data and model version; other drivers and top_k values are then served
+    from the cache. Concurrent first requests share one computation.
+
     Args:
         race_id: Race identifier
         driver_id: Driver to explain (e.g., 'VER', 'HAM')
@@ -176,26 +507,46 @@ async def explain_prediction_endpoint(
         GET /api/f1/explain/race/2024_01?driver_id=VER&model=xgb
     """
     try:
-        # Load features
+        # Import explain functions (deferred: pulls in sklearn)
+        from f1.analysis.explain import explain_race, select_explanation
+
+        # Key pins both data and model versions
         features_path = Path(config.data_dir) / "features" / "features.parquet"
-        features = data_cache.get_features(features_path)
-
-        # Import explain function
-        from f1.analysis.explain import explain_prediction
-
-        # Generate explanation
-        logger.info(f"Generating explanation for {driver_id} in {race_id} using {model}")
-        response = explain_prediction(
-            race_id=race_id,
-            driver_id=driver_id,
-            model_name=model,
-            race_data=features,
-            model_dir=config.model_dir,
-            top_k=top_k,
-        )
+        race_index = data_cache.get_index(features_path)
+        model_version, _ = model_cache.fingerprint(model, Path(config.model_dir), "win")
+        key = PredictionKey(race_id, model, "win", race_index.version or "", model_version)
+
+        # Reject unknown races and drivers before explaining the whole race
+        race_df = race_index.race(race_id)
+        if race_df.empty:
+            raise ValueError(f"Race {race_id} not found")
+        if not (race_df["driver_id"] == driver_id).any():
+            raise ValueError(f"Driver {driver_id} not found in race {race_id}")
+
+        async def compute() -> RaceExplanation:
+            logger.info(f"Explaining all drivers in {race_id} using {model}")
+            explanation = await metrics.run(
+                "explain",
+                executors.run_process,
+                call_with_model_cache,
+                explain_race,
+                race_id=race_id,
+                model_name=model,
+                race_data=race_df,
+                model_dir=config.model_dir,
+                persist_explainer=config.explainer_persist,
+            )
+            explanation_cache.put(key, explanation)
+            return explanation
 
-        return response
+        explanation = explanation_cache.get(key)
+        if explanation is None:
+            explanation = await coalescer.run(("explain_race", key), compute)
 
+        return select_explanation(explanation, race_id, driver_id, model, top_k)
+
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
     except FileNotFoundError as e:
@@ -210,10 +561,20 @@ async def counterfactual_endpoint(
     request: CounterfactualRequest,
     model: str = Query("xgb", description="Model name"),
     data_cache: DataCache = Depends(get_data_cache),
+    model_cache: ModelCache = Depends(get_model_cache),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache),
+    executors: ComputeExecutors = Depends(get_executors),
+    metrics: Metrics = Depends(get_metrics),
+    coalescer: SingleFlight = Depends(get_coalescer),
     config: Settings = Depends(get_config),
 ):
     """Compute counterfactual prediction with modified features.
 
+    Concurrent requests with the same race, driver, model and changes (in
+    any key order) share one computation. The race's raw model outputs are
+    cached with its predictions, so a counterfactual re-scores only the
+    modified driver and renormalizes the race.
+
     Args:
         request: CounterfactualRequest with race_id, driver_id, and changes
         model: Model name
@@ -230,18 +591,58 @@ async def counterfactual_endpoint(
         }
     """
     try:
-        # Load features
+        # Look up the race rows from the index
         features_path = Path(config.data_dir) / "features" / "features.parquet"
-        features = data_cache.get_features(features_path)
+        race_index = data_cache.get_index(features_path)
+        race_df = race_index.race(request.race_id)
+        model_dir = Path(config.model_dir)
+
+        # Baseline outputs are keyed like the race's predictions
+        model_version, _ = model_cache.fingerprint(model, model_dir, "win")
+        prediction_key = PredictionKey(
+            request.race_id, model, "win", race_index.version or "", model_version
+        )
+
+        def compute() -> CounterfactualResponse:
+            baseline_scores = prediction_cache.get_or_compute_scores(
+                prediction_key,
+                lambda: score_race(
+                    race_id=request.race_id,
+                    model_name=model,
+                    race_data=race_df,
+                    model_dir=model_dir,
+                    model_provider=model_cache.get_model,
+                ),
+            )
+            return compute_counterfactual(
+                request=request,
+                race_data=race_df,
+                model_name=model,
+                model_dir=config.model_dir,
+                model_provider=model_cache.get_model,
+                baseline_scores=baseline_scores,
+            )
 
         # Compute counterfactual
         logger.info(f"Computing counterfactual for {request.driver_id} in {request.race_id}")
-        response = compute_counterfactual(
-            request=request, race_data=features, model_name=model, model_dir=config.model_dir
+        # Versions keep requests straddling a hot reload from sharing a result
+        key = coalesce_key(
+            "counterfactual",
+            race_id=request.race_id,
+            driver_id=request.driver_id,
+            model=model,
+            changes=request.changes,
+            features_version=prediction_key.features_version,
+            model_version=prediction_key.model_version,
+        )
+        response = await coalescer.run(
+            key, lambda: metrics.run("counterfactual", executors.run_thread, compute)
         )
 
         return response
 
+    except HTTPException:
+        raise
     except ValueError as e:
         # Invalid request - return 400 with helpful message
         error_msg = str(e)
@@ -253,3 +654,150 @@ async def counterfactual_endpoint(
     except Exception as e:
         logger.error(f"Counterfactual failed: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/counterfactual/sweep", response_model=CounterfactualSweepResponse)
+async def counterfactual_sweep_endpoint(
+    request: CounterfactualSweepRequest,
+    model: str = Query("xgb", description="Model name"),
+    data_cache: DataCache = Depends(get_data_cache),
+    model_cache: ModelCache = Depends(get_model_cache),
+    executors: ComputeExecutors = Depends(get_executors),
+    metrics: Metrics = Depends(get_metrics),
+    coalescer: SingleFlight = Depends(get_coalescer),
+    config: Settings = Depends(get_config),
+):
+    """Compute a driver's prediction over a grid of changes in one model call.
+
+    Every combination of the grid values is applied to its own copy of the
+    race; all copies are scored together and normalized per scenario.
+
+    Args:
+        request: CounterfactualSweepRequest with race_id, driver_id, and grid
+        model: Model name
+
+    Returns:
+        CounterfactualSweepResponse with the baseline and one point per scenario
+
+    Example:
+        POST /api/f1/counterfactual/sweep?model=xgb
+        Body: {
+            "race_id": "2024_01",
+            "driver_id": "HAM",
+            "grid": {"qualifying_position_delta": [-3, -2, -1, 0, 1, 2, 3]}
+        }
+    """
+    try:
+        features_path = Path(config.data_dir) / "features" / "features.parquet"
+        race_index = data_cache.get_index(features_path)
+        race_df = race_index.race(request.race_id)
+        model_version, _ = model_cache.fingerprint(model, Path(config.model_dir), "win")
+
+        # Versions keep requests straddling a hot reload from sharing a result
+        key = coalesce_key(
+            "counterfactual_sweep",
+            race_id=request.race_id,
+            driver_id=request.driver_id,
+            model=model,
+            grid=request.grid,
+            features_version=race_index.version or "",
+            model_version=model_version,
+        )
+        return await coalescer.run(
+            key,
+            lambda: metrics.run(
+                "counterfactual_sweep",
+                executors.run_thread,
+                compute_counterfactual_sweep,
+                request=request,
+                race_data=race_df,
+                model_name=model,
+                model_dir=config.model_dir,
+                model_provider=model_cache.get_model,
+            ),
+        )
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning(f"Bad request for counterfactual sweep: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except FileNotFoundError as e:
+        logger.error(f"Model or data file not found: {e}")
+        raise HTTPException(status_code=404, detail=f"Model or data not found: {e}") from e
+    except Exception as e:
+        logger.error(f"Counterfactual sweep failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/scenarios/season", response_model=SeasonScenarioResponse)
+async def season_scenario_endpoint(
+    request: SeasonScenarioRequest,
+    data_cache: DataCache = Depends(get_data_cache),
+    model_cache: ModelCache = Depends(get_model_cache),
+    executors: ComputeExecutors = Depends(get_executors),
+    metrics: Metrics = Depends(get_metrics),
+    config: Settings = Depends(get_config),
+):
+    """Evaluate a season-wide what-if scenario for many drivers and races.
+
+    The rules are applied to the season's feature table at once; every
+    affected race is scored as-is and under the scenario in one stacked
+    inference call per model, and results are summed per driver. Models run
+    concurrently on the compute thread pool.
+
+    Args:
+        request: SeasonScenarioRequest with season, rules and models
+
+    Returns:
+        SeasonScenarioResponse with per-model driver impacts and per-model errors
+
+    Example:
+        POST /api/f1/scenarios/season
+        Body: {
+            "season": 2024,
+            "rules": [{"teams": ["Ferrari"], "from_round": 8,
+                       "changes": {"constructor_form_delta": 0.15}}],
+            "models": ["xgb"]
+        }
+    """
+    try:
+        features_path = Path(config.data_dir) / "features" / "features.parquet"
+        race_index = data_cache.get_index(features_path)
+        model_dir = Path(config.model_dir)
+
+        race_ids = race_index.season_races(request.season)
+        if not race_ids:
+            detail = f"Season {request.season} not found. Available seasons: {race_index.seasons}"
+            raise HTTPException(status_code=404, detail=detail)
+
+        # Apply all rules to the season at once; only affected races are scored
+        scenario_df, affected = apply_rules(race_index.races(race_ids), request.rules)
+        scenario_df = scenario_df[scenario_df["race_id"].isin(affected).to_numpy()]
+        baseline_df = race_index.races(affected)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning(f"Bad request for season scenario: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except FileNotFoundError as e:
+        logger.error(f"Features file not found: {e}")
+        raise HTTPException(status_code=404, detail=f"Model or data not found: {e}") from e
+
+    models = list(dict.fromkeys(request.models))
+    impacts, errors = await _run_per_model(
+        metrics,
+        executors,
+        "season_scenario",
+        models,
+        score_scenario,
+        baseline_df,
+        scenario_df,
+        model_dir=model_dir,
+        model_provider=model_cache.get_model,
+    )
+
+    return SeasonScenarioResponse(
+        season=request.season, affected_races=affected, results=impacts, errors=errors
+    )
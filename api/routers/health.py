@@ -1,6 +1,10 @@
 """Health check router."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from api.core.warmup import Warmup
+from api.deps import get_warmup
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -13,3 +17,16 @@ async def health_check():
         Dict with status indicating service health.
     """
     return {"status": "ok"}
+
+
+@router.get("/ready")
+async def readiness_check(warmup: Warmup = Depends(get_warmup)):
+    """Readiness probe.
+
+    Returns 503 until startup warm-up has preloaded features, models and
+    explainers, so traffic is only routed to hot workers.
+
+    Returns:
+        Warm-up report with status, total seconds and per-item timings.
+    """
+    return JSONResponse(status_code=200 if warmup.ready else 503, content=warmup.report())
@@ -1,12 +1,16 @@
 """Meta endpoints for model and race discovery."""
 
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/meta", tags=["metadata"])
 
+# Catalog fields included in /meta/races entries
+RACE_FIELDS = ("race_id", "name", "date", "season", "round", "country", "track")
+
 
 @router.get("/seasons")
 async def get_seasons():
@@ -31,11 +35,11 @@ async def get_seasons():
             logger.warning(f"Features file not found at {features_path}, returning default")
             return {"seasons": [2024], "latest": 2024}
 
-        # Load features
-        features = data_cache.get_features(features_path)
+        # Seasons come straight from the race index
+        race_index = data_cache.get_index(features_path)
 
-        # Get unique seasons and sort descending (latest first)
-        seasons = sorted(features["season"].unique().tolist(), reverse=True)
+        # Sort descending (latest first)
+        seasons = sorted(race_index.seasons, reverse=True)
         latest = seasons[0] if seasons else 2024
 
         logger.info(f"Returning {len(seasons)} seasons, latest: {latest}")
@@ -156,10 +160,20 @@ async def get_models():
 
 
 @router.get("/races")
-async def get_races(season: int = 2024, _next: bool = False, limit: int = 50):
+async def get_races(
+    request: Request,
+    season: Optional[int] = 2024,
+    upcoming: bool = Query(False, alias="next"),
+    limit: int = Query(50, ge=1),
+):
     """Get list of races with metadata.
 
+    Races come from the precomputed race catalog (feature table merged with
+    the season schedule files), so seasons without results yet are listed
+    too. Listings are cached per data version and carry an ETag.
+
     Args:
+        request: Incoming request (for If-None-Match)
         season: Season year (default: 2024)
         next: If true, return upcoming races only (default: false)
         limit: Maximum number of races to return (default: 50)
@@ -169,93 +183,32 @@ async def get_races(season: int = 2024, _next: bool = False, limit: int = 50):
     """
     try:
         # Import dependencies here to avoid circular imports
+        from datetime import date
         from pathlib import Path
 
-        from api.deps import DataCache, get_config, get_data_cache
+        from api.core.http import conditional_json_response
+        from api.deps import get_config, get_data_cache, get_race_catalog_cache
 
-        # Get config and cache
         config = get_config()
-        data_cache: DataCache = get_data_cache()
-
-        # Load features to get actual available races
+        catalog_cache = get_race_catalog_cache()
         features_path = Path(config.data_dir) / "features" / "features.parquet"
+        catalog = catalog_cache.get_catalog(get_data_cache(), features_path, features_path.parent)
 
-        # Check if features file exists
-        if not features_path.exists():
-            logger.warning(f"Features file not found at {features_path}, returning test data")
-            # Fallback to test data
+        # Upcoming listings change with the date, so the date is part of the key
+        today = date.today() if upcoming else None
+
+        def build(catalog) -> dict:
+            races = catalog.races(season=season, upcoming=upcoming, limit=limit, today=today)
             return {
-                "races": [
-                    {"race_id": "2024_01", "name": "Bahrain Grand Prix", "date": "2024-03-02", "season": 2024, "round": 1},
-                ]
+                "races": [{key: race[key] for key in RACE_FIELDS} for race in races]
             }
 
-        # Load features
-        features = data_cache.get_features(features_path)
-
-        # Get unique races with metadata
-        races_df = (
-            features.groupby("race_id")
-            .agg({
-                "season": "first",
-                "round": "first",
-                "race_date": "first"
-            })
-            .reset_index()
+        payload, etag = catalog_cache.get_response(
+            catalog, ("meta", season, upcoming, limit, today), build
+        )
+        return conditional_json_response(
+            request, payload, etag, max_age=config.race_catalog_max_age
         )
-
-        # Race name mapping for known races
-        race_names = {
-            "2024_01": "Bahrain Grand Prix",
-            "2024_02": "Saudi Arabian Grand Prix",
-            "2024_03": "Australian Grand Prix",
-            "2024_04": "Japanese Grand Prix",
-            "2024_05": "Chinese Grand Prix",
-            "2024_06": "Miami Grand Prix",
-            "2024_07": "Emilia Romagna Grand Prix",
-            "2024_08": "Monaco Grand Prix",
-            "2024_09": "Canadian Grand Prix",
-            "2024_10": "Spanish Grand Prix",
-            "2024_11": "Austrian Grand Prix",
-            "2024_12": "British Grand Prix",
-            "2024_13": "Hungarian Grand Prix",
-            "2024_14": "Belgian Grand Prix",
-            "2024_15": "Dutch Grand Prix",
-            "2024_16": "Italian Grand Prix",
-            "2024_17": "Azerbaijan Grand Prix",
-            "2024_18": "Singapore Grand Prix",
-            "2024_19": "United States Grand Prix",
-            "2024_20": "Mexico City Grand Prix",
-            "2024_21": "Brazilian Grand Prix",
-            "2024_22": "Las Vegas Grand Prix",
-            "2024_23": "Qatar Grand Prix",
-            "2024_24": "Abu Dhabi Grand Prix",
-        }
-
-        # Convert to list of dicts with display names
-        race_list = []
-        for _, row in races_df.iterrows():
-            race_id = row["race_id"]
-            race_list.append({
-                "race_id": race_id,
-                "name": race_names.get(race_id, f"Race {race_id}"),
-                "date": str(row.get("race_date", "")),
-                "season": int(row["season"]),
-                "round": int(row["round"])
-            })
-
-        # Filter by season if requested
-        if season:
-            race_list = [r for r in race_list if r["season"] == season]
-
-        # Sort by season and round
-        race_list.sort(key=lambda x: (x["season"], x["round"]))
-
-        # Apply limit
-        race_list = race_list[:limit]
-
-        logger.info(f"Returning {len(race_list)} races for season {season}")
-        return {"races": race_list}
 
     except Exception as e:
         logger.error(f"Failed to load races: {e}")
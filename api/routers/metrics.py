@@ -0,0 +1,134 @@
+"""Prometheus metrics router."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from api.core.coalesce import SingleFlight
+from api.core.executors import ComputeExecutors
+from api.core.metrics import Metrics, hit_ratio, process_memory
+from api.deps import (
+    ExplanationCache,
+    ModelCache,
+    PredictionCache,
+    get_coalescer,
+    get_executors,
+    get_explanation_cache,
+    get_metrics,
+    get_model_cache,
+    get_prediction_cache,
+)
+
+router = APIRouter(tags=["metrics"])
+
+
+def render_metrics(
+    metrics: Metrics,
+    model_cache: ModelCache,
+    prediction_cache: PredictionCache,
+    explanation_cache: ExplanationCache,
+    coalescer: SingleFlight,
+    executors: ComputeExecutors,
+) -> str:
+    """Render histograms with the current cache, executor and memory series.
+
+    Shared by the /metrics endpoint and the textfile snapshots.
+
+    Args:
+        metrics: Latency histograms of this process
+        model_cache: Model cache to report
+        prediction_cache: Prediction cache to report
+        explanation_cache: Explanation cache to report
+        coalescer: Request coalescer to report
+        executors: Compute pools to report
+
+    Returns:
+        Metrics in Prometheus text exposition format
+    """
+    caches = {
+        "model": model_cache.stats(),
+        "prediction": prediction_cache.stats(),
+        "explanation": explanation_cache.stats(),
+    }
+    executor_stats = executors.stats()
+
+    gauges: dict[str, tuple[str, str, dict[str, float]]] = {
+        "f1_cache_hit_ratio": (
+            "Hit ratio of in-process caches",
+            "cache",
+            {cache: hit_ratio(stats) for cache, stats in caches.items()},
+        ),
+        "f1_cache_entries": (
+            "Entries held by in-process caches",
+            "cache",
+            {cache: stats["entries"] for cache, stats in caches.items()},
+        ),
+        "f1_executor_queue_depth": (
+            "Tasks waiting for a compute worker",
+            "pool",
+            {pool: stats["queued"] for pool, stats in executor_stats.items()},
+        ),
+        "f1_executor_in_flight": (
+            "Tasks running or waiting on a compute pool",
+            "pool",
+            {pool: stats["in_flight"] for pool, stats in executor_stats.items()},
+        ),
+        "f1_process_memory_bytes": (
+            "Resident memory of this worker (file = shared memory-mapped pages)",
+            "kind",
+            {kind: float(value) for kind, value in process_memory().items()},
+        ),
+    }
+
+    counters: dict[str, tuple[str, str, dict[str, float]]] = {
+        "f1_cache_hits": (
+            "Lookups served by in-process caches",
+            "cache",
+            {cache: stats["hits"] for cache, stats in caches.items()},
+        ),
+        "f1_cache_misses": (
+            "Lookups missed by in-process caches",
+            "cache",
+            {cache: stats["misses"] for cache, stats in caches.items()},
+        ),
+        "f1_cache_evictions": (
+            "Entries evicted from in-process caches",
+            "cache",
+            {cache: stats["evictions"] for cache, stats in caches.items()},
+        ),
+        "f1_coalescing_requests": (
+            "Coalesced requests: calls, computations executed and calls merged",
+            "kind",
+            {kind: value for kind, value in coalescer.stats().items() if kind != "in_flight"},
+        ),
+    }
+
+    return metrics.render(gauges, counters)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint(
+    metrics: Metrics = Depends(get_metrics),
+    model_cache: ModelCache = Depends(get_model_cache),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache),
+    explanation_cache: ExplanationCache = Depends(get_explanation_cache),
+    coalescer: SingleFlight = Depends(get_coalescer),
+    executors: ComputeExecutors = Depends(get_executors),
+):
+    """Expose latency histograms, cache/executor gauges and counters.
+
+    Cache gauges and counters cover this API process; compute processes
+    keep their own model caches.
+
+    Returns:
+        Metrics in Prometheus text exposition format
+
+    Example:
+        GET /metrics
+    """
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled (ENABLE_METRICS)")
+
+    text = render_metrics(
+        metrics, model_cache, prediction_cache, explanation_cache, coalescer, executors
+    )
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4; charset=utf-8")
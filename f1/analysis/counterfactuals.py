@@ -2,18 +2,66 @@
 
 Implements what-if analysis by applying controlled changes to driver features
 and recomputing predictions to see how outcomes would change.
+
+A sweep (``compute_counterfactual_sweep``) evaluates a whole grid of changes
+at once: every scenario is a copy of the race stacked into one frame, scored
+with a single model call and normalized per scenario.
 """
 
+import itertools
 import logging
+from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from f1.models.registry import predict_race
-from f1.schemas import CounterfactualRequest, CounterfactualResponse, PredictionOutcome
+from f1.models.registry import (
+    ROW_INDEPENDENT_TYPES,
+    ModelProvider,
+    get_model_info,
+    normalize_frame,
+    predict_frame,
+    score_frame,
+)
+from f1.profiling import stage
+from f1.schemas import (
+    CounterfactualRequest,
+    CounterfactualResponse,
+    CounterfactualSweepPoint,
+    CounterfactualSweepRequest,
+    CounterfactualSweepResponse,
+    PredictionOutcome,
+)
 
 logger = logging.getLogger(__name__)
 
+# Changes understood by apply_deltas (and its vectorized form, apply_delta_arrays)
+CHANGE_TYPES = (
+    "qualifying_position_delta",
+    "driver_form_delta",
+    "constructor_form_delta",
+    "reliability_risk_delta",
+)
+
+# Upper bound on grid combinations scored in one sweep
+MAX_SWEEP_POINTS = 500
+
+# Form columns scaled by a form delta: lower is better for finish and DNF
+# rate (scaled by 1 - delta), higher is better for points (1 + delta)
+_FORM_COLUMNS = {
+    "driver_form_delta": (
+        "driver_rolling_avg_finish",
+        "driver_rolling_avg_points",
+        "driver_rolling_dnf_rate",
+    ),
+    "constructor_form_delta": (
+        "constructor_rolling_avg_finish",
+        "constructor_rolling_avg_points",
+        "constructor_rolling_dnf_rate",
+    ),
+}
+
 
 def apply_deltas(race_data: pd.DataFrame, driver_id: str, changes: dict[str, Any]) -> pd.DataFrame:
     """Apply deltas to a driver's features.
@@ -91,63 +139,154 @@ def apply_deltas(race_data: pd.DataFrame, driver_id: str, changes: dict[str, Any
     return modified_data
 
 
+def apply_delta_arrays(
+    frame: pd.DataFrame, changes: dict[str, tuple[np.ndarray, np.ndarray]]
+) -> None:
+    """Apply per-row deltas to a frame in place, vectorized.
+
+    Same rules and order as apply_deltas (qualifying, driver form,
+    constructor form, reliability), with each change given as row positions
+    and one delta per row. Modified columns become float.
+
+    Args:
+        frame: Feature rows (modified in place)
+        changes: Change name -> (row positions, delta values)
+    """
+
+    def update(col: str, rows: np.ndarray, new_values: np.ndarray) -> None:
+        column = frame[col].to_numpy(dtype=float, copy=True)
+        column[rows] = new_values
+        frame[col] = column
+
+    rows, delta = changes.get("qualifying_position_delta", ((), ()))
+    if len(rows):
+        current = frame["quali_position"].to_numpy(dtype=float)[rows]
+        update("quali_position", rows, np.clip(np.trunc(current + delta), 1, 20))
+
+    for change, columns in _FORM_COLUMNS.items():
+        rows, delta = changes.get(change, ((), ()))
+        if not len(rows):
+            continue
+        for col in columns:
+            if col in frame.columns:
+                current = frame[col].to_numpy(dtype=float)[rows]
+                scale = 1 + delta if col.endswith("_points") else 1 - delta
+                update(col, rows, np.maximum(current * scale, 0))
+
+    rows, delta = changes.get("reliability_risk_delta", ((), ()))
+    if len(rows) and "driver_rolling_dnf_rate" in frame.columns:
+        current = frame["driver_rolling_dnf_rate"].to_numpy(dtype=float)[rows]
+        update("driver_rolling_dnf_rate", rows, np.clip(current + delta, 0, 1))
+
+
+def _driver_outcome(predictions: pd.DataFrame, driver_id: str) -> PredictionOutcome:
+    """Extract one driver's outcome from a normalized single-race frame.
+
+    Expected finish is the driver's rank by descending win probability, ties
+    in race order, as in PredictionResponse.
+
+    Args:
+        predictions: Result of normalize_frame for one race
+        driver_id: Driver to extract
+
+    Returns:
+        PredictionOutcome for the driver
+    """
+    drivers = predictions["driver_id"].to_numpy()
+    win_prob = predictions["win_prob"].to_numpy(dtype=float)
+    podium_prob = (
+        predictions["podium_prob"].to_numpy(dtype=float)
+        if "podium_prob" in predictions.columns
+        else np.zeros(len(predictions))
+    )
+
+    rows = np.flatnonzero(drivers == driver_id)
+    if len(rows) == 0:
+        return PredictionOutcome(win_prob=0.0, podium_prob=0.0, expected_finish=20.0)
+
+    row = rows[0]
+    own = win_prob[row]
+    finish = 1 + np.sum(win_prob > own) + np.sum(win_prob[:row] == own)
+    return PredictionOutcome(
+        win_prob=float(own), podium_prob=float(podium_prob[row]), expected_finish=float(finish)
+    )
+
+
 def compute_counterfactual(
     request: CounterfactualRequest,
     race_data: pd.DataFrame,
     model_name: str,
     model_dir: Optional[str] = "models",
+    model_provider: Optional[ModelProvider] = None,
+    baseline_scores: Optional[pd.DataFrame] = None,
 ) -> CounterfactualResponse:
     """Compute counterfactual prediction.
 
+    Only the modified driver's row is re-scored: its raw model outputs
+    replace the driver's entry in the race's baseline outputs, and the race
+    is renormalized from those. Models whose outputs depend on the whole
+    field (baselines) re-score the modified race instead.
+
     Args:
         request: Counterfactual request with changes
-        race_data: Full race dataset
+        race_data: Race dataset (the race's rows or the full table)
         model_name: Name of model to use
         model_dir: Directory containing models
+        model_provider: Optional model source (e.g. an in-memory cache)
+        baseline_scores: Cached raw outputs for the race (registry.score_frame);
+            computed from race_data when None
 
     Returns:
         CounterfactualResponse with baseline and counterfactual predictions
     """
-    from pathlib import Path
-
     race_id = request.race_id
     driver_id = request.driver_id
     changes = request.changes
 
-    # Filter to specific race
-    race_df: pd.DataFrame = race_data[race_data["race_id"] == race_id].copy()
+    # Filter to specific race (read-only: only the driver's row is copied)
+    with stage("feature_lookup"):
+        race_df: pd.DataFrame = race_data[race_data["race_id"] == race_id]
 
     if race_df.empty:
         raise ValueError(f"Race {race_id} not found")
 
-    # Get baseline prediction
-    logger.info(f"Computing baseline for {driver_id} in {race_id}")
+    driver_rows = np.flatnonzero(race_df["driver_id"].to_numpy() == driver_id)
+    if len(driver_rows) == 0:
+        raise ValueError(f"Driver {driver_id} not found in race data")
+
     model_path = Path(model_dir) if model_dir is not None else Path("models")
-    baseline_response = predict_race(
-        race_id=race_id, model_name=model_name, race_data=race_df, model_dir=model_path
-    )
+    with stage("model_load"):
+        model_info = get_model_info(model_name, model_path, model_provider=model_provider)
+
+    if baseline_scores is None:
+        logger.info(f"Computing baseline for {driver_id} in {race_id}")
+        baseline_scores = score_frame(model_info, race_df)
 
     # Apply deltas
     logger.info(f"Applying changes: {changes}")
-    modified_df: pd.DataFrame = apply_deltas(race_df, driver_id, changes)
+    with stage("apply_changes"):
+        if model_info["type"] in ROW_INDEPENDENT_TYPES:
+            modified_df = apply_deltas(race_df.iloc[driver_rows[:1]], driver_id, changes)
+        else:
+            modified_df = apply_deltas(race_df, driver_id, changes)
 
-    # Get counterfactual prediction
+    # Re-score and splice into the baseline outputs
     logger.info(f"Computing counterfactual for {driver_id}")
-    counterfactual_response = predict_race(
-        race_id=race_id, model_name=model_name, race_data=modified_df, model_dir=model_path
-    )
-
-    # Extract predictions for this driver
-    baseline = PredictionOutcome(
-        win_prob=baseline_response.win_prob.get(driver_id, 0.0),
-        podium_prob=baseline_response.podium_prob.get(driver_id, 0.0),
-        expected_finish=baseline_response.expected_finish.get(driver_id, 20.0),
-    )
-
-    counterfactual = PredictionOutcome(
-        win_prob=counterfactual_response.win_prob.get(driver_id, 0.0),
-        podium_prob=counterfactual_response.podium_prob.get(driver_id, 0.0),
-        expected_finish=counterfactual_response.expected_finish.get(driver_id, 20.0),
+    modified_scores = score_frame(model_info, modified_df)
+    if model_info["type"] in ROW_INDEPENDENT_TYPES:
+        score_cols = [c for c in modified_scores.columns if c not in ("race_id", "driver_id")]
+        target = np.flatnonzero(baseline_scores["driver_id"].to_numpy() == driver_id)[:1]
+        counterfactual_scores = baseline_scores.copy()
+        counterfactual_scores.iloc[target, baseline_scores.columns.get_indexer(score_cols)] = (
+            modified_scores[score_cols].to_numpy()
+        )
+    else:
+        counterfactual_scores = modified_scores
+
+    # Race-level normalization from the raw outputs
+    baseline = _driver_outcome(normalize_frame(model_info, baseline_scores), driver_id)
+    counterfactual = _driver_outcome(
+        normalize_frame(model_info, counterfactual_scores), driver_id
     )
 
     # Compute deltas
@@ -173,6 +312,168 @@ def compute_counterfactual(
     )
 
 
+def sweep_scenarios(grid: dict[str, list[float]]) -> list[dict[str, float]]:
+    """Expand a sweep grid into scenarios (all combinations, in grid order).
+
+    Args:
+        grid: Change name -> values to try
+
+    Returns:
+        List of change dicts, one per combination
+
+    Raises:
+        ValueError: If a change is unknown, has no values, or the grid is too large
+    """
+    unknown = sorted(set(grid) - set(CHANGE_TYPES))
+    if unknown:
+        raise ValueError(
+            f"Unknown sweep changes: {unknown}. Supported: {', '.join(CHANGE_TYPES)}"
+        )
+    if not grid or any(len(values) == 0 for values in grid.values()):
+        raise ValueError("Every swept change needs at least one value")
+
+    n_points = int(np.prod([len(values) for values in grid.values()]))
+    if n_points > MAX_SWEEP_POINTS:
+        raise ValueError(f"Sweep has {n_points} combinations (max {MAX_SWEEP_POINTS})")
+
+    names = list(grid)
+    return [dict(zip(names, combo)) for combo in itertools.product(*grid.values())]
+
+
+def stack_scenarios(
+    race_df: pd.DataFrame, driver_id: str, scenarios: list[dict[str, float]]
+) -> pd.DataFrame:
+    """Stack one modified copy of a race per scenario.
+
+    Vectorized equivalent of calling apply_deltas once per scenario. Block k
+    (rows k*n .. (k+1)*n) holds scenario k, and its race_id is replaced by k
+    so per-race normalization happens per scenario.
+
+    Args:
+        race_df: One race, one row per driver
+        driver_id: Driver to modify
+        scenarios: Change dicts (an empty dict leaves the race unchanged)
+
+    Returns:
+        Stacked DataFrame with len(scenarios) * len(race_df) rows
+
+    Raises:
+        ValueError: If the driver is not in the race
+    """
+    n_drivers = len(race_df)
+    driver_rows = np.flatnonzero(race_df["driver_id"].to_numpy() == driver_id)
+    if len(driver_rows) == 0:
+        raise ValueError(f"Driver {driver_id} not found in race data")
+
+    n_scenarios = len(scenarios)
+    stacked = race_df.iloc[np.tile(np.arange(n_drivers), n_scenarios)].reset_index(drop=True)
+    stacked["race_id"] = np.repeat(np.arange(n_scenarios), n_drivers)
+
+    # The modified driver's row in every block
+    rows = driver_rows[0] + n_drivers * np.arange(n_scenarios)
+
+    def deltas(change: str) -> tuple[np.ndarray, np.ndarray]:
+        """Scenario rows that set a change, and their delta values."""
+        values = np.array([scenario.get(change, np.nan) for scenario in scenarios], dtype=float)
+        present = ~np.isnan(values)
+        return rows[present], values[present]
+
+    apply_delta_arrays(stacked, {change: deltas(change) for change in CHANGE_TYPES})
+    return stacked
+
+
+def compute_counterfactual_sweep(
+    request: CounterfactualSweepRequest,
+    race_data: pd.DataFrame,
+    model_name: str,
+    model_dir: Optional[str] = "models",
+    model_provider: Optional[ModelProvider] = None,
+) -> CounterfactualSweepResponse:
+    """Compute the response curve of a driver's prediction over a grid of changes.
+
+    The baseline and every scenario are stacked into one frame and scored
+    with a single model call; probabilities are normalized within each
+    scenario, as predict_race does within a race.
+
+    Args:
+        request: Sweep request with the grid of changes
+        race_data: Race dataset (the race's rows or the full table)
+        model_name: Name of model to use
+        model_dir: Directory containing models
+        model_provider: Optional model source (e.g. an in-memory cache)
+
+    Returns:
+        CounterfactualSweepResponse with the baseline and one point per scenario
+
+    Raises:
+        ValueError: If the race or driver is not found, or the grid is invalid
+    """
+    race_id = request.race_id
+    driver_id = request.driver_id
+    scenarios = sweep_scenarios(request.grid)
+
+    with stage("feature_lookup"):
+        race_df: pd.DataFrame = race_data[race_data["race_id"] == race_id].reset_index(drop=True)
+
+    if race_df.empty:
+        raise ValueError(f"Race {race_id} not found")
+
+    # Block 0 is the unmodified race
+    with stage("apply_changes"):
+        stacked = stack_scenarios(race_df, driver_id, [{}] + scenarios)
+
+    with stage("model_load"):
+        model_path = Path(model_dir) if model_dir is not None else Path("models")
+        model_info = get_model_info(model_name, model_path, model_provider=model_provider)
+
+    logger.info(f"Sweeping {len(scenarios)} scenarios for {driver_id} in {race_id}")
+    predictions = predict_frame(model_info, stacked)
+
+    with stage("response"):
+        drivers = race_df["driver_id"].tolist()
+        col = drivers.index(driver_id)
+
+        def matrix(values: str) -> np.ndarray:
+            """Scenario x driver matrix of a prediction column."""
+            if values not in predictions.columns:
+                return np.zeros((len(scenarios) + 1, len(drivers)))
+            table = predictions.pivot(index="race_id", columns="driver_id", values=values)
+            return table.loc[np.arange(len(scenarios) + 1), drivers].to_numpy(dtype=float)
+
+        win_prob = matrix("win_prob")
+        podium_prob = matrix("podium_prob")
+
+        # Expected finish: rank by descending win probability, ties in race order
+        own = win_prob[:, [col]]
+        finish = 1 + (win_prob > own).sum(axis=1) + (win_prob[:, :col] == own).sum(axis=1)
+
+        outcomes = [
+            PredictionOutcome(win_prob=win, podium_prob=podium, expected_finish=float(position))
+            for win, podium, position in zip(win_prob[:, col], podium_prob[:, col], finish)
+        ]
+        baseline = outcomes[0]
+        points = [
+            CounterfactualSweepPoint(
+                changes=changes,
+                outcome=outcome,
+                delta={
+                    "win_prob": outcome.win_prob - baseline.win_prob,
+                    "podium_prob": outcome.podium_prob - baseline.podium_prob,
+                    "expected_finish": outcome.expected_finish - baseline.expected_finish,
+                },
+            )
+            for changes, outcome in zip(scenarios, outcomes[1:])
+        ]
+
+    return CounterfactualSweepResponse(
+        race_id=race_id,
+        driver_id=driver_id,
+        model_name=model_name,
+        baseline=baseline,
+        points=points,
+    )
+
+
 def sanity_test_qualifying_improvement():
     """Test that improving qualifying position increases win probability."""
     # Create synthetic test data
@@ -1,25 +1,135 @@
 """Model explanation methods for F1 predictions.
 
 Provides interpretability for various model types:
-- SHAP for tree models (xgb, lgbm, cat)
-- Permutation importance for linear/ensemble models (lr, rf)
-- Component ablation for NBT-TLF
+- TreeSHAP for tree models (xgb, lgbm, cat, rf)
+- Coefficient x (value - baseline) for linear models (lr)
+- Batched component ablation against a neutral baseline for NBT-TLF
+
+Both per-driver attributions are exact and cheap. Permutation importance,
+a global quantity, is computed offline (scripts/precompute_importance.py)
+and cached next to the model artifact, where it backs the fallback used
+when an attribution cannot be computed.
+
+Explanations are computed for a whole race at once (``explain_race``): one
+SHAP call over the race's feature matrix covers every driver, so callers
+can cache the result and answer any driver/top_k from it.
 """
 
+import json
 import logging
-from typing import Any
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
 
+import joblib
 import numpy as np
 import pandas as pd
-import shap
-import torch
 from sklearn.inspection import permutation_importance
 
-from f1.models.registry import ModelRegistry
-from f1.schemas import ExplainResponse, FeatureImpact
+from f1.models.registry import ModelProvider, get_model_info
+from f1.profiling import stage
+from f1.schemas import ExplainResponse, FeatureImpact, RaceExplanation
 
 logger = logging.getLogger(__name__)
 
+# Models explained with TreeSHAP (shap is imported on first use)
+SHAP_MODELS = ("xgb", "lgbm", "cat", "rf")
+
+# Models explained exactly from their coefficients
+LINEAR_MODELS = ("lr",)
+
+
+def explain_race(
+    race_id: str,
+    model_name: str,
+    race_data: pd.DataFrame,
+    model_dir: str = "models",
+    model_provider: Optional[ModelProvider] = None,
+    persist_explainer: bool = False,
+) -> RaceExplanation:
+    """Explain predictions for every driver in a race.
+
+    Args:
+        race_id: Race identifier
+        model_name: Name of model
+        race_data: Race dataset (the race's rows or the full table)
+        model_dir: Model directory
+        model_provider: Optional model source (e.g. an in-memory cache)
+        persist_explainer: Save/reuse tree explainers next to the model artifact
+
+    Returns:
+        Mapping of driver_id to all feature impacts, ordered by impact
+
+    Raises:
+        ValueError: If the race is not in race_data or the model type is unsupported
+    """
+    with stage("feature_lookup"):
+        race_df: pd.DataFrame = race_data.loc[race_data["race_id"] == race_id].reset_index(
+            drop=True
+        )
+
+    if race_df.empty:
+        raise ValueError(f"Race {race_id} not found")
+
+    # Load model
+    with stage("model_load"):
+        model_info = get_model_info(model_name, Path(model_dir), model_provider=model_provider)
+    model_type = model_info["type"]
+
+    # Generate explanations based on model type
+    with stage("attribution"):
+        if model_type == "zoo" and model_name in SHAP_MODELS:
+            impacts = _explain_tree_model(model_info, race_df, persist_explainer)
+
+        elif model_type == "zoo" and model_name in LINEAR_MODELS:
+            impacts = _explain_linear(model_info, race_df)
+
+        elif model_type == "nbt_tlf":
+            impacts = _explain_nbt_tlf(model_info, race_df)
+
+        elif model_type == "baseline":
+            # Simple explanation for baselines
+            impacts = [
+                _explain_baseline(model_name, race_df.iloc[[i]]) for i in range(len(race_df))
+            ]
+
+        else:
+            raise ValueError(f"Explanation not supported for model type: {model_type}")
+
+    logger.info(f"Explained {len(race_df)} drivers in {race_id} using {model_name}")
+    return dict(zip(race_df["driver_id"].astype(str), impacts))
+
+
+def select_explanation(
+    explanation: RaceExplanation, race_id: str, driver_id: str, model_name: str, top_k: int
+) -> ExplainResponse:
+    """Build one driver's response from a race explanation.
+
+    Args:
+        explanation: Result of explain_race
+        race_id: Race identifier
+        driver_id: Driver to explain
+        model_name: Name of model
+        top_k: Number of top features to return
+
+    Returns:
+        ExplainResponse with feature impacts
+
+    Raises:
+        ValueError: If the driver is not in the race
+    """
+    impacts = explanation.get(driver_id)
+    if impacts is None:
+        raise ValueError(f"Driver {driver_id} not found in race {race_id}")
+
+    return ExplainResponse(
+        race_id=race_id,
+        driver_id=driver_id,
+        model_name=model_name,
+        top_features=impacts[:top_k],
+    )
+
 
 def explain_prediction(
     race_id: str,
@@ -28,6 +138,7 @@ def explain_prediction(
     race_data: pd.DataFrame,
     model_dir: str = "models",
     top_k: int = 10,
+    model_provider: Optional[ModelProvider] = None,
 ) -> ExplainResponse:
     """Explain prediction for a specific driver.
 
@@ -38,284 +149,395 @@ def explain_prediction(
         race_data: Full race dataset
         model_dir: Model directory
         top_k: Number of top features to return
+        model_provider: Optional model source (e.g. an in-memory cache)
 
     Returns:
         ExplainResponse with feature impacts
     """
-    from pathlib import Path
+    race_drivers = race_data.loc[race_data["race_id"] == race_id, "driver_id"]
+    if not (race_drivers == driver_id).any():
+        raise ValueError(f"Driver {driver_id} not found in race {race_id}")
 
-    # Filter to race and driver - ensure DataFrames not Series
-    race_df: pd.DataFrame = race_data.loc[race_data["race_id"] == race_id].copy()
-    driver_df: pd.DataFrame = race_df.loc[race_df["driver_id"] == driver_id].copy()
+    explanation = explain_race(race_id, model_name, race_data, model_dir, model_provider)
+    return select_explanation(explanation, race_id, driver_id, model_name, top_k)
+
+
+def _feature_columns(model_info: dict, race_df: pd.DataFrame) -> list[str]:
+    """Feature columns from model metadata, else all numeric non-id columns."""
+    feature_cols = (model_info.get("metadata") or {}).get("features", [])
+    if feature_cols:
+        return feature_cols
+
+    exclude = {
+        "race_id",
+        "driver_id",
+        "team",
+        "season",
+        "round",
+        "track_id",
+        "finish_position",
+        "dnf",
+        "points_earned",
+    }
+    return [
+        col
+        for col in race_df.columns
+        if col not in exclude and pd.api.types.is_numeric_dtype(race_df[col])
+    ]
 
-    if driver_df.empty:
-        raise ValueError(f"Driver {driver_id} not found in race {race_id}")
 
-    # Load model
-    model_info = ModelRegistry.load_model(model_name, Path(model_dir))
-    model_type = model_info["type"]
+def _rank_impacts(
+    feature_cols: list[str], values: np.ndarray, impacts: np.ndarray
+) -> list[list[FeatureImpact]]:
+    """Turn (drivers x features) value and impact matrices into ranked lists.
 
-    # Generate explanations based on model type
-    if model_type == "zoo" and model_name in ["xgb", "lgbm", "cat"]:
-        feature_impacts = _explain_tree_model(model_info, race_df, driver_df, top_k)
+    Args:
+        feature_cols: Feature names (matrix columns)
+        values: Feature values, one row per driver
+        impacts: Impacts, one row per driver
 
-    elif model_type == "zoo" and model_name in ["lr", "rf"]:
-        feature_impacts = _explain_linear_ensemble(model_info, race_df, driver_df, top_k)
+    Returns:
+        Per driver, FeatureImpacts ordered by impact (descending, stable)
+    """
+    orders = np.argsort(-impacts, axis=1, kind="stable")
+    return [
+        [
+            FeatureImpact(name=feature_cols[j], value=float(row_values[j]), impact=float(row[j]))
+            for j in order
+        ]
+        for row_values, row, order in zip(values, impacts, orders)
+    ]
 
-    elif model_type == "nbt_tlf":
-        feature_impacts = _explain_nbt_tlf(model_info, driver_df, top_k)
 
-    elif model_type == "baseline":
-        # Simple explanation for baselines
-        feature_impacts = _explain_baseline(model_name, driver_df)
+def _explainer_path(model_info: dict) -> Optional[Path]:
+    """Path of the serialized explainer next to a zoo model artifact."""
+    model_path = model_info.get("path")
+    if model_path is None:
+        return None
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}_explainer.joblib")
 
-    else:
-        raise ValueError(f"Explanation not supported for model type: {model_type}")
 
-    return ExplainResponse(
-        race_id=race_id,
-        driver_id=driver_id,
-        model_name=model_name,
-        top_features=feature_impacts[:top_k],
-    )
+def _artifact_signature(model_info: dict) -> tuple[int, int]:
+    """(mtime, size) of the model artifact a serialized explainer was built from."""
+    stat = Path(model_info["path"]).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_explainer(model_info: dict, path: Path) -> Any:
+    """Load a serialized explainer if it was built from the current artifact."""
+    try:
+        saved = joblib.load(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable explainer {path}: {e}")
+        return None
+
+    if saved.get("artifact") != _artifact_signature(model_info):
+        return None
+    return saved["explainer"]
+
+
+def _save_explainer(model_info: dict, path: Path, explainer: Any) -> None:
+    """Serialize an explainer atomically (best effort)."""
+    saved = {"artifact": _artifact_signature(model_info), "explainer": explainer}
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            joblib.dump(saved, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+    except Exception as e:
+        logger.warning(f"Could not save explainer to {path}: {e}")
+        return
+    logger.info(f"Saved explainer: {path}")
+
+
+def tree_explainer(model_info: dict, persist: bool = False) -> Any:
+    """Get the SHAP TreeExplainer for a loaded tree model, building it once.
+
+    The explainer is kept in ``model_info``, so it lives in the model cache
+    with its model and is dropped with it; a retrained artifact is a new
+    cache entry and gets a new explainer.
+
+    Args:
+        model_info: Model information (from the model cache)
+        persist: Also reuse/save the explainer next to the model artifact,
+            so other processes and restarts skip the build while the
+            artifact is unchanged
+
+    Returns:
+        shap.TreeExplainer
+    """
+    explainer = model_info.get("explainer")
+    if explainer is not None:
+        return explainer
+
+    path = _explainer_path(model_info) if persist else None
+    if path is not None:
+        explainer = _load_explainer(model_info, path)
+
+    if explainer is None:
+        import shap
+
+        with stage("explainer_build"):
+            explainer = shap.TreeExplainer(model_info["model"])
+        if path is not None:
+            _save_explainer(model_info, path, explainer)
+
+    return model_info.setdefault("explainer", explainer)
 
 
 def _explain_tree_model(
-    model_info: dict, race_df: pd.DataFrame, driver_df: pd.DataFrame, top_k: int
-) -> list[FeatureImpact]:
-    """Explain tree model using SHAP.
+    model_info: dict, race_df: pd.DataFrame, persist_explainer: bool = False
+) -> list[list[FeatureImpact]]:
+    """Explain tree model using SHAP, all drivers in one call.
 
     Args:
         model_info: Model information
-        race_df: Race data
-        driver_df: Driver-specific data
-        top_k: Number of features
+        race_df: Race data, one row per driver
+        persist_explainer: Save/reuse the explainer next to the model artifact
 
     Returns:
-        List of FeatureImpact
+        Per driver, FeatureImpacts ordered by absolute SHAP value
     """
-    model = model_info["model"]
-    metadata = model_info.get("metadata", {})
-
-    # Get feature columns
-    feature_cols = metadata.get("features", [])
-    if not feature_cols:
-        # Use all numeric columns
-        exclude = {
-            "race_id",
-            "driver_id",
-            "team",
-            "season",
-            "round",
-            "track_id",
-            "finish_position",
-            "dnf",
-            "points_earned",
-        }
-        feature_cols = [
-            col
-            for col in race_df.columns
-            if col not in exclude and pd.api.types.is_numeric_dtype(race_df[col])
-        ]
+    feature_cols = _feature_columns(model_info, race_df)
 
     # Prepare data
-    X_driver = driver_df[feature_cols].fillna(0)
+    X_race = race_df[feature_cols].fillna(0)
 
     try:
-        # Use TreeExplainer for efficiency
-        explainer = shap.TreeExplainer(model)
-        shap_values = explainer.shap_values(X_driver)
+        # TreeExplainer built once per loaded model
+        explainer = tree_explainer(model_info, persist=persist_explainer)
+        shap_values = explainer.shap_values(X_race)
 
         # For binary classification, take positive class
         if isinstance(shap_values, list):
             shap_values = shap_values[1]
+        shap_values = np.asarray(shap_values)
+        if shap_values.ndim == 3:
+            shap_values = shap_values[..., 1]
 
-        # Get impacts
-        if len(shap_values.shape) > 1:
-            shap_values = shap_values[0]
-
-        # Create feature impacts
-        feature_impacts = []
-        for idx, col in enumerate(feature_cols):
-            feature_impacts.append(
-                FeatureImpact(
-                    name=col,
-                    value=float(X_driver[col].values[0]),
-                    impact=float(abs(shap_values[idx])),
-                )
-            )
-
-        # Sort by absolute impact
-        feature_impacts.sort(key=lambda x: x.impact, reverse=True)
-
-        logger.info(f"SHAP analysis complete: {len(feature_impacts)} features")
-        return feature_impacts[:top_k]
+        impacts = _rank_impacts(
+            feature_cols, X_race.to_numpy(dtype=float), np.abs(shap_values.reshape(len(X_race), -1))
+        )
+        logger.info(f"SHAP analysis complete: {len(feature_cols)} features x {len(X_race)} drivers")
+        return impacts
 
     except Exception as e:
         logger.warning(f"SHAP failed, using feature importance: {e}")
         # Fallback to feature importance
-        return _fallback_feature_importance(model, feature_cols, driver_df)
+        return [
+            _fallback_feature_importance(model_info, feature_cols, race_df.iloc[[i]])
+            for i in range(len(race_df))
+        ]
 
 
-def _explain_linear_ensemble(
-    model_info: dict, race_df: pd.DataFrame, driver_df: pd.DataFrame, top_k: int
-) -> list[FeatureImpact]:
-    """Explain linear/ensemble model using permutation importance.
+def _explain_linear(model_info: dict, race_df: pd.DataFrame) -> list[list[FeatureImpact]]:
+    """Explain a linear model exactly: coefficient x (value - baseline).
+
+    For logistic regression this is each feature's additive contribution to
+    the driver's log-odds relative to a baseline driver: the training means
+    stored in the model metadata (``feature_means``), or the race field's
+    means for artifacts trained before those were recorded.
 
     Args:
         model_info: Model information
-        race_df: Race data
-        driver_df: Driver-specific data
-        top_k: Number of features
+        race_df: Race data, one row per driver
 
     Returns:
-        List of FeatureImpact
+        Per driver, FeatureImpacts ordered by absolute contribution
     """
     model = model_info["model"]
-    metadata = model_info.get("metadata", {})
-
-    # Get feature columns
-    feature_cols = metadata.get("features", [])
-    if not feature_cols:
-        exclude = {
-            "race_id",
-            "driver_id",
-            "team",
-            "season",
-            "round",
-            "track_id",
-            "finish_position",
-            "dnf",
-            "points_earned",
-        }
-        feature_cols = [
-            col
-            for col in race_df.columns
-            if col not in exclude and pd.api.types.is_numeric_dtype(race_df[col])
+    feature_cols = _feature_columns(model_info, race_df)
+    X_race = race_df[feature_cols].fillna(0).to_numpy(dtype=float)
+
+    try:
+        coef = np.asarray(model.coef_, dtype=float)
+        # Binary classifiers have one row: the positive class
+        coef = coef[-1] if coef.ndim > 1 else coef
+
+        means = (model_info.get("metadata") or {}).get("feature_means")
+        if means:
+            baseline = np.array([means.get(col, 0.0) for col in feature_cols], dtype=float)
+        else:
+            baseline = X_race.mean(axis=0)
+
+        contributions = coef * (X_race - baseline)
+        logger.info(f"Linear attribution complete: {len(feature_cols)} features")
+        return _rank_impacts(feature_cols, X_race, np.abs(contributions))
+
+    except Exception as e:
+        logger.warning(f"Linear attribution failed, using feature importance: {e}")
+        return [
+            _fallback_feature_importance(model_info, feature_cols, race_df.iloc[[i]])
+            for i in range(len(race_df))
         ]
 
-    # Prepare data
-    X_race = race_df[feature_cols].fillna(0).values
-    X_driver = driver_df[feature_cols].fillna(0)
 
-    # Get actual outcomes for permutation importance
-    if "finish_position" in race_df.columns:
-        y_race = (race_df["finish_position"] == 1).astype(int).values
-    else:
-        logger.warning("No finish_position, using dummy outcomes")
-        y_race = np.zeros(len(race_df))
+def _importance_path(model_info: dict) -> Optional[Path]:
+    """Path of the cached global importance next to a zoo model artifact."""
+    model_path = model_info.get("path")
+    if model_path is None:
+        return None
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}_importance.json")
 
-    try:
-        # Compute permutation importance
-        result = permutation_importance(model, X_race, y_race, n_repeats=10, random_state=42)
 
-        # Create feature impacts
-        feature_impacts = []
-        for idx, col in enumerate(feature_cols):
-            feature_impacts.append(
-                FeatureImpact(
-                    name=col,
-                    value=float(X_driver[col].values[0]),
-                    impact=float(result.importances_mean[idx]),
-                )
-            )
+def compute_global_importance(
+    model_info: dict,
+    X: np.ndarray,
+    y: np.ndarray,
+    feature_cols: list[str],
+    n_repeats: int = 10,
+    random_state: int = 42,
+) -> dict[str, float]:
+    """Compute permutation importance over a whole dataset (offline).
 
-        # Sort by importance
-        feature_impacts.sort(key=lambda x: x.impact, reverse=True)
+    Args:
+        model_info: Model information
+        X: Feature matrix (all races)
+        y: Labels for the model's task
+        feature_cols: Feature names (columns of X)
+        n_repeats: Permutations per feature
+        random_state: Random seed
 
-        logger.info(f"Permutation importance complete: {len(feature_impacts)} features")
-        return feature_impacts[:top_k]
+    Returns:
+        Mapping of feature name to mean importance
+    """
+    result = permutation_importance(
+        model_info["model"], X, y, n_repeats=n_repeats, random_state=random_state
+    )
+    return {col: float(value) for col, value in zip(feature_cols, result.importances_mean)}
 
-    except Exception as e:
-        logger.warning(f"Permutation importance failed: {e}")
-        return _fallback_feature_importance(model, feature_cols, driver_df)
 
+def save_global_importance(model_info: dict, importance: dict[str, float]) -> Path:
+    """Cache global importance next to the model artifact it was computed for.
 
-def _explain_nbt_tlf(model_info: dict, driver_df: pd.DataFrame, top_k: int) -> list[FeatureImpact]:
-    """Explain NBT-TLF using component ablation.
+    Args:
+        model_info: Model information (zoo model, with its artifact path)
+        importance: Result of compute_global_importance
 
-    Zero-out each component and measure score delta to assess contribution.
+    Returns:
+        Path of the written JSON file
+    """
+    path = _importance_path(model_info)
+    if path is None:
+        raise ValueError("Global importance can only be cached for zoo models")
+
+    payload = {"artifact": list(_artifact_signature(model_info)), "importance": importance}
+    path.write_text(json.dumps(payload, indent=2))
+    logger.info(f"Saved global importance: {path}")
+    return path
+
+
+def load_global_importance(model_info: dict) -> Optional[dict[str, float]]:
+    """Load cached global importance if it matches the loaded artifact.
+
+    The result is memoized in ``model_info``.
 
     Args:
-        model_info: Model information with trainer and config
-        driver_df: Driver-specific data
-        top_k: Number of features
+        model_info: Model information
 
     Returns:
-        List of FeatureImpact
+        Mapping of feature name to importance, or None if not cached
     """
+    if "global_importance" in model_info:
+        return model_info["global_importance"]
+
+    importance = None
+    path = _importance_path(model_info)
+    if path is not None and path.exists():
+        try:
+            payload = json.loads(path.read_text())
+            if tuple(payload.get("artifact", ())) == _artifact_signature(model_info):
+                importance = payload["importance"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable importance file {path}: {e}")
+
+    model_info["global_importance"] = importance
+    return importance
+
+
+def _explain_nbt_tlf(model_info: dict, race_df: pd.DataFrame) -> list[list[FeatureImpact]]:
+    """Explain NBT-TLF by component ablation, all drivers in one forward pass.
+
+    Each component of the score network input (driver, constructor and
+    track embeddings, temporal encoding, numeric features) is replaced in
+    turn by its neutral value (see NBTTLFModel.neutral_input); a component's
+    impact is the absolute score change. The unablated and every ablated
+    copy of the race are stacked into one batch.
+
+    Works with both engines: NumPy-loaded models run entirely in NumPy,
+    torch-loaded models build the inputs and run the network in torch.
+
+    Args:
+        model_info: Model information with model and config
+        race_df: Race data, one row per driver
+
+    Returns:
+        Per driver, FeatureImpacts ordered by impact
+    """
+    from f1.models.nbt_tlf_numpy import encode_drivers
+
     model = model_info["model"]
     config = model_info["config"]
+    n_drivers = len(race_df)
+
+    numeric_names = list(config.get("numeric_feature_cols", []))[: model.numeric_features_dim]
+    encoded = encode_drivers(
+        race_df,
+        config.get("driver_to_idx", {}),
+        config.get("constructor_to_idx", {}),
+        config.get("track_to_idx", {}),
+        numeric_names,
+        model.numeric_features_dim,
+    )
+    driver_idx, constructor_idx = encoded["driver"], encoded["constructor"]
+    track_idx, race_idx, numeric = encoded["track"], encoded["race"], encoded["numeric"]
+
+    segments = model.input_segments(numeric_names)
+    values = np.column_stack(
+        [driver_idx, constructor_idx, track_idx, race_idx]
+        + ([numeric] if numeric is not None else [])
+    ).astype(float)
+
+    if model_info.get("engine") == "numpy":
+        inputs = model.score_inputs(driver_idx, constructor_idx, track_idx, race_idx, numeric)
+        neutral = model.neutral_input()
+        network = model.score_network
+    else:
+        import torch
 
-    driver_to_idx = config.get("driver_to_idx", {})
-    constructor_to_idx = config.get("constructor_to_idx", {})
-    track_to_idx = config.get("track_to_idx", {})
-
-    # Get driver info
-    row = driver_df.iloc[0]
-    driver_idx = driver_to_idx.get(row["driver_id"], 0)
-    constructor_idx = constructor_to_idx.get(row.get("team", ""), 0)
-    track_idx = track_to_idx.get(row.get("track_id", ""), 0)
-    race_idx = int(row.get("season", 2024) * 100 + row.get("round", 1))
-
-    model.eval()
-    with torch.no_grad():
-        # Baseline score
-        baseline_score = model.compute_score(
-            torch.tensor([driver_idx], dtype=torch.long),
-            torch.tensor([constructor_idx], dtype=torch.long),
-            torch.tensor([track_idx], dtype=torch.long),
-            torch.tensor([race_idx], dtype=torch.long),
-        ).item()
-
-        # Ablate driver embedding
-        driver_ablated = model.compute_score(
-            torch.tensor([0], dtype=torch.long),  # Zero index
-            torch.tensor([constructor_idx], dtype=torch.long),
-            torch.tensor([track_idx], dtype=torch.long),
-            torch.tensor([race_idx], dtype=torch.long),
-        ).item()
-
-        # Ablate constructor embedding
-        constructor_ablated = model.compute_score(
-            torch.tensor([driver_idx], dtype=torch.long),
-            torch.tensor([0], dtype=torch.long),
-            torch.tensor([track_idx], dtype=torch.long),
-            torch.tensor([race_idx], dtype=torch.long),
-        ).item()
-
-        # Ablate track embedding
-        track_ablated = model.compute_score(
-            torch.tensor([driver_idx], dtype=torch.long),
-            torch.tensor([constructor_idx], dtype=torch.long),
-            torch.tensor([0], dtype=torch.long),
-            torch.tensor([race_idx], dtype=torch.long),
-        ).item()
-
-    # Compute contributions (deltas from baseline)
-    feature_impacts = [
-        FeatureImpact(
-            name="driver_embedding",
-            value=float(driver_idx),
-            impact=abs(baseline_score - driver_ablated),
-        ),
-        FeatureImpact(
-            name="constructor_embedding",
-            value=float(constructor_idx),
-            impact=abs(baseline_score - constructor_ablated),
-        ),
-        FeatureImpact(
-            name="track_embedding",
-            value=float(track_idx),
-            impact=abs(baseline_score - track_ablated),
-        ),
-    ]
+        model.eval()
+        with torch.no_grad():
+            inputs = model.score_inputs(
+                torch.as_tensor(driver_idx, dtype=torch.long),
+                torch.as_tensor(constructor_idx, dtype=torch.long),
+                torch.as_tensor(track_idx, dtype=torch.long),
+                torch.as_tensor(race_idx, dtype=torch.long),
+                torch.as_tensor(numeric, dtype=torch.float32) if numeric is not None else None,
+            ).cpu().numpy()
+            neutral = model.neutral_input().cpu().numpy()
+
+        def network(batch: np.ndarray) -> np.ndarray:
+            with torch.no_grad():
+                return model.score_network(torch.as_tensor(batch)).cpu().numpy()
 
-    # Sort by impact
-    feature_impacts.sort(key=lambda x: x.impact, reverse=True)
+    # Block 0 is the race as-is; block k has component k set to neutral
+    batch = np.tile(inputs, (len(segments) + 1, 1))
+    for k, columns in enumerate(segments.values(), start=1):
+        batch[k * n_drivers : (k + 1) * n_drivers, columns] = neutral[columns]
 
-    logger.info(f"NBT-TLF ablation complete: {len(feature_impacts)} components")
-    return feature_impacts[:top_k]
+    scores = network(batch).reshape(len(segments) + 1, n_drivers)
+    deltas = np.abs(scores[1:] - scores[0]).T
+
+    logger.info(f"NBT-TLF ablation complete: {len(segments)} components x {n_drivers} drivers")
+    return _rank_impacts(list(segments), values, deltas)
 
 
 def _explain_baseline(model_name: str, driver_df: pd.DataFrame) -> list[FeatureImpact]:
@@ -339,13 +561,21 @@ def _explain_baseline(model_name: str, driver_df: pd.DataFrame) -> list[FeatureI
 
 
 def _fallback_feature_importance(
-    model: Any, feature_cols: list[str], driver_df: pd.DataFrame
+    model_info: dict, feature_cols: list[str], driver_df: pd.DataFrame
 ) -> list[FeatureImpact]:
-    """Fallback to model's built-in feature importance."""
+    """Fallback to global importance: cached permutation importance, else built-in."""
     impacts = []
+    model = model_info["model"]
 
-    if hasattr(model, "feature_importances_"):
+    global_importance = load_global_importance(model_info)
+    if global_importance:
+        importances = [global_importance.get(col, 0.0) for col in feature_cols]
+    elif hasattr(model, "feature_importances_"):
         importances = model.feature_importances_
+    else:
+        importances = None
+
+    if importances is not None:
         for idx, col in enumerate(feature_cols):
             impacts.append(
                 FeatureImpact(
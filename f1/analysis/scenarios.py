@@ -0,0 +1,195 @@
+"""Season-scale counterfactual scenarios.
+
+A scenario is an ordered list of declarative rules ("Ferrari constructor
+form +15% from round 8", "VER qualifies last in every race"). Each rule
+selects driver rows by driver, team and round range and applies
+counterfactual changes with apply_deltas semantics, vectorized over the
+season's feature matrix. Every affected race is then scored twice - as-is
+and under the scenario - in one stacked inference call per model, and the
+per-race predictions are summed into season totals per driver.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from f1.analysis.counterfactuals import CHANGE_TYPES, apply_delta_arrays
+from f1.models.registry import ModelProvider, get_model_info, predict_frame
+from f1.profiling import stage
+from f1.schemas import DriverScenarioImpact, ScenarioRule
+
+logger = logging.getLogger(__name__)
+
+# Championship points by finishing position (P1..P10)
+POINTS_BY_POSITION = np.array([25, 18, 15, 12, 10, 8, 6, 4, 2, 1], dtype=float)
+
+# Marks scenario copies of a race in stacked frames (race_id + suffix)
+_SCENARIO_SUFFIX = "#scenario"
+
+
+def rule_mask(features: pd.DataFrame, rule: ScenarioRule) -> np.ndarray:
+    """Select the rows a rule applies to.
+
+    Args:
+        features: Feature rows (driver_id, team, round)
+        rule: Scenario rule
+
+    Returns:
+        Boolean mask over the rows
+    """
+    mask = np.ones(len(features), dtype=bool)
+    if rule.driver_ids is not None:
+        mask &= features["driver_id"].isin(rule.driver_ids).to_numpy()
+    if rule.teams is not None:
+        teams = features["team"] if "team" in features.columns else pd.Series("", features.index)
+        mask &= teams.isin(rule.teams).to_numpy()
+    if rule.from_round is not None:
+        mask &= features["round"].to_numpy() >= rule.from_round
+    if rule.to_round is not None:
+        mask &= features["round"].to_numpy() <= rule.to_round
+    return mask
+
+
+def apply_rules(
+    features: pd.DataFrame, rules: list[ScenarioRule]
+) -> tuple[pd.DataFrame, list[str]]:
+    """Apply scenario rules to a feature table.
+
+    Rules are applied in order; a row matched by several rules gets each
+    rule's changes on top of the previous ones.
+
+    Args:
+        features: Feature rows (e.g. one season); not modified
+        rules: Scenario rules
+
+    Returns:
+        Tuple of (modified copy with a default index, affected race_ids in
+        table order)
+
+    Raises:
+        ValueError: If a rule uses an unknown change
+    """
+    for rule in rules:
+        unknown = sorted(set(rule.changes) - set(CHANGE_TYPES))
+        if unknown:
+            raise ValueError(
+                f"Unknown scenario changes: {unknown}. Supported: {', '.join(CHANGE_TYPES)}"
+            )
+
+    modified = features.reset_index(drop=True).copy()
+    changed = np.zeros(len(modified), dtype=bool)
+
+    for rule in rules:
+        mask = rule_mask(modified, rule)
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            continue
+        apply_delta_arrays(
+            modified,
+            {change: (rows, np.full(len(rows), delta)) for change, delta in rule.changes.items()},
+        )
+        changed |= mask
+
+    affected = pd.unique(modified["race_id"].to_numpy()[changed]).tolist()
+    return modified, affected
+
+
+def _season_totals(predictions: pd.DataFrame) -> pd.DataFrame:
+    """Sum per-race predictions into per-driver totals.
+
+    Args:
+        predictions: Normalized predictions (race_id, driver_id, win_prob,
+            podium_prob) for one or more races
+
+    Returns:
+        DataFrame indexed by driver_id with races, expected_wins,
+        expected_podiums and expected_points
+    """
+    # Finishing order by descending win probability, ties in race order
+    position = (
+        predictions.groupby("race_id", sort=False)["win_prob"]
+        .rank(method="first", ascending=False)
+        .to_numpy(dtype=int)
+    )
+    points = np.where(
+        position <= len(POINTS_BY_POSITION),
+        POINTS_BY_POSITION[np.minimum(position, len(POINTS_BY_POSITION)) - 1],
+        0.0,
+    )
+
+    podium = (
+        predictions["podium_prob"]
+        if "podium_prob" in predictions.columns
+        else pd.Series(0.0, index=predictions.index)
+    )
+    return pd.DataFrame(
+        {
+            "driver_id": predictions["driver_id"].to_numpy(),
+            "races": 1,
+            "expected_wins": predictions["win_prob"].to_numpy(dtype=float),
+            "expected_podiums": podium.to_numpy(dtype=float),
+            "expected_points": points,
+        }
+    ).groupby("driver_id", sort=False).sum()
+
+
+def score_scenario(
+    model_name: str,
+    baseline_df: pd.DataFrame,
+    scenario_df: pd.DataFrame,
+    model_dir: Path = Path("models"),
+    model_provider: Optional[ModelProvider] = None,
+) -> list[DriverScenarioImpact]:
+    """Score affected races as-is and under a scenario with one model call.
+
+    Args:
+        model_name: Model to score with
+        baseline_df: Original rows of the affected races
+        scenario_df: The same races with the scenario applied
+        model_dir: Directory containing models
+        model_provider: Optional model source (e.g. an in-memory cache)
+
+    Returns:
+        Driver impacts, ordered by expected points gained (descending)
+    """
+    if baseline_df.empty:
+        return []
+
+    with stage("model_load"):
+        model_info = get_model_info(model_name, Path(model_dir), model_provider=model_provider)
+
+    # Scenario copies get their own race_id so normalization stays per race
+    with stage("feature_matrix"):
+        scenario_rows = scenario_df.copy()
+        scenario_rows["race_id"] = scenario_rows["race_id"].astype(str) + _SCENARIO_SUFFIX
+        stacked = pd.concat([baseline_df, scenario_rows], ignore_index=True)
+
+    predictions = predict_frame(model_info, stacked)
+
+    with stage("response"):
+        is_scenario = predictions["race_id"].astype(str).str.endswith(_SCENARIO_SUFFIX)
+        baseline = _season_totals(predictions[~is_scenario.to_numpy()])
+        scenario = _season_totals(predictions[is_scenario.to_numpy()]).reindex(baseline.index)
+        delta = scenario - baseline
+
+        metrics = ["expected_wins", "expected_podiums", "expected_points"]
+        ranked = delta.sort_values("expected_points", ascending=False, kind="stable").index
+        impacts = [
+            DriverScenarioImpact(
+                driver_id=str(driver_id),
+                races=int(baseline.at[driver_id, "races"]),
+                baseline=baseline.loc[driver_id, metrics].astype(float).to_dict(),
+                scenario=scenario.loc[driver_id, metrics].astype(float).to_dict(),
+                delta=delta.loc[driver_id, metrics].astype(float).to_dict(),
+            )
+            for driver_id in ranked
+        ]
+
+    logger.info(
+        f"Scored scenario with {model_name}: {baseline_df['race_id'].nunique()} races, "
+        f"{len(impacts)} drivers"
+    )
+    return impacts
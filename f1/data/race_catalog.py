@@ -0,0 +1,225 @@
+"""Race catalog merging the feature table with season schedule files.
+
+The feature table only knows races that have been raced (or at least
+featurized); the ``<season>_season.json`` schedule files know names, dates
+and venues, including upcoming seasons. The catalog merges both into one
+list per season, ordered by round, and is rebuilt only when either source
+changes.
+"""
+
+import hashlib
+import json
+import logging
+import numbers
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from f1.data.race_index import RaceIndex
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_PATTERN = "*_season.json"
+
+
+def schedule_paths(schedule_dir: Path) -> list[Path]:
+    """List the season schedule files in a directory, sorted by name."""
+    return sorted(Path(schedule_dir).glob(SCHEDULE_PATTERN))
+
+
+def schedule_signature(schedule_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Cheap change signature of the schedule files: (name, mtime, size) each."""
+    signature = []
+    for path in schedule_paths(schedule_dir):
+        stat = path.stat()
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def load_schedules(paths: list[Path]) -> list[dict[str, Any]]:
+    """Load race entries from season schedule files.
+
+    Unreadable files are skipped with a warning.
+
+    Args:
+        paths: Schedule JSON files ({"season": ..., "races": [...]})
+
+    Returns:
+        Race entries, each with its season set
+    """
+    entries = []
+    for path in paths:
+        try:
+            with open(path) as f:
+                schedule = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping schedule {path}: {e}")
+            continue
+
+        for race in schedule.get("races", []):
+            entries.append({**race, "season": int(race.get("season", schedule.get("season")))})
+    return entries
+
+
+def _race_date(value: Any) -> Optional[str]:
+    """Normalize a feature-table race_date (datetime or epoch ns) to YYYY-MM-DD."""
+    if value is None or pd.isna(value):
+        return None
+    return pd.Timestamp(value).date().isoformat()
+
+
+def _feature_race_date(value: Any) -> Optional[int]:
+    """Feature-table race_date as the integer /api/f1/races has always returned.
+
+    Numeric values are passed through as int; datetimes become epoch
+    nanoseconds (their int64 storage).
+    """
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, numbers.Real):
+        return int(value)
+    return int(pd.Timestamp(value).value)
+
+
+def _name_from_track(track_id: Any) -> Optional[str]:
+    """Event name from a '<country>_<event name>' track_id."""
+    if not isinstance(track_id, str) or "_" not in track_id:
+        return None
+    return track_id.split("_", 1)[1] or None
+
+
+class RaceCatalog:
+    """All known races, indexed by season and ordered by round."""
+
+    def __init__(
+        self,
+        index: Optional[RaceIndex],
+        schedule: list[dict[str, Any]],
+        version: Optional[str] = None,
+    ):
+        """Merge feature-table races with schedule entries.
+
+        Schedule entries provide name, date, country and track. Races in the
+        feature table are marked ``has_features`` and take season, round and
+        (when present) date from it; ``race_date`` keeps the feature table's
+        own value as an integer (None for schedule-only races).
+
+        Args:
+            index: Race index over the feature table (None if not loaded)
+            schedule: Race entries from ``load_schedules``
+            version: Identifier of the sources this catalog was built from
+        """
+        self.version = version
+        merged: dict[str, dict[str, Any]] = {}
+
+        for entry in schedule:
+            race_id = entry.get("race_id")
+            if not race_id:
+                continue
+            merged[race_id] = {
+                "race_id": race_id,
+                "name": entry.get("name") or f"Race {race_id}",
+                "date": entry.get("date"),
+                "race_date": None,
+                "season": int(entry["season"]),
+                "round": int(entry["round"]),
+                "country": entry.get("country"),
+                "track": entry.get("track"),
+                "has_features": False,
+            }
+
+        if index is not None and len(index):
+            heads = index.race_heads()
+            columns = [
+                heads[col].tolist() if col in heads.columns else [None] * len(heads)
+                for col in ("race_id", "season", "round", "track_id", "race_date")
+            ]
+            for race_id, season, round_num, track_id, race_date in zip(*columns):
+                entry = merged.get(race_id)
+                if entry is None:
+                    entry = merged[race_id] = {
+                        "race_id": race_id,
+                        "name": _name_from_track(track_id) or f"Race {race_id}",
+                        "date": None,
+                        "race_date": None,
+                        "country": None,
+                        "track": None,
+                    }
+                entry["season"] = int(season)
+                entry["round"] = int(round_num)
+                entry["date"] = _race_date(race_date) or entry["date"]
+                entry["race_date"] = _feature_race_date(race_date)
+                entry["has_features"] = True
+
+        self._seasons: dict[int, list[dict[str, Any]]] = {}
+        for entry in sorted(merged.values(), key=lambda r: (r["season"], r["round"])):
+            self._seasons.setdefault(entry["season"], []).append(entry)
+
+        logger.info(f"Built race catalog: {len(merged)} races, {len(self._seasons)} seasons")
+
+    @classmethod
+    def build(cls, index: Optional[RaceIndex], schedule_dir: Path) -> "RaceCatalog":
+        """Build a catalog from a race index and a directory of schedules.
+
+        The version hashes the index version and the schedule file contents,
+        so it is the same in every worker for the same data.
+
+        Args:
+            index: Race index over the feature table (None if not loaded)
+            schedule_dir: Directory containing ``<season>_season.json`` files
+
+        Returns:
+            RaceCatalog
+        """
+        paths = schedule_paths(schedule_dir)
+        digest = hashlib.sha256(str(index.version if index is not None else None).encode())
+        for path in paths:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        return cls(index, load_schedules(paths), version=digest.hexdigest()[:16])
+
+    def __len__(self) -> int:
+        return sum(len(races) for races in self._seasons.values())
+
+    @property
+    def seasons(self) -> list[int]:
+        """All seasons in ascending order."""
+        return sorted(self._seasons)
+
+    def races(
+        self,
+        season: Optional[int] = None,
+        upcoming: bool = False,
+        limit: Optional[int] = None,
+        featured_only: bool = False,
+        today: Optional[date] = None,
+    ) -> list[dict[str, Any]]:
+        """Get catalog entries in (season, round) order.
+
+        Entries are shared; callers must not modify them.
+
+        Args:
+            season: Only this season (None = all seasons)
+            upcoming: Only races dated today or later
+            limit: Maximum number of races (None = no limit)
+            featured_only: Only races present in the feature table
+            today: Reference date for ``upcoming`` (default: today)
+
+        Returns:
+            List of race entries
+        """
+        if season is not None:
+            races = self._seasons.get(int(season), [])
+        else:
+            races = [race for s in self.seasons for race in self._seasons[s]]
+
+        if featured_only:
+            races = [race for race in races if race["has_features"]]
+
+        if upcoming:
+            cutoff = (today or date.today()).isoformat()
+            races = [race for race in races if race["date"] is not None and race["date"] >= cutoff]
+
+        return races[:limit] if limit is not None else list(races)
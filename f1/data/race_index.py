@@ -0,0 +1,167 @@
+"""Race-partitioned index over the feature table.
+
+Sorts the feature table once (unless it is already grouped, as the
+memory-mapped store is) so every race occupies one contiguous block of
+rows, then keeps race_id -> row slice, season -> race_ids and
+driver_id -> row positions lookups. A race lookup is a dict hit plus an
+``iloc`` slice, independent of how many seasons are loaded.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _is_default_index(index: pd.Index) -> bool:
+    """Check for a 0..n-1 RangeIndex."""
+    return isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+
+
+class RaceIndex:
+    """Feature table with O(1) race, season and driver lookups."""
+
+    def __init__(self, features: pd.DataFrame, version: Optional[str] = None):
+        """Build indexes over a feature table.
+
+        Args:
+            features: Feature DataFrame with race_id, season, round, driver_id
+            version: Optional identifier of the data version (e.g. content hash)
+        """
+        self.version = version
+
+        race_keys = features["race_id"].to_numpy(dtype=str)
+        if _is_default_index(features.index) and bool(np.all(race_keys[:-1] <= race_keys[1:])):
+            # Already grouped (e.g. a memory-mapped store): use the columns as-is
+            self.features: pd.DataFrame = features
+        else:
+            # Stable sort keeps the original driver order within each race
+            order = np.argsort(race_keys, kind="stable")
+            self.features = features.iloc[order].reset_index(drop=True)
+
+        race_ids = self.features["race_id"].to_numpy()
+        n_rows = len(race_ids)
+
+        # Race boundaries: positions where race_id changes
+        boundaries = np.flatnonzero(race_ids[1:] != race_ids[:-1]) + 1
+        starts = np.concatenate([[0], boundaries]) if n_rows else np.array([], dtype=int)
+        ends = np.concatenate([boundaries, [n_rows]]) if n_rows else np.array([], dtype=int)
+
+        self._race_slices: dict[str, slice] = {
+            race_ids[start]: slice(int(start), int(end)) for start, end in zip(starts, ends)
+        }
+
+        # Season index, with races ordered by round
+        self._season_races: dict[int, list[str]] = {}
+        if n_rows:
+            seasons = self.features["season"].to_numpy()
+            rounds = self.features["round"].to_numpy()
+            race_meta = sorted(
+                (int(seasons[start]), int(rounds[start]), race_ids[start]) for start in starts
+            )
+            for season, _round, race_id in race_meta:
+                self._season_races.setdefault(season, []).append(race_id)
+
+        # Driver index: row positions per driver, in race order
+        self._driver_rows: dict[str, np.ndarray] = {}
+        if n_rows:
+            driver_ids = self.features["driver_id"].to_numpy(dtype=str)
+            driver_order = np.argsort(driver_ids, kind="stable")
+            sorted_drivers = driver_ids[driver_order]
+            driver_bounds = np.flatnonzero(sorted_drivers[1:] != sorted_drivers[:-1]) + 1
+            for rows in np.split(driver_order, driver_bounds):
+                self._driver_rows[str(driver_ids[rows[0]])] = rows
+
+        logger.info(
+            f"Indexed {n_rows} rows: {len(self._race_slices)} races, "
+            f"{len(self._season_races)} seasons, {len(self._driver_rows)} drivers"
+        )
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def has_race(self, race_id: str) -> bool:
+        """Check whether a race is present."""
+        return race_id in self._race_slices
+
+    def race(self, race_id: str) -> pd.DataFrame:
+        """Get the rows for one race.
+
+        The result is a slice of the shared table; callers must copy before
+        modifying it.
+
+        Args:
+            race_id: Race identifier
+
+        Returns:
+            DataFrame with the race's rows (empty if the race is unknown)
+        """
+        race_slice = self._race_slices.get(race_id)
+        if race_slice is None:
+            return self.features.iloc[0:0]
+        return self.features.iloc[race_slice]
+
+    def races(self, race_ids: list[str]) -> pd.DataFrame:
+        """Get the rows for several races, stacked in the given order.
+
+        Args:
+            race_ids: Race identifiers (unknown races are skipped)
+
+        Returns:
+            DataFrame with the stacked race rows
+        """
+        slices = [self._race_slices[r] for r in race_ids if r in self._race_slices]
+        if not slices:
+            return self.features.iloc[0:0]
+        positions = np.concatenate([np.arange(s.start, s.stop) for s in slices])
+        return self.features.iloc[positions]
+
+    def race_heads(self) -> pd.DataFrame:
+        """Get the first row of every race, in index order.
+
+        Race-level columns (season, round, track_id, race_date) are constant
+        within a race, so this is a one-row-per-race view of them.
+
+        Returns:
+            DataFrame with one row per race
+        """
+        starts = [race_slice.start for race_slice in self._race_slices.values()]
+        return self.features.iloc[starts]
+
+    @property
+    def race_ids(self) -> list[str]:
+        """All race identifiers in chronological (season, round) order."""
+        return [race_id for season in self.seasons for race_id in self._season_races[season]]
+
+    @property
+    def seasons(self) -> list[int]:
+        """All seasons in ascending order."""
+        return sorted(self._season_races)
+
+    def season_races(self, season: int) -> list[str]:
+        """Get race identifiers for a season, ordered by round.
+
+        Args:
+            season: Season year
+
+        Returns:
+            List of race identifiers (empty if the season is unknown)
+        """
+        return list(self._season_races.get(int(season), []))
+
+    def driver(self, driver_id: str) -> pd.DataFrame:
+        """Get all rows for a driver in race order.
+
+        Args:
+            driver_id: Driver identifier
+
+        Returns:
+            DataFrame with the driver's rows (empty if the driver is unknown)
+        """
+        rows = self._driver_rows.get(driver_id)
+        if rows is None:
+            return self.features.iloc[0:0]
+        return self.features.iloc[rows]
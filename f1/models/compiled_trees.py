@@ -0,0 +1,418 @@
+"""Compiled flat-array inference for tree ensembles.
+
+For a 20-row race, predict_proba of the zoo's tree models is dominated by
+framework overhead (DMatrix construction, thread-pool start-up, sklearn
+input validation) rather than by walking the trees. compile_forest
+flattens a trained XGBoost, LightGBM, CatBoost or scikit-learn random
+forest model into contiguous NumPy arrays (feature, threshold, left,
+right, leaf value), and CompiledForest evaluates every row through every
+tree at once, one tree level per step.
+
+All four libraries share one node convention: go left when
+``x <= threshold``. XGBoost's strict ``x < t`` on float32 is rewritten as
+``x <= nextafter(t, -inf)``; CatBoost's oblivious trees are expanded into
+ordinary binary trees. Leaves point to themselves, so traversal runs a
+fixed number of steps (the maximum depth) with no per-row branching.
+
+Inputs must be NaN-free (the registry fills missing features with 0);
+default directions for missing values are not compiled. Compiling needs
+the model's library to unpickle the model; evaluating needs NumPy only.
+"""
+
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Output transforms: raw ensemble output -> prediction
+LINKS = ("identity", "logistic")
+
+
+class CompiledForest:
+    """A tree ensemble as flat arrays, evaluated level-synchronously."""
+
+    def __init__(
+        self,
+        trees: list[dict[str, np.ndarray]],
+        aggregate: str = "sum",
+        base: float = 0.0,
+        scale: float = 1.0,
+        link: str = "identity",
+        input_dtype: type = np.float64,
+        is_classifier: bool = False,
+    ):
+        """Pack per-tree node arrays into one flat node table.
+
+        Args:
+            trees: Per tree, node arrays feature, threshold, left, right and
+                value, with node 0 the root and left/right -1 at leaves
+            aggregate: How per-tree leaf values combine ("sum" or "mean")
+            base: Value added to the aggregated output (e.g. base margin)
+            scale: Factor applied to the aggregated output before base
+            link: Output transform (see LINKS)
+            input_dtype: Precision the native library evaluates inputs in
+            is_classifier: Whether predictions are positive-class probabilities
+
+        Raises:
+            ValueError: If aggregate or link is unknown, or there are no trees
+        """
+        if aggregate not in ("sum", "mean"):
+            raise ValueError(f"Unknown aggregate: {aggregate}")
+        if link not in LINKS:
+            raise ValueError(f"Unknown link: {link}. Supported: {', '.join(LINKS)}")
+        if not trees:
+            raise ValueError("Cannot compile an empty ensemble")
+
+        sizes = np.array([len(tree["feature"]) for tree in trees])
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        self.roots = offsets.astype(np.int64)
+
+        left = np.concatenate([tree["left"] for tree in trees]).astype(np.int64)
+        right = np.concatenate([tree["right"] for tree in trees]).astype(np.int64)
+        tree_offset = np.repeat(offsets, sizes)
+        node_ids = np.arange(len(left))
+
+        # Leaves loop back to themselves so extra traversal steps are no-ops
+        is_leaf = left < 0
+        self.left = np.where(is_leaf, node_ids, left + tree_offset)
+        self.right = np.where(is_leaf, node_ids, right + tree_offset)
+        self.feature = np.where(
+            is_leaf, 0, np.concatenate([tree["feature"] for tree in trees])
+        ).astype(np.int64)
+        self.threshold = np.concatenate([tree["threshold"] for tree in trees]).astype(np.float64)
+        self.value = np.concatenate([tree["value"] for tree in trees]).astype(np.float64)
+
+        self.depth = max(_tree_depth(tree["left"], tree["right"]) for tree in trees)
+        self.n_features = int(self.feature.max()) + 1
+        self.aggregate = aggregate
+        self.base = float(base)
+        self.scale = float(scale)
+        self.link = link
+        self.input_dtype = input_dtype
+        self.is_classifier = is_classifier
+
+    @property
+    def n_trees(self) -> int:
+        """Number of trees in the ensemble."""
+        return len(self.roots)
+
+    def leaves(self, X: np.ndarray) -> np.ndarray:
+        """Find the leaf each row reaches in each tree.
+
+        Args:
+            X: Feature matrix [n_rows, n_features]
+
+        Returns:
+            Flat leaf node ids [n_rows, n_trees]
+        """
+        # Round to the native library's input precision, compare in float64
+        X = np.asarray(X).astype(self.input_dtype).astype(np.float64)
+        rows = np.arange(len(X))[:, None]
+
+        nodes = np.broadcast_to(self.roots, (len(X), self.n_trees))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def raw_predict(self, X: np.ndarray) -> np.ndarray:
+        """Aggregated ensemble output before the link function.
+
+        Args:
+            X: Feature matrix [n_rows, n_features]
+
+        Returns:
+            Raw outputs [n_rows]
+        """
+        values = self.value[self.leaves(X)]
+        combined = values.sum(axis=1) if self.aggregate == "sum" else values.mean(axis=1)
+        return combined * self.scale + self.base
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict outputs (positive-class probability for classifiers).
+
+        Args:
+            X: Feature matrix [n_rows, n_features]
+
+        Returns:
+            Predictions [n_rows]
+        """
+        raw = self.raw_predict(X)
+        if self.link == "logistic":
+            return 1.0 / (1.0 + np.exp(-raw))
+        return raw
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Class probabilities, as sklearn's predict_proba for binary models.
+
+        Args:
+            X: Feature matrix [n_rows, n_features]
+
+        Returns:
+            Probabilities [n_rows, 2] (negative, positive)
+
+        Raises:
+            ValueError: If the ensemble is a regressor
+        """
+        if not self.is_classifier:
+            raise ValueError("predict_proba requires a classifier ensemble")
+        positive = self.predict(X)
+        return np.column_stack([1.0 - positive, positive])
+
+
+def _tree_depth(left: np.ndarray, right: np.ndarray) -> int:
+    """Maximum root-to-leaf depth of a tree given by child arrays."""
+    depth = 0
+    frontier = [0]
+    while True:
+        children = [c for n in frontier for c in (left[n], right[n]) if c >= 0]
+        if not children:
+            return depth
+        depth += 1
+        frontier = children
+
+
+def _tree_from_nodes(nodes: list[tuple[int, float, int, int, float]]) -> dict[str, np.ndarray]:
+    """Build tree arrays from (feature, threshold, left, right, value) tuples."""
+    feature, threshold, left, right, value = zip(*nodes)
+    return {
+        "feature": np.array(feature, dtype=np.int64),
+        "threshold": np.array(threshold, dtype=np.float64),
+        "left": np.array(left, dtype=np.int64),
+        "right": np.array(right, dtype=np.int64),
+        "value": np.array(value, dtype=np.float64),
+    }
+
+
+def _lightgbm_tree(structure: dict) -> dict[str, np.ndarray]:
+    """Flatten one nested LightGBM tree_structure (pre-order node ids)."""
+    nodes: list[tuple[int, float, int, int, float]] = []
+
+    def add(node: dict) -> int:
+        index = len(nodes)
+        if "leaf_value" in node:
+            nodes.append((0, np.inf, -1, -1, float(node["leaf_value"])))
+            return index
+        if node.get("decision_type", "<=") != "<=":
+            raise ValueError(f"Unsupported LightGBM split: {node.get('decision_type')}")
+        if node.get("missing_type", "None") == "Zero":
+            raise ValueError("LightGBM zero-as-missing splits are not supported")
+        nodes.append((int(node["split_feature"]), float(node["threshold"]), -1, -1, 0.0))
+        left = add(node["left_child"])
+        right = add(node["right_child"])
+        nodes[index] = (*nodes[index][:2], left, right, 0.0)
+        return index
+
+    add(structure)
+    return _tree_from_nodes(nodes)
+
+
+def _oblivious_tree(
+    splits: list[dict], leaf_values: list[float], flat_index: list[int]
+) -> dict[str, np.ndarray]:
+    """Expand one CatBoost oblivious tree into a full binary tree.
+
+    Every node at depth j tests split j; leaf index bit j is set when
+    x > border_j, so the expanded leaves keep CatBoost's leaf order.
+    """
+    if len(leaf_values) != 2 ** len(splits):
+        raise ValueError("Only single-dimension CatBoost models are supported")
+    for split in splits:
+        if split.get("split_type", "FloatFeature") != "FloatFeature":
+            raise ValueError(f"Unsupported CatBoost split: {split.get('split_type')}")
+
+    nodes: list[tuple[int, float, int, int, float]] = []
+
+    def add(level: int, leaf_index: int) -> int:
+        index = len(nodes)
+        if level == len(splits):
+            nodes.append((0, np.inf, -1, -1, float(leaf_values[leaf_index])))
+            return index
+        split = splits[level]
+        nodes.append((flat_index[split["float_feature_index"]], split["border"], -1, -1, 0.0))
+        left = add(level + 1, leaf_index)
+        right = add(level + 1, leaf_index | (1 << level))
+        nodes[index] = (*nodes[index][:2], left, right, 0.0)
+        return index
+
+    add(0, 0)
+    return _tree_from_nodes(nodes)
+
+
+def _logit(probability: float) -> float:
+    """Log-odds of a probability."""
+    return float(np.log(probability / (1.0 - probability)))
+
+
+def _compile_xgboost(model: Any) -> CompiledForest:
+    """Compile an XGBClassifier/XGBRegressor from its JSON model dump."""
+    learner = json.loads(model.get_booster().save_raw("json"))["learner"]
+    objective = learner["objective"]["name"]
+    if objective not in ("binary:logistic", "reg:squarederror"):
+        raise ValueError(f"Unsupported XGBoost objective: {objective}")
+
+    booster = learner["gradient_booster"]
+    if booster.get("name", "gbtree") != "gbtree":
+        raise ValueError(f"Unsupported XGBoost booster: {booster.get('name')}")
+
+    trees = []
+    for tree in booster["model"]["trees"]:
+        left = np.asarray(tree["left_children"], dtype=np.int64)
+        conditions = np.asarray(tree["split_conditions"], dtype=np.float32)
+        # x < t on float32 inputs is x <= (largest float32 below t)
+        below = np.nextafter(conditions, np.float32(-np.inf))
+        trees.append(
+            {
+                "feature": np.asarray(tree["split_indices"], dtype=np.int64),
+                "threshold": np.where(left < 0, np.inf, below).astype(np.float64),
+                "left": left,
+                "right": np.asarray(tree["right_children"], dtype=np.int64),
+                # Leaf values are stored in split_conditions
+                "value": np.where(left < 0, conditions, 0.0),
+            }
+        )
+
+    # base_score is a probability for logistic objectives; may be "[5E-1]"
+    base_score = float(str(learner["learner_model_param"]["base_score"]).strip("[]"))
+    is_classifier = objective == "binary:logistic"
+    return CompiledForest(
+        trees,
+        aggregate="sum",
+        base=_logit(base_score) if is_classifier else base_score,
+        link="logistic" if is_classifier else "identity",
+        input_dtype=np.float32,
+        is_classifier=is_classifier,
+    )
+
+
+def _compile_lightgbm(model: Any) -> CompiledForest:
+    """Compile an LGBMClassifier/LGBMRegressor from dump_model()."""
+    dump = model.booster_.dump_model()
+    objective = str(dump.get("objective", ""))
+    if objective.startswith("binary"):
+        is_classifier = True
+        sigmoid = 1.0
+        for part in objective.split():
+            if part.startswith("sigmoid:"):
+                sigmoid = float(part.split(":", 1)[1])
+    elif objective.startswith("regression"):
+        is_classifier, sigmoid = False, 1.0
+    else:
+        raise ValueError(f"Unsupported LightGBM objective: {objective}")
+
+    trees = [_lightgbm_tree(info["tree_structure"]) for info in dump["tree_info"]]
+
+    return CompiledForest(
+        trees,
+        aggregate="sum",
+        scale=sigmoid if is_classifier else 1.0,
+        link="logistic" if is_classifier else "identity",
+        input_dtype=np.float64,
+        is_classifier=is_classifier,
+    )
+
+
+def _compile_catboost(model: Any) -> CompiledForest:
+    """Compile a CatBoostClassifier/CatBoostRegressor from its JSON export."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "model.json"
+        model.save_model(str(path), format="json")
+        with open(path) as f:
+            dump = json.load(f)
+
+    if "oblivious_trees" not in dump:
+        raise ValueError("Only symmetric (oblivious) CatBoost trees are supported")
+
+    float_features = dump["features_info"].get("float_features", [])
+    flat_index = [f.get("flat_feature_index", f.get("feature_index")) for f in float_features]
+
+    trees = [
+        _oblivious_tree(tree.get("splits") or [], tree["leaf_values"], flat_index)
+        for tree in dump["oblivious_trees"]
+    ]
+
+    scale, bias = dump.get("scale_and_bias", [1.0, [0.0]])
+    bias = bias[0] if isinstance(bias, list) else bias
+    is_classifier = hasattr(model, "predict_proba")
+    return CompiledForest(
+        trees,
+        aggregate="sum",
+        base=bias,
+        scale=scale,
+        link="logistic" if is_classifier else "identity",
+        input_dtype=np.float32,
+        is_classifier=is_classifier,
+    )
+
+
+def _compile_sklearn_forest(model: Any) -> CompiledForest:
+    """Compile a RandomForestClassifier/RandomForestRegressor."""
+    is_classifier = hasattr(model, "predict_proba")
+    if is_classifier and len(model.classes_) != 2:
+        raise ValueError("Only binary random forest classifiers are supported")
+
+    trees = []
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        if is_classifier:
+            # Class weights per leaf; normalize to the positive-class fraction
+            counts = tree.value[:, 0, :]
+            value = counts[:, 1] / np.maximum(counts.sum(axis=1), np.finfo(float).tiny)
+        else:
+            value = tree.value[:, 0, 0]
+        trees.append(
+            {
+                "feature": tree.feature,
+                "threshold": tree.threshold,
+                "left": tree.children_left,
+                "right": tree.children_right,
+                "value": value,
+            }
+        )
+
+    return CompiledForest(
+        trees,
+        aggregate="mean",
+        link="identity",
+        input_dtype=np.float32,
+        is_classifier=is_classifier,
+    )
+
+
+# Compiler per estimator module prefix (checked without importing the library)
+_COMPILERS = {
+    "xgboost": _compile_xgboost,
+    "lightgbm": _compile_lightgbm,
+    "catboost": _compile_catboost,
+    "sklearn.ensemble._forest": _compile_sklearn_forest,
+}
+
+
+def compile_forest(model: Any) -> CompiledForest:
+    """Flatten a trained tree ensemble into a CompiledForest.
+
+    Args:
+        model: Trained XGBoost, LightGBM, CatBoost or scikit-learn random
+            forest estimator (binary classifier or regressor)
+
+    Returns:
+        Compiled ensemble
+
+    Raises:
+        ValueError: If the model type or configuration is not supported
+    """
+    module = type(model).__module__
+    for prefix, compiler in _COMPILERS.items():
+        if module.startswith(prefix):
+            compiled = compiler(model)
+            logger.info(
+                f"Compiled {type(model).__name__}: {compiled.n_trees} trees, "
+                f"{len(compiled.feature)} nodes, depth {compiled.depth}"
+            )
+            return compiled
+    raise ValueError(f"Cannot compile {type(model).__name__}: not a supported tree ensemble")
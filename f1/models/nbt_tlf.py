@@ -16,6 +16,8 @@ import torch.nn as nn
 import torch.optim as optim
 from torch.utils.data import DataLoader, Dataset
 
+from f1.models.nbt_tlf_numpy import NUMPY_ARTIFACT, encode_drivers, input_segments
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -47,7 +49,13 @@ class SinusoidalPositionalEncoding(nn.Module):
 
 
 class NBTTLFModel(nn.Module):
-    """Neural Bradley-Terry with Temporal Latent Factors model."""
+    """Neural Bradley-Terry with Temporal Latent Factors model.
+
+    At inference (eval mode, gradients disabled) compute_score replaces the
+    first Linear layer by cached per-component projections, as NumpyNBTTLF
+    does: W_driver @ emb for every driver, and so on. The cache is built on
+    first use and dropped by train(), load_state_dict() and device moves.
+    """
 
     def __init__(
         self,
@@ -80,6 +88,7 @@ class NBTTLFModel(nn.Module):
         self.embed_dim = embed_dim
         self.hidden_dim = hidden_dim
         self.temporal_dim = temporal_dim
+        self.numeric_features_dim = numeric_features_dim
 
         # Embeddings
         self.driver_embedding = nn.Embedding(n_drivers, embed_dim)
@@ -104,13 +113,16 @@ class NBTTLFModel(nn.Module):
         # Initialize embeddings
         self._init_embeddings()
 
+        # First-layer projections for inference (see _first_layer_projections)
+        self._projections: Optional[dict[str, torch.Tensor]] = None
+
     def _init_embeddings(self):
         """Initialize embeddings with small random values."""
         nn.init.normal_(self.driver_embedding.weight, mean=0, std=0.1)
         nn.init.normal_(self.constructor_embedding.weight, mean=0, std=0.1)
         nn.init.normal_(self.track_embedding.weight, mean=0, std=0.1)
 
-    def compute_score(
+    def score_inputs(
         self,
         driver_idx: torch.Tensor,
         constructor_idx: torch.Tensor,
@@ -118,7 +130,7 @@ class NBTTLFModel(nn.Module):
         race_idx: torch.Tensor,
         numeric_features: Optional[torch.Tensor] = None,
     ) -> torch.Tensor:
-        """Compute score for a driver-constructor-track-time combination.
+        """Build the score network input for a batch.
 
         Args:
             driver_idx: Driver indices [batch_size]
@@ -128,7 +140,7 @@ class NBTTLFModel(nn.Module):
             numeric_features: Optional numeric features [batch_size, num_features]
 
         Returns:
-            Scores [batch_size, 1]
+            Concatenated inputs [batch_size, input_dim], laid out as in input_segments
         """
         # Get embeddings
         driver_emb = self.driver_embedding(driver_idx)
@@ -143,10 +155,126 @@ class NBTTLFModel(nn.Module):
         if numeric_features is not None:
             features.append(numeric_features)
 
-        combined = torch.cat(features, dim=1)
+        return torch.cat(features, dim=1)
+
+    def train(self, mode: bool = True) -> "NBTTLFModel":
+        """Set training mode; entering training drops the projection cache."""
+        if mode:
+            self._projections = None
+        return super().train(mode)
+
+    def load_state_dict(self, state_dict, strict: bool = True, assign: bool = False):
+        """Load parameters and drop the projection cache."""
+        self._projections = None
+        return super().load_state_dict(state_dict, strict=strict, assign=assign)
+
+    def _apply(self, fn, *args, **kwargs):
+        # Device and dtype moves (to, cpu, half, ...) invalidate cached tensors
+        self._projections = None
+        return super()._apply(fn, *args, **kwargs)
+
+    def _first_layer_projections(self) -> dict[str, torch.Tensor]:
+        """Each component's projection through the first Linear layer, cached.
+
+        Returns:
+            Driver/constructor/track/temporal projection tables
+            [table_size, hidden_dim], with the first layer's bias folded into
+            the temporal table, and the numeric weights [numeric_dim, hidden_dim]
+        """
+        if self._projections is None:
+            first: nn.Linear = self.score_network[0]  # type: ignore[assignment]
+            weight_t = first.weight.detach().T
+            segments = self.input_segments()
+            pe: torch.Tensor = self.temporal_encoding.pe  # type: ignore[assignment]
+
+            def project(table: torch.Tensor, segment: str) -> torch.Tensor:
+                return table.detach() @ weight_t[segments[segment]]
+
+            self._projections = {
+                "driver": project(self.driver_embedding.weight, "driver_embedding"),
+                "constructor": project(self.constructor_embedding.weight, "constructor_embedding"),
+                "track": project(self.track_embedding.weight, "track_embedding"),
+                "temporal": project(pe, "temporal_encoding") + first.bias.detach(),
+                "numeric": weight_t[3 * self.embed_dim + self.temporal_dim :],
+            }
+        return self._projections
+
+    def input_segments(self, numeric_names: Optional[list[str]] = None) -> dict[str, slice]:
+        """Column ranges of each component in the score network input.
+
+        Args:
+            numeric_names: Names of the numeric features (default numeric_0, ...)
+
+        Returns:
+            Mapping of component name to its columns in score_inputs' output
+        """
+        return input_segments(
+            self.embed_dim, self.temporal_dim, self.numeric_features_dim, numeric_names
+        )
+
+    def neutral_input(self) -> torch.Tensor:
+        """Score network input of an "average" entry, used as ablation baseline.
+
+        Embeddings are the mean over each table, the temporal encoding the
+        mean over all positions, and numeric (delta) features zero.
+
+        Returns:
+            Neutral input [input_dim]
+        """
+        pe: torch.Tensor = self.temporal_encoding.pe  # type: ignore[assignment]
+        return torch.cat(
+            [
+                self.driver_embedding.weight.mean(dim=0),
+                self.constructor_embedding.weight.mean(dim=0),
+                self.track_embedding.weight.mean(dim=0),
+                pe.mean(dim=0),
+                torch.zeros(self.numeric_features_dim, dtype=pe.dtype, device=pe.device),
+            ]
+        )
+
+    def compute_score(
+        self,
+        driver_idx: torch.Tensor,
+        constructor_idx: torch.Tensor,
+        track_idx: torch.Tensor,
+        race_idx: torch.Tensor,
+        numeric_features: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        """Compute score for a driver-constructor-track-time combination.
+
+        In eval mode with gradients disabled, the first layer is four cached
+        projection lookups and a sum; otherwise the full network runs so
+        gradients reach the embeddings.
+
+        Args:
+            driver_idx: Driver indices [batch_size]
+            constructor_idx: Constructor indices [batch_size]
+            track_idx: Track indices [batch_size]
+            race_idx: Race indices for temporal encoding [batch_size]
+            numeric_features: Optional numeric features [batch_size, num_features]
 
-        # Compute score
-        score: torch.Tensor = self.score_network(combined)
+        Returns:
+            Scores [batch_size, 1]
+        """
+        if self.training or torch.is_grad_enabled():
+            combined = self.score_inputs(
+                driver_idx, constructor_idx, track_idx, race_idx, numeric_features
+            )
+            score: torch.Tensor = self.score_network(combined)
+            return score
+
+        projections = self._first_layer_projections()
+        first_layer = (
+            projections["driver"][driver_idx]
+            + projections["constructor"][constructor_idx]
+            + projections["track"][track_idx]
+            + projections["temporal"][race_idx.long()]
+        )
+        if numeric_features is not None and self.numeric_features_dim:
+            first_layer = first_layer + numeric_features @ projections["numeric"]
+
+        # Remaining layers: ReLU, Dropout (identity in eval), Linear, ...
+        score = self.score_network[1:](first_layer)
         return score
 
     def forward(
@@ -391,6 +519,9 @@ class NBTTLFTrainer:
         torch.save(self.model.state_dict(), model_path)
         logger.info(f"Model saved to {model_path}")
 
+        # Export inference arrays for torch-free serving
+        export_numpy(self.model, save_dir / NUMPY_ARTIFACT)
+
         # Save config
         config_path = save_dir / "config.json"
         with open(config_path, "w") as f:
@@ -428,6 +559,93 @@ class NBTTLFTrainer:
         return trainer, config
 
 
+def export_numpy(model: NBTTLFModel, path: Path) -> Path:
+    """Export the arrays needed for inference as a compressed .npz.
+
+    Writes the three embedding tables, the positional-encoding table and
+    the weights and biases of each Linear layer of the score network, all
+    float32. NumpyNBTTLF.load reads the file without importing torch.
+
+    Args:
+        model: Trained NBT-TLF model
+        path: Output path (conventionally <model dir>/model.npz)
+
+    Returns:
+        The path written
+    """
+    linears = [layer for layer in model.score_network if isinstance(layer, nn.Linear)]
+    pe: torch.Tensor = model.temporal_encoding.pe  # type: ignore[assignment]
+
+    def array(tensor: torch.Tensor) -> np.ndarray:
+        return tensor.detach().cpu().numpy().astype(np.float32)
+
+    arrays = {
+        "driver_embedding": array(model.driver_embedding.weight),
+        "constructor_embedding": array(model.constructor_embedding.weight),
+        "track_embedding": array(model.track_embedding.weight),
+        "pe": array(pe),
+        "n_layers": np.array(len(linears)),
+        "numeric_features_dim": np.array(model.numeric_features_dim),
+    }
+    for i, layer in enumerate(linears):
+        arrays[f"linear_{i}_weight"] = array(layer.weight)
+        arrays[f"linear_{i}_bias"] = array(layer.bias)
+
+    path = Path(path)
+    np.savez_compressed(path, **arrays)
+    logger.info(f"NumPy export saved to {path}")
+    return path
+
+
+def score_drivers(
+    model: NBTTLFModel,
+    race_df: pd.DataFrame,
+    driver_to_idx: dict[str, int],
+    constructor_to_idx: dict[str, int],
+    track_to_idx: dict[str, int],
+    numeric_feature_cols: Optional[list[str]] = None,
+    device: str = "cpu",
+) -> np.ndarray:
+    """Score every driver row in one batched forward pass.
+
+    Args:
+        model: Trained NBT-TLF model
+        race_df: Driver rows of one or more races
+        driver_to_idx: Driver name to index mapping
+        constructor_to_idx: Constructor name to index mapping
+        track_to_idx: Track name to index mapping
+        numeric_feature_cols: Columns feeding the numeric input, in order
+        device: Device to run on
+
+    Returns:
+        Scores, one per row of race_df
+    """
+    inputs = encode_drivers(
+        race_df,
+        driver_to_idx,
+        constructor_to_idx,
+        track_to_idx,
+        numeric_feature_cols,
+        model.numeric_features_dim,
+    )
+
+    model.eval()
+    with torch.no_grad():
+        scores = model.compute_score(
+            torch.as_tensor(inputs["driver"], dtype=torch.long, device=device),
+            torch.as_tensor(inputs["constructor"], dtype=torch.long, device=device),
+            torch.as_tensor(inputs["track"], dtype=torch.long, device=device),
+            torch.as_tensor(inputs["race"], dtype=torch.long, device=device),
+            (
+                torch.as_tensor(inputs["numeric"], device=device)
+                if inputs["numeric"] is not None
+                else None
+            ),
+        )
+
+    return scores.reshape(-1).cpu().numpy()
+
+
 def predict_race(
     model: NBTTLFModel,
     race_df: pd.DataFrame,
@@ -435,6 +653,7 @@ def predict_race(
     constructor_to_idx: dict[str, int],
     track_to_idx: dict[str, int],
     device: str = "cpu",
+    numeric_feature_cols: Optional[list[str]] = None,
 ) -> pd.DataFrame:
     """Predict win and podium probabilities for a race.
 
@@ -445,34 +664,23 @@ def predict_race(
         constructor_to_idx: Constructor name to index mapping
         track_to_idx: Track name to index mapping
         device: Device to run on
+        numeric_feature_cols: Columns feeding the numeric input, in order
 
     Returns:
         DataFrame with predictions
     """
-    model.eval()
-    predictions = []
-
-    with torch.no_grad():
-        for _, row in race_df.iterrows():
-            driver_idx = driver_to_idx.get(row["driver_id"], 0)
-            constructor_idx = constructor_to_idx.get(row["team"], 0)
-            track_idx = track_to_idx.get(row["track_id"], 0)
-            race_idx = int(row["season"] * 100 + row["round"])
-
-            # Compute score
-            score = model.compute_score(
-                torch.tensor([driver_idx], dtype=torch.long).to(device),
-                torch.tensor([constructor_idx], dtype=torch.long).to(device),
-                torch.tensor([track_idx], dtype=torch.long).to(device),
-                torch.tensor([race_idx], dtype=torch.long).to(device),
-            )
-
-            predictions.append({"driver_id": row["driver_id"], "score": score.item()})
-
-    pred_df = pd.DataFrame(predictions)
+    scores = score_drivers(
+        model,
+        race_df,
+        driver_to_idx,
+        constructor_to_idx,
+        track_to_idx,
+        numeric_feature_cols=numeric_feature_cols,
+        device=device,
+    )
+    pred_df = pd.DataFrame({"driver_id": race_df["driver_id"].to_numpy(), "score": scores})
 
     # Convert scores to probabilities via softmax
-    scores = np.asarray(pred_df["score"].values)
     exp_scores = np.exp(scores - scores.max())
     win_probs = exp_scores / exp_scores.sum()
     podium_probs = np.minimum(win_probs * 3, 0.95)  # Heuristic
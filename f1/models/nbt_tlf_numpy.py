@@ -0,0 +1,392 @@
+"""Torch-free NumPy inference for exported NBT-TLF models.
+
+Serving NBT-TLF needs three embedding lookups, a positional-encoding row
+lookup and a small ReLU MLP. NBTTLFTrainer.save exports exactly those
+arrays to ``model.npz`` (see nbt_tlf.export_numpy); NumpyNBTTLF loads them
+and reproduces the torch model's scores in float32 without importing torch.
+
+This module must not import torch: the registry loads it in API workers so
+that they never pay torch's import time and memory.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# File name of the exported arrays inside an NBT-TLF model directory
+NUMPY_ARTIFACT = "model.npz"
+
+
+def input_segments(
+    embed_dim: int,
+    temporal_dim: int,
+    numeric_features_dim: int,
+    numeric_names: Optional[list[str]] = None,
+) -> dict[str, slice]:
+    """Column ranges of each component in the score network input.
+
+    Args:
+        embed_dim: Entity embedding dimension
+        temporal_dim: Temporal encoding dimension
+        numeric_features_dim: Number of numeric features
+        numeric_names: Names of the numeric features (default numeric_0, ...)
+
+    Returns:
+        Mapping of component name to its columns in the score network input
+    """
+    embed, temporal = embed_dim, temporal_dim
+    segments = {
+        "driver_embedding": slice(0, embed),
+        "constructor_embedding": slice(embed, 2 * embed),
+        "track_embedding": slice(2 * embed, 3 * embed),
+        "temporal_encoding": slice(3 * embed, 3 * embed + temporal),
+    }
+
+    offset = 3 * embed + temporal
+    names = list(numeric_names or [])
+    names += [f"numeric_{j}" for j in range(len(names), numeric_features_dim)]
+    for j, name in enumerate(names[:numeric_features_dim]):
+        segments[name] = slice(offset + j, offset + j + 1)
+    return segments
+
+
+def encode_drivers(
+    race_df: pd.DataFrame,
+    driver_to_idx: dict[str, int],
+    constructor_to_idx: dict[str, int],
+    track_to_idx: dict[str, int],
+    numeric_feature_cols: Optional[list[str]] = None,
+    numeric_features_dim: int = 0,
+) -> dict[str, Optional[np.ndarray]]:
+    """Encode driver rows as model input arrays.
+
+    Unknown drivers, constructors and tracks map to index 0. The race index
+    for the temporal encoding is season * 100 + round, as in training.
+
+    Args:
+        race_df: Driver rows of one or more races
+        driver_to_idx: Driver name to index mapping
+        constructor_to_idx: Constructor name to index mapping
+        track_to_idx: Track name to index mapping
+        numeric_feature_cols: Columns feeding the numeric input, in order
+        numeric_features_dim: Width of the model's numeric input (0 = none);
+            columns that are missing or not named are zero
+
+    Returns:
+        Dict with driver, constructor, track and race index arrays, and the
+        numeric feature matrix (None if the model has no numeric input)
+    """
+    n_rows = len(race_df)
+
+    def column(name: str, default) -> pd.Series:
+        if name in race_df.columns:
+            return race_df[name]
+        return pd.Series([default] * n_rows, index=race_df.index)
+
+    numeric = None
+    if numeric_features_dim:
+        numeric = np.zeros((n_rows, numeric_features_dim), dtype=np.float32)
+        for j, col in enumerate((numeric_feature_cols or [])[:numeric_features_dim]):
+            if col in race_df.columns:
+                numeric[:, j] = race_df[col].fillna(0).to_numpy(dtype=np.float32)
+
+    return {
+        "driver": column("driver_id", "").map(lambda d: driver_to_idx.get(d, 0)).to_numpy(),
+        "constructor": column("team", "").map(lambda t: constructor_to_idx.get(t, 0)).to_numpy(),
+        "track": column("track_id", "").map(lambda t: track_to_idx.get(t, 0)).to_numpy(),
+        "race": (column("season", 2024) * 100 + column("round", 1)).astype(int).to_numpy(),
+        "numeric": numeric,
+    }
+
+
+class NumpyNBTTLF:
+    """NBT-TLF scorer over exported float32 arrays.
+
+    Mirrors the inference API of NBTTLFModel (score_inputs, score_network,
+    compute_score, input_segments, neutral_input) with NumPy arrays in
+    place of tensors. Dropout is the identity at inference and is skipped.
+
+    The first Linear layer acts on the concatenation of the driver,
+    constructor, track and temporal inputs, so its output is a sum of
+    per-component projections. These are precomputed once per table
+    (W_driver @ emb for every driver, and so on), and compute_score and
+    score_grid replace the first matmul by four row lookups and a sum.
+    """
+
+    def __init__(
+        self,
+        driver_embedding: np.ndarray,
+        constructor_embedding: np.ndarray,
+        track_embedding: np.ndarray,
+        pe: np.ndarray,
+        layers: list[tuple[np.ndarray, np.ndarray]],
+        numeric_features_dim: int = 0,
+    ):
+        """Initialize from exported arrays.
+
+        Args:
+            driver_embedding: Driver embedding table [n_drivers, embed_dim]
+            constructor_embedding: Constructor embedding table [n_constructors, embed_dim]
+            track_embedding: Track embedding table [n_tracks, embed_dim]
+            pe: Positional encoding table [max_len, temporal_dim]
+            layers: (weight [out, in], bias [out]) of each Linear layer, in
+                order; ReLU follows every layer but the last
+            numeric_features_dim: Number of numeric delta features
+        """
+        self.driver_embedding = driver_embedding
+        self.constructor_embedding = constructor_embedding
+        self.track_embedding = track_embedding
+        self.pe = pe
+        # Pre-transpose so each layer is x @ weight_t + bias
+        self.layers = [(np.ascontiguousarray(w.T), b) for w, b in layers]
+        self.embed_dim = driver_embedding.shape[1]
+        self.temporal_dim = pe.shape[1]
+        self.numeric_features_dim = numeric_features_dim
+        self._factorize_first_layer()
+
+    def _factorize_first_layer(self) -> None:
+        """Cache each component's projection through the first Linear layer.
+
+        Sets driver/constructor/track/temporal projection tables
+        [table_size, hidden_dim], with the first layer's bias folded into the
+        temporal table, and the numeric weights [numeric_dim, hidden_dim].
+        """
+        weight_t, bias = self.layers[0]
+        segments = self.input_segments()
+
+        def project(table: np.ndarray, segment: str) -> np.ndarray:
+            return np.ascontiguousarray(table @ weight_t[segments[segment]])
+
+        self.driver_projection = project(self.driver_embedding, "driver_embedding")
+        self.constructor_projection = project(self.constructor_embedding, "constructor_embedding")
+        self.track_projection = project(self.track_embedding, "track_embedding")
+        self.temporal_projection = project(self.pe, "temporal_encoding") + bias
+        self.numeric_projection = weight_t[3 * self.embed_dim + self.temporal_dim :]
+
+    def _score_from_first_layer(self, first_layer: np.ndarray) -> np.ndarray:
+        """Run the layers after the first on first-layer pre-activations.
+
+        Args:
+            first_layer: First Linear layer outputs [..., hidden_dim]
+
+        Returns:
+            Scores [..., 1]
+        """
+        hidden = np.maximum(first_layer, 0.0)
+        last = len(self.layers) - 1
+        for i, (weight_t, bias) in enumerate(self.layers[1:], start=1):
+            hidden = hidden @ weight_t + bias
+            if i < last:
+                np.maximum(hidden, 0.0, out=hidden)
+        return hidden
+
+    @classmethod
+    def load(cls, path: Path) -> "NumpyNBTTLF":
+        """Load an exported model.
+
+        Args:
+            path: Path to model.npz
+
+        Returns:
+            Loaded scorer
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"NBT-TLF export not found: {path}")
+
+        with np.load(path) as arrays:
+            n_layers = int(arrays["n_layers"])
+            model = cls(
+                driver_embedding=arrays["driver_embedding"],
+                constructor_embedding=arrays["constructor_embedding"],
+                track_embedding=arrays["track_embedding"],
+                pe=arrays["pe"],
+                layers=[
+                    (arrays[f"linear_{i}_weight"], arrays[f"linear_{i}_bias"])
+                    for i in range(n_layers)
+                ],
+                numeric_features_dim=int(arrays["numeric_features_dim"]),
+            )
+
+        logger.info(f"Loaded NumPy NBT-TLF model from {path}")
+        return model
+
+    def score_inputs(
+        self,
+        driver_idx: np.ndarray,
+        constructor_idx: np.ndarray,
+        track_idx: np.ndarray,
+        race_idx: np.ndarray,
+        numeric_features: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Build the score network input for a batch.
+
+        Args:
+            driver_idx: Driver indices [batch_size]
+            constructor_idx: Constructor indices [batch_size]
+            track_idx: Track indices [batch_size]
+            race_idx: Race indices for temporal encoding [batch_size]
+            numeric_features: Optional numeric features [batch_size, num_features]
+
+        Returns:
+            Concatenated inputs [batch_size, input_dim], laid out as in input_segments
+        """
+        features = [
+            self.driver_embedding[np.asarray(driver_idx, dtype=np.int64)],
+            self.constructor_embedding[np.asarray(constructor_idx, dtype=np.int64)],
+            self.track_embedding[np.asarray(track_idx, dtype=np.int64)],
+            self.pe[np.asarray(race_idx, dtype=np.int64)],
+        ]
+        if numeric_features is not None:
+            features.append(np.asarray(numeric_features, dtype=np.float32))
+
+        return np.concatenate(features, axis=1)
+
+    def score_network(self, inputs: np.ndarray) -> np.ndarray:
+        """Run the score MLP.
+
+        Args:
+            inputs: Score network inputs [batch_size, input_dim]
+
+        Returns:
+            Scores [batch_size, 1]
+        """
+        weight_t, bias = self.layers[0]
+        return self._score_from_first_layer(np.asarray(inputs, dtype=np.float32) @ weight_t + bias)
+
+    def compute_score(
+        self,
+        driver_idx: np.ndarray,
+        constructor_idx: np.ndarray,
+        track_idx: np.ndarray,
+        race_idx: np.ndarray,
+        numeric_features: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Compute scores for driver-constructor-track-time combinations.
+
+        Uses the cached first-layer projections; equal to
+        score_network(score_inputs(...)) up to float rounding.
+
+        Args:
+            driver_idx: Driver indices [batch_size]
+            constructor_idx: Constructor indices [batch_size]
+            track_idx: Track indices [batch_size]
+            race_idx: Race indices for temporal encoding [batch_size]
+            numeric_features: Optional numeric features [batch_size, num_features]
+
+        Returns:
+            Scores [batch_size, 1]
+        """
+        first_layer = (
+            self.driver_projection[np.asarray(driver_idx, dtype=np.int64)]
+            + self.constructor_projection[np.asarray(constructor_idx, dtype=np.int64)]
+            + self.track_projection[np.asarray(track_idx, dtype=np.int64)]
+            + self.temporal_projection[np.asarray(race_idx, dtype=np.int64)]
+        )
+        if numeric_features is not None and self.numeric_features_dim:
+            first_layer += np.asarray(numeric_features, dtype=np.float32) @ self.numeric_projection
+        return self._score_from_first_layer(first_layer)
+
+    def score_grid(
+        self,
+        driver_idx: np.ndarray,
+        constructor_idx: np.ndarray,
+        track_idx: np.ndarray,
+        race_idx: int,
+    ) -> np.ndarray:
+        """Score every driver x constructor x track combination at one race index.
+
+        Numeric (delta) features are taken as zero, i.e. neutral. The first
+        layer is a broadcast sum of cached projections, so the cost is
+        dominated by the small later layers.
+
+        Args:
+            driver_idx: Driver indices [n_drivers]
+            constructor_idx: Constructor indices [n_constructors]
+            track_idx: Track indices [n_tracks]
+            race_idx: Race index for the temporal encoding
+
+        Returns:
+            Scores [n_drivers, n_constructors, n_tracks]
+        """
+        first_layer = (
+            self.driver_projection[np.asarray(driver_idx, dtype=np.int64)][:, None, None, :]
+            + self.constructor_projection[np.asarray(constructor_idx, dtype=np.int64)][
+                None, :, None, :
+            ]
+            + self.track_projection[np.asarray(track_idx, dtype=np.int64)][None, None, :, :]
+            + self.temporal_projection[int(race_idx)]
+        )
+        return self._score_from_first_layer(first_layer)[..., 0]
+
+    def input_segments(self, numeric_names: Optional[list[str]] = None) -> dict[str, slice]:
+        """Column ranges of each component in the score network input.
+
+        Args:
+            numeric_names: Names of the numeric features (default numeric_0, ...)
+
+        Returns:
+            Mapping of component name to its columns in score_inputs' output
+        """
+        return input_segments(
+            self.embed_dim, self.temporal_dim, self.numeric_features_dim, numeric_names
+        )
+
+    def neutral_input(self) -> np.ndarray:
+        """Score network input of an "average" entry (see NBTTLFModel.neutral_input).
+
+        Returns:
+            Neutral input [input_dim]
+        """
+        return np.concatenate(
+            [
+                self.driver_embedding.mean(axis=0),
+                self.constructor_embedding.mean(axis=0),
+                self.track_embedding.mean(axis=0),
+                self.pe.mean(axis=0),
+                np.zeros(self.numeric_features_dim, dtype=np.float32),
+            ]
+        ).astype(np.float32)
+
+
+def score_drivers(
+    model: NumpyNBTTLF,
+    race_df: pd.DataFrame,
+    driver_to_idx: dict[str, int],
+    constructor_to_idx: dict[str, int],
+    track_to_idx: dict[str, int],
+    numeric_feature_cols: Optional[list[str]] = None,
+) -> np.ndarray:
+    """Score every driver row in one batched pass.
+
+    Args:
+        model: Exported NBT-TLF model
+        race_df: Driver rows of one or more races
+        driver_to_idx: Driver name to index mapping
+        constructor_to_idx: Constructor name to index mapping
+        track_to_idx: Track name to index mapping
+        numeric_feature_cols: Columns feeding the numeric input, in order
+
+    Returns:
+        Scores, one per row of race_df
+    """
+    inputs = encode_drivers(
+        race_df,
+        driver_to_idx,
+        constructor_to_idx,
+        track_to_idx,
+        numeric_feature_cols,
+        model.numeric_features_dim,
+    )
+    scores = model.compute_score(
+        inputs["driver"], inputs["constructor"], inputs["track"], inputs["race"], inputs["numeric"]
+    )
+    return scores.reshape(-1)
@@ -4,26 +4,44 @@ Provides unified access to all F1 prediction models:
 - Baselines: quali_freq, elo
 - Zoo: xgb, lgbm, cat, lr, rf
 - Custom: nbt_tlf
+
+Heavy frameworks are imported per model type on first use: torch when an
+NBT-TLF model without a NumPy export (model.npz) is loaded or a non-CPU
+device is requested, xgboost/lightgbm/catboost when joblib unpickles a
+model of that type, and sklearn/scipy (via f1.evaluation.calibration) when
+predictions are first calibrated. Importing this module (and so the API)
+pulls in none of them. Tree models (xgb, lgbm, cat, rf) are compiled to flat NumPy arrays
+at load time and served by f1.models.compiled_trees unless the native
+backend is requested.
 """
 
+import hashlib
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 import joblib
 import numpy as np
 import pandas as pd
-import torch
 
-from f1.evaluation.calibration import calibrate_nbt_tlf_scores, calibrate_tree_model_predictions
 from f1.models.baselines import BaselineModel
-from f1.models.nbt_tlf import NBTTLFTrainer
+from f1.models.compiled_trees import compile_forest
+from f1.models.nbt_tlf_numpy import NUMPY_ARTIFACT, NumpyNBTTLF
+from f1.profiling import stage
 from f1.schemas import PredictionResponse
 
 logger = logging.getLogger(__name__)
 
+# Callable (model_name, model_dir, task) -> model info dict, as returned by
+# ModelRegistry.load_model. Lets callers put a cache in front of disk loads.
+ModelProvider = Callable[[str, Path, str], dict[str, Any]]
+
+# Model types whose raw per-driver outputs depend only on the driver's own
+# row, so a single changed row can be re-scored on its own (see score_frame)
+ROW_INDEPENDENT_TYPES = ("zoo", "nbt_tlf")
+
 
 class ModelRegistry:
     """Registry for all F1 prediction models."""
@@ -32,6 +50,12 @@ class ModelRegistry:
     ZOO_MODELS = ["xgb", "lgbm", "cat", "lr", "rf"]
     CUSTOM_MODELS = ["nbt_tlf"]
 
+    # Zoo models that can run on the compiled flat-array backend
+    TREE_MODELS = ["xgb", "lgbm", "cat", "rf"]
+    # Inference backends for tree models: compiled (f1.models.compiled_trees) or
+    # the library's own predict
+    TREE_BACKENDS = ["compiled", "native"]
+
     @classmethod
     def get_all_models(cls) -> list[str]:
         """Return list of all supported model names.
@@ -55,7 +79,12 @@ class ModelRegistry:
 
     @classmethod
     def load_model(
-        cls, model_name: str, model_dir: Path, task: str = "win", device: str = "cpu"
+        cls,
+        model_name: str,
+        model_dir: Path,
+        task: str = "win",
+        device: str = "cpu",
+        tree_backend: str = "compiled",
     ) -> dict[str, Any]:
         """Load model by name from directory.
 
@@ -64,18 +93,23 @@ class ModelRegistry:
             model_dir: Directory containing models
             task: Task type for zoo models (win/podium/expected_finish)
             device: Device for PyTorch models (cpu/cuda)
+            tree_backend: Inference backend for tree models (see TREE_BACKENDS)
 
         Returns:
             Dictionary with 'model' and optional 'metadata'
 
         Raises:
-            ValueError: If model name is invalid
+            ValueError: If model name or tree backend is invalid
             FileNotFoundError: If model file not found
         """
         if not cls.is_valid_model(model_name):
             raise ValueError(
                 f"Invalid model name: {model_name}. Valid models: {cls.get_all_models()}"
             )
+        if tree_backend not in cls.TREE_BACKENDS:
+            raise ValueError(
+                f"Invalid tree backend: {tree_backend}. Valid backends: {cls.TREE_BACKENDS}"
+            )
 
         model_dir = Path(model_dir)
 
@@ -85,7 +119,7 @@ class ModelRegistry:
 
         # Load zoo models
         elif model_name in cls.ZOO_MODELS:
-            return cls._load_zoo_model(model_name, task, model_dir)
+            return cls._load_zoo_model(model_name, task, model_dir, tree_backend)
 
         # Load NBT-TLF
         elif model_name == "nbt_tlf":
@@ -94,6 +128,84 @@ class ModelRegistry:
         else:
             raise ValueError(f"Unsupported model: {model_name}")
 
+    @classmethod
+    def artifact_paths(cls, model_name: str, model_dir: Path, task: str = "win") -> list[Path]:
+        """Return the on-disk files that make up a model artifact.
+
+        Args:
+            model_name: Name of model
+            model_dir: Directory containing models
+            task: Task type for zoo models
+
+        Returns:
+            List of artifact file paths (existing or not)
+
+        Raises:
+            ValueError: If model name is invalid
+        """
+        if not cls.is_valid_model(model_name):
+            raise ValueError(
+                f"Invalid model name: {model_name}. Valid models: {cls.get_all_models()}"
+            )
+
+        model_dir = Path(model_dir)
+
+        if model_name in cls.BASELINES:
+            return [model_dir / f"{model_name}.joblib"]
+
+        if model_name in cls.ZOO_MODELS:
+            model_subdir = model_dir / model_name
+            return [
+                model_subdir / f"{model_name}_{task}.joblib",
+                model_subdir / f"{model_name}_{task}_metadata.json",
+            ]
+
+        nbt_tlf_dir = model_dir / "nbt_tlf"
+        return [
+            nbt_tlf_dir / "model.pt",
+            nbt_tlf_dir / NUMPY_ARTIFACT,
+            nbt_tlf_dir / "config.json",
+        ]
+
+    @classmethod
+    def artifact_fingerprint(
+        cls, model_name: str, model_dir: Path, task: str = "win"
+    ) -> tuple[str, int]:
+        """Fingerprint a model artifact from file metadata.
+
+        Uses (mtime, size) of each artifact file, so it is cheap to compute and
+        changes whenever a model is retrained and saved.
+
+        Args:
+            model_name: Name of model
+            model_dir: Directory containing models
+            task: Task type for zoo models
+
+        Returns:
+            Tuple of (fingerprint hex digest, total artifact size in bytes)
+
+        Raises:
+            FileNotFoundError: If no artifact file exists
+        """
+        digest = hashlib.sha256()
+        total_size = 0
+        found = False
+
+        for path in cls.artifact_paths(model_name, model_dir, task):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                digest.update(f"{path.name}:missing".encode())
+                continue
+            found = True
+            total_size += stat.st_size
+            digest.update(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+
+        if not found:
+            raise FileNotFoundError(f"Model not found: {model_name} ({task}) in {model_dir}")
+
+        return digest.hexdigest()[:16], total_size
+
     @classmethod
     def _load_baseline(cls, model_name: str, model_dir: Path) -> dict[str, Any]:
         """Load baseline model.
@@ -116,16 +228,25 @@ class ModelRegistry:
         return {"model": model, "type": "baseline"}
 
     @classmethod
-    def _load_zoo_model(cls, model_name: str, task: str, model_dir: Path) -> dict[str, Any]:
+    def _load_zoo_model(
+        cls, model_name: str, task: str, model_dir: Path, tree_backend: str = "compiled"
+    ) -> dict[str, Any]:
         """Load zoo model (xgb, lgbm, cat, lr, rf).
 
+        Tree models are compiled to flat arrays for inference unless
+        tree_backend is "native"; a model that cannot be compiled falls
+        back to its library's predict. The native model is always kept
+        (SHAP explanations need it).
+
         Args:
             model_name: Zoo model name
             task: Task type
             model_dir: Model directory
+            tree_backend: Inference backend for tree models
 
         Returns:
-            Dict with loaded model and metadata
+            Dict with loaded model, metadata, engine ("compiled" or
+            "native") and the compiled ensemble (or None)
         """
         model_subdir = model_dir / model_name
         model_path = model_subdir / f"{model_name}_{task}.joblib"
@@ -143,30 +264,70 @@ class ModelRegistry:
             with open(metadata_path) as f:
                 metadata = json.load(f)
 
+        compiled = None
+        if tree_backend == "compiled" and model_name in cls.TREE_MODELS:
+            try:
+                compiled = compile_forest(model)
+            except Exception as e:
+                # Any dump-format surprise must not stop the model from serving
+                logger.warning(
+                    f"Serving {model_name} ({task}) natively, compilation failed: "
+                    f"{type(e).__name__}: {e}"
+                )
+
         logger.info(f"Loaded zoo model: {model_name} ({task})")
 
-        return {"model": model, "metadata": metadata, "type": "zoo", "task": task}
+        return {
+            "model": model,
+            "metadata": metadata,
+            "type": "zoo",
+            "task": task,
+            "path": model_path,
+            "compiled": compiled,
+            "engine": "compiled" if compiled is not None else "native",
+        }
 
     @classmethod
     def _load_nbt_tlf(cls, model_dir: Path, device: str = "cpu") -> dict[str, Any]:
         """Load NBT-TLF model.
 
+        On CPU the NumPy export (model.npz) is served when present, so torch
+        is never imported; otherwise the torch checkpoint is loaded.
+
         Args:
             model_dir: Model directory
             device: PyTorch device
 
         Returns:
-            Dict with loaded trainer and config
+            Dict with model, config and engine ("numpy" or "torch"); the torch
+            engine also includes the trainer
         """
         nbt_tlf_dir = model_dir / "nbt_tlf"
 
         if not nbt_tlf_dir.exists():
             raise FileNotFoundError(f"NBT-TLF model not found: {nbt_tlf_dir}")
 
+        numpy_path = nbt_tlf_dir / NUMPY_ARTIFACT
+        if device == "cpu" and numpy_path.exists():
+            with open(nbt_tlf_dir / "config.json") as f:
+                config = json.load(f)
+            model = NumpyNBTTLF.load(numpy_path)
+            logger.info(f"Loaded NBT-TLF model (NumPy) from {nbt_tlf_dir}")
+            return {"model": model, "config": config, "type": "nbt_tlf", "engine": "numpy"}
+
+        # Deferred: imports torch
+        from f1.models.nbt_tlf import NBTTLFTrainer
+
         trainer, config = NBTTLFTrainer.load(nbt_tlf_dir, device=device)
         logger.info(f"Loaded NBT-TLF model from {nbt_tlf_dir}")
 
-        return {"trainer": trainer, "model": trainer.model, "config": config, "type": "nbt_tlf"}
+        return {
+            "trainer": trainer,
+            "model": trainer.model,
+            "config": config,
+            "type": "nbt_tlf",
+            "engine": "torch",
+        }
 
 
 def predict_race(
@@ -176,6 +337,7 @@ def predict_race(
     model_dir: Path = Path("models"),
     task: str = "win",
     calibrate: bool = True,
+    model_provider: Optional[ModelProvider] = None,
 ) -> PredictionResponse:
     """Generate predictions for a race using specified model.
 
@@ -186,6 +348,8 @@ def predict_race(
         model_dir: Directory containing saved models
         task: Task type for zoo models (win/podium/expected_finish)
         calibrate: Whether to apply calibration
+        model_provider: Optional model source (e.g. an in-memory cache);
+            defaults to loading from disk via ModelRegistry.load_model
 
     Returns:
         PredictionResponse with predictions
@@ -194,45 +358,209 @@ def predict_race(
         ValueError: If race_id not found in race_data
         FileNotFoundError: If model not found
     """
-    # Filter to specific race - ensure DataFrame not Series
-    race_df: pd.DataFrame = race_data[race_data["race_id"] == race_id].copy()
-    if len(race_df) == 1:
-        # Even with one row, ensure it's treated as DataFrame
-        race_df = race_df.iloc[:1]
+    responses = predict_races(
+        race_ids=[race_id],
+        model_name=model_name,
+        race_data=race_data,
+        model_dir=model_dir,
+        task=task,
+        calibrate=calibrate,
+        model_provider=model_provider,
+    )
+    return responses[race_id]
+
+
+def predict_races(
+    race_ids: list[str],
+    model_name: str,
+    race_data: pd.DataFrame,
+    model_dir: Path = Path("models"),
+    task: str = "win",
+    calibrate: bool = True,
+    model_provider: Optional[ModelProvider] = None,
+) -> dict[str, PredictionResponse]:
+    """Generate predictions for several races with one model call.
+
+    All requested races are stacked into a single feature matrix, scored in
+    one inference call, and normalized per race before being split back into
+    one PredictionResponse per race.
+
+    Args:
+        race_ids: Race identifiers
+        model_name: Name of model to use
+        race_data: DataFrame with driver features (may contain other races)
+        model_dir: Directory containing saved models
+        task: Task type for zoo models (win/podium/expected_finish)
+        calibrate: Whether to apply calibration
+        model_provider: Optional model source (e.g. an in-memory cache)
+
+    Returns:
+        Dict of race_id -> PredictionResponse for every race found in race_data
+
+    Raises:
+        ValueError: If none of the races are found in race_data
+        FileNotFoundError: If model not found
+    """
+    # Filter to requested races - ensure DataFrame not Series
+    with stage("feature_lookup"):
+        race_df: pd.DataFrame = race_data[race_data["race_id"].isin(race_ids)].copy()
 
     if race_df.empty:
-        raise ValueError(f"Race {race_id} not found in data")
+        raise ValueError(f"Race {', '.join(race_ids)} not found in data")
 
     # Load model
-    model_info = ModelRegistry.load_model(model_name, model_dir, task=task)
+    with stage("model_load"):
+        model_info = get_model_info(model_name, model_dir, task, model_provider)
+
+    predictions = predict_frame(model_info, race_df, task=task, calibrate=calibrate)
+
+    # Split back into one response per race, in request order
+    with stage("response"):
+        responses = _predictions_to_responses(model_name, predictions)
+
+    return {race_id: responses[race_id] for race_id in race_ids if race_id in responses}
+
+
+def predict_frame(
+    model_info: dict[str, Any], race_df: pd.DataFrame, task: str = "win", calibrate: bool = True
+) -> pd.DataFrame:
+    """Score a frame of one or more races with a loaded model.
+
+    Args:
+        model_info: Model information dict from ModelRegistry.load_model
+        race_df: Driver rows; probabilities are normalized per race_id
+        task: Task type for zoo models
+        calibrate: Whether to apply calibration
+
+    Returns:
+        DataFrame with race_id, driver_id, win_prob and podium_prob
+    """
+    scores = score_frame(model_info, race_df, task=task)
+    return normalize_frame(model_info, scores, calibrate=calibrate)
+
+
+def score_frame(
+    model_info: dict[str, Any], race_df: pd.DataFrame, task: str = "win"
+) -> pd.DataFrame:
+    """Run a loaded model over driver rows, without race-level normalization.
+
+    The result holds the model's raw outputs (win_prob/podium_prob for zoo
+    and baseline models, score for NBT-TLF), one row per input row in the
+    same order. normalize_frame turns it into final probabilities; keeping
+    the raw outputs lets a caller re-score a few rows and renormalize.
+
+    Args:
+        model_info: Model information dict from ModelRegistry.load_model
+        race_df: Driver rows of one or more races
+        task: Task type for zoo models
+
+    Returns:
+        DataFrame with race_id, driver_id and the raw model outputs
+    """
     model_type = model_info["type"]
 
-    # Generate predictions based on model type
     if model_type == "baseline":
-        predictions: pd.DataFrame = _predict_baseline(model_info["model"], race_df)
+        with stage("inference"):
+            scores: pd.DataFrame = _predict_baseline(model_info["model"], race_df)
 
     elif model_type == "zoo":
-        predictions = _predict_zoo(model_info, race_df, task)
+        scores = _predict_zoo(model_info, race_df, task)
 
     elif model_type == "nbt_tlf":
-        predictions = _predict_nbt_tlf(model_info, race_df, calibrate)
+        scores = _score_nbt_tlf(model_info, race_df)
 
     else:
         raise ValueError(f"Unknown model type: {model_type}")
 
+    return scores
+
+
+def normalize_frame(
+    model_info: dict[str, Any], scores: pd.DataFrame, calibrate: bool = True
+) -> pd.DataFrame:
+    """Turn raw model outputs into per-race probabilities.
+
+    Args:
+        model_info: Model information dict the scores came from
+        scores: Result of score_frame
+        calibrate: Whether to apply calibration
+
+    Returns:
+        DataFrame with race_id, driver_id, win_prob and podium_prob
+    """
+    model_type = model_info["type"]
+
+    if model_type == "nbt_tlf":
+        return _normalize_nbt_tlf(scores, calibrate)
+
     # Apply calibration if requested
-    if (
-        calibrate
-        and model_type in ["baseline", "zoo"]
-        and "win_prob" in predictions.columns
-        and "podium_prob" in predictions.columns
-    ):
-        predictions = calibrate_tree_model_predictions(predictions, method="none")
+    if calibrate and "win_prob" in scores.columns and "podium_prob" in scores.columns:
+        # Deferred: calibration imports sklearn.isotonic and scipy
+        from f1.evaluation.calibration import calibrate_tree_model_predictions
+
+        with stage("calibration"):
+            return calibrate_tree_model_predictions(scores, method="none")
 
-    # Convert to PredictionResponse
-    response = _predictions_to_response(race_id, model_name, predictions)
+    return scores
+
+
+def score_race(
+    race_id: str,
+    model_name: str,
+    race_data: pd.DataFrame,
+    model_dir: Path = Path("models"),
+    task: str = "win",
+    model_provider: Optional[ModelProvider] = None,
+) -> pd.DataFrame:
+    """Raw model outputs for every driver in a race (see score_frame).
+
+    Args:
+        race_id: Race identifier
+        model_name: Name of model to use
+        race_data: DataFrame with driver features (may contain other races)
+        model_dir: Directory containing saved models
+        task: Task type for zoo models
+        model_provider: Optional model source (e.g. an in-memory cache)
+
+    Returns:
+        DataFrame with race_id, driver_id and the raw model outputs
+
+    Raises:
+        ValueError: If the race is not in race_data
+        FileNotFoundError: If model not found
+    """
+    with stage("feature_lookup"):
+        race_df: pd.DataFrame = race_data[race_data["race_id"] == race_id]
+
+    if race_df.empty:
+        raise ValueError(f"Race {race_id} not found in data")
 
-    return response
+    with stage("model_load"):
+        model_info = get_model_info(model_name, model_dir, task, model_provider)
+
+    return score_frame(model_info, race_df, task=task)
+
+
+def get_model_info(
+    model_name: str,
+    model_dir: Path,
+    task: str = "win",
+    model_provider: Optional[ModelProvider] = None,
+) -> dict[str, Any]:
+    """Fetch model info from a provider, falling back to a disk load.
+
+    Args:
+        model_name: Name of model
+        model_dir: Directory containing saved models
+        task: Task type for zoo models
+        model_provider: Optional model source
+
+    Returns:
+        Model info dict as returned by ModelRegistry.load_model
+    """
+    if model_provider is None:
+        return ModelRegistry.load_model(model_name, Path(model_dir), task=task)
+    return model_provider(model_name, Path(model_dir), task)
 
 
 def _predict_baseline(model: BaselineModel, race_df: pd.DataFrame) -> pd.DataFrame:
@@ -262,6 +590,9 @@ def _predict_zoo(model_info: dict[str, Any], race_df: pd.DataFrame, task: str) -
     """
     model = model_info["model"]
     metadata = model_info.get("metadata")
+    # Compiled tree ensemble when available; capabilities follow the native model
+    compiled = model_info.get("compiled")
+    estimator = compiled if compiled is not None else model
 
     # Get feature columns from metadata or use all numeric columns
     if metadata and "features" in metadata:
@@ -286,7 +617,8 @@ def _predict_zoo(model_info: dict[str, Any], race_df: pd.DataFrame, task: str) -
         ]
 
     # Prepare features
-    X = race_df[feature_cols].fillna(0).values
+    with stage("feature_matrix"):
+        X = race_df[feature_cols].fillna(0).values
 
     # Generate predictions
     predictions = race_df[["race_id", "driver_id"]].copy()
@@ -294,7 +626,8 @@ def _predict_zoo(model_info: dict[str, Any], race_df: pd.DataFrame, task: str) -
     if task in ["win", "podium"]:
         # Classification: predict probabilities
         if hasattr(model, "predict_proba"):
-            probs = model.predict_proba(X)
+            with stage("inference"):
+                probs = estimator.predict_proba(X)
             if task == "win":
                 predictions["win_prob"] = probs[:, 1]
                 # Heuristic for podium
@@ -305,12 +638,14 @@ def _predict_zoo(model_info: dict[str, Any], race_df: pd.DataFrame, task: str) -
                 predictions["win_prob"] = probs[:, 1] / 3
         else:
             # Regression model used for classification (fallback)
-            scores = model.predict(X)
+            with stage("inference"):
+                scores = estimator.predict(X)
             predictions["win_prob"] = 1 / (1 + np.exp(-scores))
             predictions["podium_prob"] = np.minimum(predictions["win_prob"] * 3, 0.95)
     else:
         # Regression: predict finish position
-        predictions["expected_finish"] = model.predict(X)
+        with stage("inference"):
+            predictions["expected_finish"] = estimator.predict(X)
         # Derive probabilities from expected finish (approximate)
         predictions["win_prob"] = 1 / predictions["expected_finish"]
         predictions["podium_prob"] = 3 / predictions["expected_finish"]
@@ -324,59 +659,69 @@ def _predict_zoo(model_info: dict[str, Any], race_df: pd.DataFrame, task: str) -
     return predictions
 
 
-def _predict_nbt_tlf(
-    model_info: dict[str, Any], race_df: pd.DataFrame, calibrate: bool
-) -> pd.DataFrame:
-    """Generate predictions using NBT-TLF model.
+def _score_nbt_tlf(model_info: dict[str, Any], race_df: pd.DataFrame) -> pd.DataFrame:
+    """Compute raw NBT-TLF scores, all rows in one forward pass.
+
+    Uses the NumPy engine when the model was loaded from its export, and
+    only imports torch for torch-loaded models.
 
     Args:
         model_info: Model information dict
-        race_df: Race data
-        calibrate: Whether to calibrate scores
+        race_df: Race data (one or more races)
 
     Returns:
-        DataFrame with predictions
+        DataFrame with race_id, driver_id and score
     """
-    model = model_info["model"]
+    if model_info.get("engine") == "numpy":
+        from f1.models.nbt_tlf_numpy import score_drivers
+    else:
+        from f1.models.nbt_tlf import score_drivers  # type: ignore[assignment]
+
     config = model_info["config"]
 
-    # Get mappings from config
-    driver_to_idx = config.get("driver_to_idx", {})
-    constructor_to_idx = config.get("constructor_to_idx", {})
-    track_to_idx = config.get("track_to_idx", {})
-
-    # Compute scores for each driver
-    model.eval()
-    scores = []
-
-    with torch.no_grad():
-        for _, row in race_df.iterrows():
-            driver_idx = driver_to_idx.get(row["driver_id"], 0)
-            constructor_idx = constructor_to_idx.get(row.get("team", ""), 0)
-            track_idx = track_to_idx.get(row.get("track_id", ""), 0)
-            race_idx = int(row.get("season", 2024) * 100 + row.get("round", 1))
-
-            score = model.compute_score(
-                torch.tensor([driver_idx], dtype=torch.long),
-                torch.tensor([constructor_idx], dtype=torch.long),
-                torch.tensor([track_idx], dtype=torch.long),
-                torch.tensor([race_idx], dtype=torch.long),
-            )
+    with stage("inference"):
+        scores = score_drivers(
+            model_info["model"],
+            race_df,
+            config.get("driver_to_idx", {}),
+            config.get("constructor_to_idx", {}),
+            config.get("track_to_idx", {}),
+            numeric_feature_cols=config.get("numeric_feature_cols"),
+        )
+
+    return pd.DataFrame(
+        {
+            "race_id": race_df["race_id"].to_numpy(),
+            "driver_id": race_df["driver_id"].to_numpy(),
+            "score": scores,
+        }
+    )
 
-            scores.append(
-                {"race_id": row["race_id"], "driver_id": row["driver_id"], "score": score.item()}
-            )
 
-    scores_df = pd.DataFrame(scores)
+def _normalize_nbt_tlf(scores_df: pd.DataFrame, calibrate: bool) -> pd.DataFrame:
+    """Convert NBT-TLF scores to per-race probabilities.
+
+    Args:
+        scores_df: DataFrame with race_id, driver_id and score
+        calibrate: Whether to calibrate scores
 
+    Returns:
+        DataFrame with predictions
+    """
     # Calibrate scores to probabilities
     if calibrate:
-        predictions = calibrate_nbt_tlf_scores(scores_df, method="none")
+        # Deferred: calibration imports sklearn.isotonic and scipy
+        from f1.evaluation.calibration import calibrate_nbt_tlf_scores
+
+        with stage("calibration"):
+            predictions = calibrate_nbt_tlf_scores(scores_df, method="none")
     else:
-        # Simple softmax
-        scores_arr = np.asarray(scores_df["score"].values)
-        exp_scores = np.exp(scores_arr - scores_arr.max())
-        win_probs = exp_scores / exp_scores.sum()
+        # Simple softmax within each race
+        race_max = scores_df.groupby("race_id")["score"].transform("max")
+        exp_scores = np.exp(scores_df["score"] - race_max)
+        win_probs = np.asarray(
+            exp_scores / exp_scores.groupby(scores_df["race_id"]).transform("sum")
+        )
 
         predictions = scores_df.copy()
         predictions["win_prob"] = win_probs
@@ -385,42 +730,82 @@ def _predict_nbt_tlf(
     return predictions
 
 
-def _predictions_to_response(
-    race_id: str, model_name: str, predictions: pd.DataFrame
+def _predictions_to_responses(
+    model_name: str, predictions: pd.DataFrame
+) -> dict[str, PredictionResponse]:
+    """Convert a prediction DataFrame to one PredictionResponse per race.
+
+    Columns are pulled out as arrays once and each race is a slice of them,
+    so there is no per-row pandas work.
+
+    Args:
+        model_name: Model name
+        predictions: DataFrame with race_id, driver_id, win_prob and
+            optionally podium_prob, for one or more races
+
+    Returns:
+        Dict of race_id -> PredictionResponse, in order of first appearance
+    """
+    race_codes, race_ids = pd.factorize(predictions["race_id"], sort=False)
+    order = np.argsort(race_codes, kind="stable")
+    bounds = np.flatnonzero(np.diff(race_codes[order])) + 1
+
+    driver_ids = predictions["driver_id"].to_numpy(dtype=object)[order]
+    win_prob = predictions["win_prob"].to_numpy(dtype=float)[order]
+    podium_prob = (
+        predictions["podium_prob"].to_numpy(dtype=float)[order]
+        if "podium_prob" in predictions.columns
+        else None
+    )
+
+    generated_at = datetime.utcnow()
+    responses = {}
+    for race_id, rows in zip(race_ids, np.split(np.arange(len(order)), bounds)):
+        responses[race_id] = _columns_to_response(
+            race_id,
+            model_name,
+            driver_ids[rows],
+            win_prob[rows],
+            podium_prob[rows] if podium_prob is not None else None,
+            generated_at,
+        )
+    return responses
+
+
+def _columns_to_response(
+    race_id: str,
+    model_name: str,
+    driver_ids: np.ndarray,
+    win_prob: np.ndarray,
+    podium_prob: Optional[np.ndarray],
+    generated_at: datetime,
 ) -> PredictionResponse:
-    """Convert prediction DataFrame to PredictionResponse schema.
+    """Build a PredictionResponse for one race from column arrays.
+
+    Expected finish is the driver's rank by descending win probability.
 
     Args:
         race_id: Race identifier
         model_name: Model name
-        predictions: DataFrame with predictions
+        driver_ids: Driver identifiers
+        win_prob: Win probabilities, aligned with driver_ids
+        podium_prob: Podium probabilities, aligned with driver_ids (optional)
+        generated_at: Generation timestamp
 
     Returns:
         PredictionResponse instance
     """
-    # Extract win probabilities
-    win_prob = {}
-    for _, row in predictions.iterrows():
-        if "win_prob" in predictions.columns:
-            win_prob[row["driver_id"]] = float(row["win_prob"])
-
-    # Extract podium probabilities
-    podium_prob = {}
-    for _, row in predictions.iterrows():
-        if "podium_prob" in predictions.columns:
-            podium_prob[row["driver_id"]] = float(row["podium_prob"])
-
-    # Compute expected finish from win probabilities
-    expected_finish = {}
-    sorted_drivers = predictions.sort_values("win_prob", ascending=False)["driver_id"].tolist()
-    for idx, driver_id in enumerate(sorted_drivers, 1):
-        expected_finish[driver_id] = float(idx)
+    drivers = driver_ids.tolist()
+    finish_order = np.argsort(-win_prob, kind="stable")
 
     return PredictionResponse(
         race_id=race_id,
         model_name=model_name,
-        win_prob=win_prob,
-        podium_prob=podium_prob,
-        expected_finish=expected_finish,
-        generated_at=datetime.utcnow(),
+        win_prob=dict(zip(drivers, win_prob.tolist())),
+        podium_prob=dict(zip(drivers, podium_prob.tolist())) if podium_prob is not None else {},
+        expected_finish=dict(
+            zip(driver_ids[finish_order].tolist(), np.arange(1.0, len(drivers) + 1).tolist())
+        ),
+        generated_at=generated_at,
     )
+
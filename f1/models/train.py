@@ -5,6 +5,7 @@ and tasks (win classification, podium classification, finish position regression
 """
 
 import argparse
+import importlib.util
 import json
 import logging
 from datetime import datetime
@@ -18,26 +19,11 @@ from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.linear_model import LogisticRegression, Ridge
 from sklearn.metrics import accuracy_score, log_loss, mean_squared_error, roc_auc_score
 
-try:
-    import xgboost as xgb
-
-    HAS_XGB = True
-except ImportError:
-    HAS_XGB = False
-
-try:
-    import lightgbm as lgb
-
-    HAS_LIGHTGBM = True
-except ImportError:
-    HAS_LIGHTGBM = False
-
-try:
-    import catboost as cb
-
-    HAS_CATBOOST = True
-except ImportError:
-    HAS_CATBOOST = False
+# Boosting libraries are optional and slow to import: check availability
+# here, import them in create_model when that model type is requested.
+HAS_XGB = importlib.util.find_spec("xgboost") is not None
+HAS_LIGHTGBM = importlib.util.find_spec("lightgbm") is not None
+HAS_CATBOOST = importlib.util.find_spec("catboost") is not None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -153,6 +139,8 @@ def create_model(model_name: str, task: str, seed: int = 42, optimized: bool = T
     if model_name == "xgb":
         if not HAS_XGB:
             raise ImportError("XGBoost not installed. Install with: pip install xgboost")
+        import xgboost as xgb
+
         if is_classification:
             if optimized:
                 # Optimized hyperparameters for better generalization
@@ -188,6 +176,8 @@ def create_model(model_name: str, task: str, seed: int = 42, optimized: bool = T
     elif model_name == "lgbm":
         if not HAS_LIGHTGBM:
             raise ImportError("LightGBM not installed. Install with: pip install lightgbm")
+        import lightgbm as lgb
+
         if is_classification:
             if optimized:
                 # Optimized hyperparameters to reduce overfitting
@@ -221,6 +211,8 @@ def create_model(model_name: str, task: str, seed: int = 42, optimized: bool = T
     elif model_name == "cat":
         if not HAS_CATBOOST:
             raise ImportError("CatBoost not installed. Install with: pip install catboost")
+        import catboost as cb
+
         if is_classification:
             if optimized:
                 return cb.CatBoostClassifier(
@@ -328,6 +320,7 @@ def save_model_artifacts(
     output_dir: Path,
     window: int = 5,
     seed: int = 42,
+    feature_means: Optional[list[float]] = None,
 ) -> None:
     """Save model and metadata.
 
@@ -340,6 +333,7 @@ def save_model_artifacts(
         output_dir: Output directory
         window: Rolling window size used
         seed: Random seed used
+        feature_means: Training-set feature means (baseline for linear attributions)
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -359,6 +353,8 @@ def save_model_artifacts(
         "timestamp": datetime.utcnow().isoformat(),
         "metrics": metrics,
     }
+    if feature_means is not None:
+        metadata["feature_means"] = dict(zip(feature_cols, map(float, feature_means)))
 
     metadata_path = output_dir / f"{model_name}_{task}_metadata.json"
     with open(metadata_path, "w") as f:
@@ -426,7 +422,15 @@ def main():
     # Save artifacts
     output_dir = Path(args.output) / args.model
     save_model_artifacts(
-        model, args.model, args.task, feature_cols, metrics, output_dir, args.window, args.seed
+        model,
+        args.model,
+        args.task,
+        feature_cols,
+        metrics,
+        output_dir,
+        args.window,
+        args.seed,
+        feature_means=X_train.mean(axis=0).tolist(),
     )
 
     logger.info("Training complete!")
@@ -0,0 +1,50 @@
+"""Per-stage timing hooks for the prediction path.
+
+Library code marks its stages (feature lookup, model load, inference, ...)
+with ``stage``. Timings are only recorded inside a ``collect_stages`` block,
+so outside the API the hooks cost one context-variable lookup. Recorded
+stages are plain (name, seconds) tuples and can be returned from worker
+processes.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_stages: ContextVar[Optional[list[tuple[str, float]]]] = ContextVar("stages", default=None)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block as a named stage, if stages are being collected.
+
+    Args:
+        name: Stage name (e.g. 'inference')
+    """
+    records = _stages.get()
+    if records is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        records.append((name, time.perf_counter() - start))
+
+
+@contextmanager
+def collect_stages() -> Iterator[list[tuple[str, float]]]:
+    """Collect stage timings recorded in this context.
+
+    Yields:
+        List that receives (stage name, seconds) tuples in completion order
+    """
+    records: list[tuple[str, float]] = []
+    token = _stages.set(records)
+    try:
+        yield records
+    finally:
+        _stages.reset(token)
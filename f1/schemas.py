@@ -1,7 +1,7 @@
 """Pydantic schemas for F1 race predictions and analysis."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -47,6 +47,86 @@ class PredictionResponse(BaseModel):
         }
 
 
+class ColumnarPredictionResponse(BaseModel):
+    """Race predictions as parallel arrays, for bulk clients.
+
+    Element i of each array belongs to driver_ids[i].
+    """
+
+    race_id: str = Field(..., description="Race identifier")
+    model_name: str = Field(..., description="Name of the model used for prediction")
+    driver_ids: list[str] = Field(..., description="Driver identifiers")
+    win_prob: list[float] = Field(..., description="Win probability per driver")
+    podium_prob: list[float] = Field(..., description="Podium probability per driver")
+    expected_finish: list[float] = Field(..., description="Expected finishing position per driver")
+    generated_at: datetime = Field(..., description="Timestamp when prediction was generated")
+
+    @classmethod
+    def from_prediction(cls, prediction: PredictionResponse) -> "ColumnarPredictionResponse":
+        """Convert a PredictionResponse, keeping its driver order.
+
+        Args:
+            prediction: Per-driver mapping response
+
+        Returns:
+            Columnar response
+        """
+        driver_ids = list(prediction.win_prob)
+        return cls(
+            race_id=prediction.race_id,
+            model_name=prediction.model_name,
+            driver_ids=driver_ids,
+            win_prob=list(prediction.win_prob.values()),
+            podium_prob=[prediction.podium_prob.get(d, 0.0) for d in driver_ids],
+            expected_finish=[prediction.expected_finish.get(d, 20.0) for d in driver_ids],
+            generated_at=prediction.generated_at,
+        )
+
+
+class BatchPredictionRequest(BaseModel):
+    """Request model for batch race predictions."""
+
+    race_ids: list[str] = Field(
+        ..., min_length=1, max_length=500, description="Race identifiers to predict"
+    )
+    models: list[str] = Field(
+        default_factory=lambda: ["xgb"],
+        min_length=1,
+        max_length=8,
+        description="Model names to run for every race",
+    )
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {"race_ids": ["2024_01", "2024_02"], "models": ["xgb", "lgbm"]}
+        }
+
+
+class BatchPredictionError(BaseModel):
+    """A race or model that could not be predicted in a batch."""
+
+    race_id: Optional[str] = Field(default=None, description="Race identifier, if race-specific")
+    model_name: Optional[str] = Field(default=None, description="Model name, if model-specific")
+    detail: str = Field(..., description="Error description")
+
+
+class BatchPredictionResponse(BaseModel):
+    """Response model for batch race predictions."""
+
+    predictions: list[Union[PredictionResponse, ColumnarPredictionResponse]] = Field(
+        ..., description="Predictions ordered by model, then by requested race"
+    )
+    errors: list[BatchPredictionError] = Field(
+        default_factory=list, description="Races or models that were skipped"
+    )
+
+
+# driver_id -> all feature impacts for that driver, ordered by impact
+RaceExplanation = dict[str, list[FeatureImpact]]
+
+
 class ExplainResponse(BaseModel):
     """Response model for prediction explanation."""
 
@@ -141,3 +221,120 @@ class CounterfactualResponse(BaseModel):
                 },
             }
         }
+
+
+class CounterfactualSweepRequest(BaseModel):
+    """Request model for a counterfactual sweep over a grid of changes."""
+
+    race_id: str = Field(..., description="Race identifier")
+    driver_id: str = Field(..., description="Driver identifier")
+    grid: dict[str, list[float]] = Field(
+        ...,
+        min_length=1,
+        description="Values to sweep per change (change_name -> deltas); all combinations run",
+    )
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "race_id": "2024_01",
+                "driver_id": "HAM",
+                "grid": {"qualifying_position_delta": [-3, -2, -1, 0, 1, 2, 3]},
+            }
+        }
+
+
+class CounterfactualSweepPoint(BaseModel):
+    """One scenario of a counterfactual sweep."""
+
+    changes: dict[str, float] = Field(..., description="Changes applied in this scenario")
+    outcome: PredictionOutcome = Field(..., description="Prediction with changes applied")
+    delta: dict[str, float] = Field(..., description="Difference from the baseline")
+
+
+class CounterfactualSweepResponse(BaseModel):
+    """Response model for a counterfactual sweep."""
+
+    race_id: str = Field(..., description="Race identifier")
+    driver_id: str = Field(..., description="Driver identifier")
+    model_name: str = Field(default="", description="Model used for prediction")
+    baseline: PredictionOutcome = Field(..., description="Original prediction")
+    points: list[CounterfactualSweepPoint] = Field(
+        ..., description="One entry per grid combination, in grid order"
+    )
+
+
+class ScenarioRule(BaseModel):
+    """Changes applied to every matching driver row in a season scenario."""
+
+    changes: dict[str, float] = Field(
+        ..., min_length=1, description="Counterfactual changes (change_name -> delta)"
+    )
+    driver_ids: Optional[list[str]] = Field(
+        default=None, description="Drivers the rule applies to (None = all)"
+    )
+    teams: Optional[list[str]] = Field(
+        default=None, description="Teams the rule applies to (None = all)"
+    )
+    from_round: Optional[int] = Field(default=None, ge=1, description="First round (inclusive)")
+    to_round: Optional[int] = Field(default=None, ge=1, description="Last round (inclusive)")
+
+
+class SeasonScenarioRequest(BaseModel):
+    """Request model for a season-wide counterfactual scenario."""
+
+    season: int = Field(..., description="Season year")
+    rules: list[ScenarioRule] = Field(
+        ..., min_length=1, max_length=50, description="Rules, applied in order"
+    )
+    models: list[str] = Field(
+        default_factory=lambda: ["xgb"],
+        min_length=1,
+        max_length=8,
+        description="Model names to score the scenario with",
+    )
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "season": 2024,
+                "rules": [
+                    {
+                        "teams": ["Ferrari"],
+                        "from_round": 8,
+                        "changes": {"constructor_form_delta": 0.15},
+                    },
+                    {"driver_ids": ["VER"], "changes": {"qualifying_position_delta": 20}},
+                ],
+                "models": ["xgb"],
+            }
+        }
+
+
+class DriverScenarioImpact(BaseModel):
+    """A driver's season totals with and without a scenario."""
+
+    driver_id: str = Field(..., description="Driver identifier")
+    races: int = Field(..., description="Affected races the driver took part in")
+    baseline: dict[str, float] = Field(
+        ..., description="expected_wins, expected_podiums and expected_points as predicted"
+    )
+    scenario: dict[str, float] = Field(..., description="The same totals under the scenario")
+    delta: dict[str, float] = Field(..., description="Scenario minus baseline")
+
+
+class SeasonScenarioResponse(BaseModel):
+    """Response model for a season-wide counterfactual scenario."""
+
+    season: int = Field(..., description="Season year")
+    affected_races: list[str] = Field(..., description="Races with at least one changed row")
+    results: dict[str, list[DriverScenarioImpact]] = Field(
+        ..., description="Per model, driver impacts ordered by expected points gained"
+    )
+    errors: list[BatchPredictionError] = Field(
+        default_factory=list, description="Models that could not be scored"
+    )
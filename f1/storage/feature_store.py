@@ -0,0 +1,111 @@
+"""Memory-mapped Arrow copies of the feature table.
+
+The parquet file is converted once per features version into an
+uncompressed Arrow IPC (Feather v2) file, pre-sorted by race_id. Each worker
+memory-maps that file instead of decoding the parquet into its own heap, so
+numeric columns are backed by the page cache and every worker on a host
+shares one physical copy:
+
+    <store_dir>/<stem>-<features_version>.arrow
+
+Float nulls are stored as NaN so those columns convert to pandas without a
+copy too. String columns still become per-worker object arrays.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+def arrow_path(features_path: Path, store_dir: Path, version: str) -> Path:
+    """Get the Arrow file path for a features file version.
+
+    Args:
+        features_path: Source parquet path
+        store_dir: Directory holding Arrow copies
+        version: Features version (content hash)
+
+    Returns:
+        Path of the Arrow file
+    """
+    return Path(store_dir) / f"{Path(features_path).stem}-{version}.arrow"
+
+
+def _prepare(table: pa.Table) -> pa.Table:
+    """Sort rows by race_id (stable) and replace float nulls with NaN."""
+    table = table.take(pc.sort_indices(table, sort_keys=[("race_id", "ascending")]))
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type) and table.column(i).null_count:
+            filled = pc.fill_null(table.column(i), pa.scalar(float("nan"), field.type))
+            table = table.set_column(i, field, filled)
+    return table.combine_chunks()
+
+
+def ensure_arrow(features_path: Path, store_dir: Path, version: str) -> Path:
+    """Write the Arrow copy of a features file unless it already exists.
+
+    Written to a temporary file and renamed into place, so concurrent
+    workers never map a partial file. Copies of other versions of the same
+    features file are removed; workers that still map them keep their
+    (unlinked) pages until they reload.
+
+    Args:
+        features_path: Source parquet path
+        store_dir: Directory holding Arrow copies
+        version: Features version (content hash)
+
+    Returns:
+        Path of the Arrow file
+    """
+    path = arrow_path(features_path, store_dir, version)
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = _prepare(pq.read_table(features_path))
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        # One record batch: columns split across batches are concatenated
+        # (copied) by to_pandas instead of viewed in place
+        feather.write_feather(
+            table, tmp_path, compression="uncompressed", chunksize=max(table.num_rows, 1)
+        )
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    for stale in path.parent.glob(f"{Path(features_path).stem}-*.arrow"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+    logger.info(f"Wrote memory-mappable features: {path}")
+    return path
+
+
+def read_mapped(path: Path) -> pd.DataFrame:
+    """Memory-map an Arrow features file as a DataFrame.
+
+    Numeric columns without nulls are zero-copy views of the mapping
+    (read-only); one block per column keeps pandas from consolidating them
+    into a private copy.
+
+    Args:
+        path: Arrow file written by ensure_arrow
+
+    Returns:
+        Features DataFrame, sorted by race_id
+    """
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True)
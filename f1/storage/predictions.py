@@ -0,0 +1,119 @@
+"""On-disk store of precomputed race predictions.
+
+Predictions only change when the features or a model artifact change, so each
+serialized PredictionResponse is stored under a key that pins both versions:
+
+    <root>/<features_version>/<model>_<task>_<model_version>/<race_id>.json
+
+A retrain or a new features file therefore lands in a fresh directory and old
+entries are never served. Stale version directories can be deleted at will.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionKey(NamedTuple):
+    """Identity of a stored race prediction."""
+
+    race_id: str
+    model_name: str
+    task: str
+    features_version: str
+    model_version: str
+
+
+def features_version(features_path: Path) -> str:
+    """Compute a content hash identifying a features file.
+
+    Args:
+        features_path: Path to features parquet
+
+    Returns:
+        Short hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(features_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def payload_etag(payload: bytes) -> str:
+    """Compute a strong ETag for a serialized response body.
+
+    Args:
+        payload: Response body bytes
+
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hashlib.sha256(payload).hexdigest()[:32]}"'
+
+
+class PredictionStore:
+    """Directory of serialized predictions keyed by PredictionKey."""
+
+    def __init__(self, root_dir: Path):
+        """Initialize store.
+
+        Args:
+            root_dir: Root directory for stored predictions
+        """
+        self.root_dir = Path(root_dir)
+
+    def path_for(self, key: PredictionKey) -> Path:
+        """Get the file path for a key.
+
+        Args:
+            key: Prediction key
+
+        Returns:
+            Path of the stored JSON file
+        """
+        model_dir = f"{key.model_name}_{key.task}_{key.model_version}"
+        return self.root_dir / key.features_version / model_dir / f"{key.race_id}.json"
+
+    def get(self, key: PredictionKey) -> Optional[bytes]:
+        """Read a stored prediction.
+
+        Args:
+            key: Prediction key
+
+        Returns:
+            Serialized prediction bytes, or None if not stored
+        """
+        try:
+            return self.path_for(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: PredictionKey, payload: bytes) -> None:
+        """Store a prediction atomically.
+
+        Writes to a temporary file and renames it into place, so concurrent
+        readers never observe a partial file.
+
+        Args:
+            key: Prediction key
+            payload: Serialized prediction bytes
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Stored prediction: {path}")
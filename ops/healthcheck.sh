@@ -44,7 +44,7 @@ check_api_health() {
     log_info "Checking API health on port $API_PORT..."
     
     for i in $(seq 1 $MAX_RETRIES); do
-        if curl -sf "http://localhost:$API_PORT/health" > /dev/null 2>&1; then
+        if curl -sf "http://localhost:$API_PORT/health/ready" > /dev/null 2>&1; then
             log_success "API is healthy (attempt $i/$MAX_RETRIES)"
             return 0
         else
@@ -0,0 +1,135 @@
+"""Microbenchmark: per-row vs batched NBT-TLF race inference.
+
+Times the former per-driver loop (one compute_score call with four
+one-element tensors per driver) against score_drivers (one forward pass
+over the whole race) on a randomly initialized model of the production
+size, and checks both give the same scores.
+
+Usage:
+    python -m scripts.bench_nbt_tlf --drivers 20 --races 200
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+
+from f1.models.nbt_tlf import NBTTLFModel, score_drivers
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def synthetic_races(n_races: int, n_drivers: int, n_tracks: int) -> list[pd.DataFrame]:
+    """Build race frames with the columns NBT-TLF reads.
+
+    Race indices (season * 100 + round) must fall inside the temporal
+    encoding table, so the synthetic seasons are small integers.
+
+    Args:
+        n_races: Number of races
+        n_drivers: Drivers per race
+        n_tracks: Number of distinct tracks
+
+    Returns:
+        One DataFrame per race
+    """
+    drivers = [f"D{i:02d}" for i in range(n_drivers)]
+    return [
+        pd.DataFrame(
+            {
+                "race_id": f"bench_{r:03d}",
+                "driver_id": drivers,
+                "team": [f"T{i // 2}" for i in range(n_drivers)],
+                "track_id": f"track_{r % n_tracks}",
+                "season": r // 24,
+                "round": r % 24 + 1,
+            }
+        )
+        for r in range(n_races)
+    ]
+
+
+def score_per_row(model: NBTTLFModel, race_df: pd.DataFrame, mappings: dict) -> np.ndarray:
+    """Reference: the former one-driver-at-a-time loop."""
+    scores = []
+    with torch.no_grad():
+        for _, row in race_df.iterrows():
+            score = model.compute_score(
+                torch.tensor([mappings["driver"].get(row["driver_id"], 0)], dtype=torch.long),
+                torch.tensor([mappings["constructor"].get(row["team"], 0)], dtype=torch.long),
+                torch.tensor([mappings["track"].get(row["track_id"], 0)], dtype=torch.long),
+                torch.tensor([int(row["season"] * 100 + row["round"])], dtype=torch.long),
+            )
+            scores.append(score.item())
+    return np.array(scores)
+
+
+def time_per_race(fn, races: list[pd.DataFrame], repeats: int) -> float:
+    """Best-of-repeats mean latency per race, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for race_df in races:
+            fn(race_df)
+        best = min(best, (time.perf_counter() - start) / len(races))
+    return best * 1000
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark NBT-TLF race inference")
+    parser.add_argument("--drivers", type=int, default=20, help="Drivers per race")
+    parser.add_argument("--races", type=int, default=200, help="Races per timing run")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing runs (best is kept)")
+    parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads")
+
+    args = parser.parse_args()
+    torch.set_num_threads(args.threads)
+    torch.manual_seed(0)
+
+    n_teams = (args.drivers + 1) // 2
+    n_tracks = 24
+    model = NBTTLFModel(
+        n_drivers=args.drivers + 1,
+        n_constructors=n_teams + 1,
+        n_tracks=n_tracks + 1,
+        embed_dim=16,
+        hidden_dim=32,
+        temporal_dim=8,
+    )
+    model.eval()
+
+    mappings = {
+        "driver": {f"D{i:02d}": i + 1 for i in range(args.drivers)},
+        "constructor": {f"T{i}": i + 1 for i in range(n_teams)},
+        "track": {f"track_{i}": i + 1 for i in range(n_tracks)},
+    }
+    races = synthetic_races(args.races, args.drivers, n_tracks)
+
+    def batched(race_df: pd.DataFrame) -> np.ndarray:
+        return score_drivers(
+            model, race_df, mappings["driver"], mappings["constructor"], mappings["track"]
+        )
+
+    def per_row(race_df: pd.DataFrame) -> np.ndarray:
+        return score_per_row(model, race_df, mappings)
+
+    np.testing.assert_allclose(batched(races[0]), per_row(races[0]), rtol=1e-5, atol=1e-6)
+
+    per_row_ms = time_per_race(per_row, races, args.repeats)
+    batched_ms = time_per_race(batched, races, args.repeats)
+
+    print(f"NBT-TLF inference, {args.drivers} drivers/race, {args.threads} thread(s)")
+    print(f"  per-row loop : {per_row_ms:8.3f} ms/race")
+    print(f"  batched      : {batched_ms:8.3f} ms/race")
+    print(f"  speedup      : {per_row_ms / batched_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
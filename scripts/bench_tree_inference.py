@@ -0,0 +1,90 @@
+"""Microbenchmark: native vs compiled tree-model inference on small batches.
+
+Loads each trained tree model of the zoo from the model directory twice -
+with the native library backend and with the compiled flat-array backend
+(f1.models.compiled_trees) - and times predict_proba (predict for
+regressors) on race-sized batches of synthetic feature rows, checking both
+give the same output.
+
+Usage:
+    python -m scripts.bench_tree_inference --model-dir models --rows 20
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+
+from f1.models.registry import ModelRegistry
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def time_per_batch(predict, batches: list[np.ndarray], repeats: int) -> float:
+    """Best-of-repeats mean latency per batch, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for X in batches:
+            predict(X)
+        best = min(best, (time.perf_counter() - start) / len(batches))
+    return best * 1000
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark compiled tree inference")
+    parser.add_argument("--model-dir", type=str, default="models", help="Model directory")
+    parser.add_argument("--task", type=str, default="win", help="Task of the models to load")
+    parser.add_argument("--rows", type=int, default=20, help="Rows per batch (drivers per race)")
+    parser.add_argument("--batches", type=int, default=200, help="Batches per timing run")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing runs (best is kept)")
+
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"Tree inference, {args.rows} rows/batch (ms/batch)")
+    print(f"  {'model':6s} {'native':>10s} {'compiled':>10s} {'speedup':>8s}")
+    for model_name in ModelRegistry.TREE_MODELS:
+        try:
+            native = ModelRegistry.load_model(
+                model_name, Path(args.model_dir), args.task, tree_backend="native"
+            )
+        except (FileNotFoundError, ImportError) as e:
+            logger.warning(f"Skipping {model_name}: {e}")
+            continue
+        compiled = ModelRegistry.load_model(model_name, Path(args.model_dir), args.task)
+        if compiled["compiled"] is None:
+            logger.warning(f"Skipping {model_name}: model could not be compiled")
+            continue
+
+        n_features = len((native["metadata"] or {}).get("features", [])) or (
+            compiled["compiled"].n_features
+        )
+        batches = [
+            np.round(rng.normal(loc=5.0, scale=3.0, size=(args.rows, n_features)), 2)
+            for _ in range(args.batches)
+        ]
+
+        method = "predict_proba" if hasattr(native["model"], "predict_proba") else "predict"
+        native_predict = getattr(native["model"], method)
+        compiled_predict = getattr(compiled["compiled"], method)
+        np.testing.assert_allclose(
+            compiled_predict(batches[0]), native_predict(batches[0]), rtol=1e-5, atol=1e-6
+        )
+
+        native_ms = time_per_batch(native_predict, batches, args.repeats)
+        compiled_ms = time_per_batch(compiled_predict, batches, args.repeats)
+        print(
+            f"  {model_name:6s} {native_ms:10.3f} {compiled_ms:10.3f} "
+            f"{native_ms / compiled_ms:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
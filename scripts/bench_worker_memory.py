@@ -0,0 +1,115 @@
+"""Benchmark: per-worker memory of the features load, parquet vs memory-mapped.
+
+Starts N worker processes at once (spawned, like separate uvicorn workers),
+each loading the features through DataCache and building the race index,
+then touching every numeric column as serving requests would. Each worker
+reports its private (RssAnon) and file-backed (RssFile) resident memory
+before and after the load. The "parquet" mode is the per-worker load
+(features_mmap_dir unset); "mmap" memory-maps the shared Arrow copy.
+
+The features table can be replicated (--scale) to a production-like size;
+copies get distinct race ids.
+
+Usage:
+    python -m scripts.bench_worker_memory --workers 4 --scale 200
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+MIB = 2**20
+
+
+def _worker(features_path: str, mmap_dir: str, barrier, results) -> None:
+    """Load features in a fresh process and report its memory."""
+    from api.core.metrics import process_memory
+    from api.deps import DataCache
+
+    before = process_memory()
+    data_cache = DataCache()
+    data_cache.mmap_dir = Path(mmap_dir) if mmap_dir else None
+    index = data_cache.get_index(Path(features_path))
+
+    # Fault in the numeric columns in place, as serving requests over time would
+    features = index.features
+    for column in features.columns:
+        if pd.api.types.is_numeric_dtype(features[column]):
+            float(features[column].to_numpy().sum())
+
+    after = process_memory()
+    results.put((before, after))
+    # Stay alive until every worker has measured, as concurrent workers do
+    barrier.wait()
+
+
+def run_workers(features_path: Path, mmap_dir: str, workers: int) -> list[tuple[dict, dict]]:
+    """Run the load in N concurrent worker processes.
+
+    Args:
+        features_path: Features parquet to load
+        mmap_dir: Arrow store directory ("" = read the parquet per worker)
+        workers: Number of worker processes
+
+    Returns:
+        Per worker, (memory before, memory after) as from process_memory
+    """
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=_worker, args=(str(features_path), mmap_dir, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    measured = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return measured
+
+
+def scaled_features(features_path: Path, scale: int, out_dir: Path) -> Path:
+    """Write the features table replicated ``scale`` times with distinct race ids."""
+    if scale <= 1:
+        return features_path
+    features = pd.read_parquet(features_path)
+    copies = [features.assign(race_id=features["race_id"] + f"_x{i}") for i in range(scale)]
+    path = out_dir / "features.parquet"
+    pd.concat(copies, ignore_index=True).to_parquet(path)
+    return path
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark per-worker features memory")
+    parser.add_argument(
+        "--features",
+        type=str,
+        default="data/features/features.parquet",
+        help="Features parquet",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent worker processes")
+    parser.add_argument("--scale", type=int, default=1, help="Replicate the table N times")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        features_path = scaled_features(Path(args.features), args.scale, Path(tmp))
+        rows = len(pd.read_parquet(features_path, columns=["race_id"]))
+        size = features_path.stat().st_size / MIB
+        print(f"{rows} rows ({size:.1f} MiB parquet), {args.workers} workers (MiB per worker)")
+        print(f"  {'mode':8s} {'anon before':>12s} {'anon after':>11s} {'file after':>11s}")
+
+        for mode, mmap_dir in (("parquet", ""), ("mmap", str(Path(tmp) / "arrow"))):
+            for before, after in run_workers(features_path, mmap_dir, args.workers):
+                print(
+                    f"  {mode:8s} {before.get('anonymous', 0) / MIB:12.1f} "
+                    f"{after.get('anonymous', 0) / MIB:11.1f} {after.get('file', 0) / MIB:11.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
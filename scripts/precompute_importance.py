@@ -0,0 +1,91 @@
+"""Precompute global permutation importance for zoo models.
+
+Permutation importance re-scores the model once per feature and repeat, so
+it is far too slow to run per request. This computes it once over every
+race with a known result and caches it next to the model artifact
+(``<model>_<task>_importance.json``), where the API uses it as the fallback
+when a per-driver attribution cannot be computed.
+
+Usage:
+    python -m scripts.precompute_importance --models lr rf --task win
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from f1.analysis.explain import compute_global_importance, save_global_importance
+from f1.models.registry import ModelRegistry
+from f1.models.train import prepare_features
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def precompute_model(
+    model_name: str,
+    features: pd.DataFrame,
+    model_dir: Path,
+    task: str = "win",
+    n_repeats: int = 10,
+) -> Path:
+    """Compute and cache global importance for one model.
+
+    Args:
+        model_name: Zoo model name
+        features: Feature DataFrame (rows without a result are ignored)
+        model_dir: Model directory
+        task: Task type
+        n_repeats: Permutations per feature
+
+    Returns:
+        Path of the written importance file
+    """
+    model_info = ModelRegistry.load_model(model_name, model_dir, task=task)
+    metadata = model_info.get("metadata") or {}
+
+    labelled = features[features["finish_position"].notna()]
+    X, y, feature_cols = prepare_features(labelled, task, metadata.get("features"))
+
+    importance = compute_global_importance(model_info, X, y, feature_cols, n_repeats=n_repeats)
+    return save_global_importance(model_info, importance)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Precompute global feature importance")
+    parser.add_argument(
+        "--features",
+        type=Path,
+        default=Path("data/features/features.parquet"),
+        help="Path to features parquet",
+    )
+    parser.add_argument("--model-dir", type=Path, default=Path("models"), help="Model directory")
+    parser.add_argument(
+        "--models", nargs="+", default=["lr", "rf"], help="Models to compute importance for"
+    )
+    parser.add_argument("--task", default="win", help="Task type")
+    parser.add_argument("--n-repeats", type=int, default=10, help="Permutations per feature")
+
+    args = parser.parse_args()
+
+    features = pd.read_parquet(args.features)
+    if "finish_position" not in features.columns:
+        raise ValueError("Features must contain 'finish_position' to score importance")
+
+    for model_name in args.models:
+        try:
+            path = precompute_model(
+                model_name, features, args.model_dir, task=args.task, n_repeats=args.n_repeats
+            )
+            logger.info(f"{model_name}: wrote {path}")
+        except (FileNotFoundError, ValueError) as e:
+            logger.error(f"Skipping {model_name}: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Precompute race predictions into the prediction store.
+
+Fills the same store the API serves /api/f1/predict/race/{race_id} from, so
+a freshly deployed worker answers from disk instead of running inference.
+
+Usage:
+    python -m scripts.precompute_predictions --models xgb lgbm --season 2024
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from f1.data.race_index import RaceIndex
+from f1.models.registry import ModelRegistry, predict_race
+from f1.storage.predictions import PredictionKey, PredictionStore, features_version
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def precompute_model(
+    model_name: str,
+    race_index: RaceIndex,
+    race_ids: list[str],
+    model_dir: Path,
+    store: PredictionStore,
+    task: str = "win",
+    force: bool = False,
+) -> int:
+    """Precompute and store predictions for one model.
+
+    Args:
+        model_name: Model to run
+        race_index: Indexed features
+        race_ids: Races to predict
+        model_dir: Model directory
+        store: Prediction store to fill
+        task: Task type
+        force: Recompute races that are already stored
+
+    Returns:
+        Number of predictions written
+    """
+    model_version, _ = ModelRegistry.artifact_fingerprint(model_name, model_dir, task)
+    model_info = ModelRegistry.load_model(model_name, model_dir, task=task)
+
+    written = 0
+    for race_id in race_ids:
+        key = PredictionKey(race_id, model_name, task, race_index.version or "", model_version)
+        if not force and store.get(key) is not None:
+            continue
+
+        response = predict_race(
+            race_id=race_id,
+            model_name=model_name,
+            race_data=race_index.race(race_id),
+            model_dir=model_dir,
+            task=task,
+            model_provider=lambda *_: model_info,
+        )
+        store.put(key, response.model_dump_json().encode())
+        written += 1
+
+    logger.info(f"{model_name}: wrote {written} of {len(race_ids)} races")
+    return written
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Precompute race predictions")
+    parser.add_argument(
+        "--features",
+        type=Path,
+        default=Path("data/features/features.parquet"),
+        help="Path to features parquet",
+    )
+    parser.add_argument("--model-dir", type=Path, default=Path("models"), help="Model directory")
+    parser.add_argument(
+        "--store-dir",
+        type=Path,
+        default=Path("data/cache/predictions"),
+        help="Prediction store directory (must match PREDICTION_STORE_DIR)",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=ModelRegistry.ZOO_MODELS,
+        help="Models to precompute",
+    )
+    parser.add_argument("--task", default="win", help="Task type")
+    parser.add_argument("--season", type=int, default=None, help="Limit to one season")
+    parser.add_argument("--force", action="store_true", help="Overwrite stored predictions")
+
+    args = parser.parse_args()
+
+    race_index = RaceIndex(
+        pd.read_parquet(args.features), version=features_version(args.features)
+    )
+    race_ids = (
+        race_index.season_races(args.season) if args.season is not None else race_index.race_ids
+    )
+    store = PredictionStore(args.store_dir)
+
+    logger.info(
+        f"Precomputing {len(race_ids)} races x {len(args.models)} models "
+        f"(features {race_index.version}) into {args.store_dir}"
+    )
+
+    for model_name in args.models:
+        try:
+            precompute_model(
+                model_name,
+                race_index,
+                race_ids,
+                args.model_dir,
+                store,
+                task=args.task,
+                force=args.force,
+            )
+        except (FileNotFoundError, ValueError) as e:
+            logger.error(f"Skipping {model_name}: {e}")
+
+
+if __name__ == "__main__":
+    main()
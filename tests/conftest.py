@@ -33,3 +33,70 @@ def generate_test_fixtures():
         print("✅ Test fixtures generated successfully\n")
     else:
         print("\n✅ Test fixtures already exist\n")
+
+
+@pytest.fixture
+def api_settings(tmp_path):
+    """Settings pointing the API at the fixture features and models.
+
+    Copies the fixture parquet into the <data_dir>/features/ layout the
+    routers expect and keeps any prediction store output under tmp_path.
+    """
+    import shutil
+    from pathlib import Path
+
+    from api.core.config import Settings
+
+    fixtures_dir = Path(__file__).parent / "fixtures"
+    features_dir = tmp_path / "data" / "features"
+    features_dir.mkdir(parents=True)
+    shutil.copy(fixtures_dir / "data" / "features.parquet", features_dir / "features.parquet")
+
+    return Settings(
+        data_dir=str(tmp_path / "data"),
+        cache_dir=str(tmp_path / "data" / "cache"),
+        model_dir=str(fixtures_dir / "models"),
+        prediction_store_dir=str(tmp_path / "predictions"),
+        compute_threads=2,
+        compute_processes=0,
+    )
+
+
+@pytest.fixture
+def api_client(api_settings):
+    """TestClient with config and caches scoped to api_settings."""
+    from pathlib import Path
+
+    from fastapi.testclient import TestClient
+
+    from api import deps
+    from api.core.coalesce import SingleFlight
+    from api.core.executors import ComputeExecutors
+    from api.core.metrics import Metrics
+    from api.main import app
+    from f1.storage.predictions import PredictionStore
+
+    model_cache = deps.ModelCache()
+    prediction_cache = deps.PredictionCache(
+        store=PredictionStore(Path(api_settings.prediction_store_dir))
+    )
+    executors = ComputeExecutors(
+        threads=api_settings.compute_threads, processes=api_settings.compute_processes
+    )
+    coalescer = SingleFlight()
+    metrics = Metrics()
+    race_catalog_cache = deps.RaceCatalogCache()
+    explanation_cache = deps.ExplanationCache()
+    app.dependency_overrides[deps.get_config] = lambda: api_settings
+    app.dependency_overrides[deps.get_model_cache] = lambda: model_cache
+    app.dependency_overrides[deps.get_prediction_cache] = lambda: prediction_cache
+    app.dependency_overrides[deps.get_executors] = lambda: executors
+    app.dependency_overrides[deps.get_coalescer] = lambda: coalescer
+    app.dependency_overrides[deps.get_metrics] = lambda: metrics
+    app.dependency_overrides[deps.get_race_catalog_cache] = lambda: race_catalog_cache
+    app.dependency_overrides[deps.get_explanation_cache] = lambda: explanation_cache
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+    executors.shutdown()
@@ -0,0 +1,82 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from api.core.coalesce import SingleFlight, coalesce_key
+
+
+def test_concurrent_identical_calls_share_one_computation():
+    """Test that concurrent calls with the same key compute once."""
+    coalescer = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": 42}
+
+    async def run():
+        return await asyncio.gather(*(coalescer.run("key", compute) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = coalescer.stats()
+    assert stats["calls"] == 5
+    assert stats["executed"] == 1
+    assert stats["merged"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_sequential_calls_recompute():
+    """Test that nothing is cached once the computation finishes."""
+    coalescer = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    async def run():
+        return [await coalescer.run("key", compute), await coalescer.run("key", compute)]
+
+    assert asyncio.run(run()) == [1, 2]
+    assert coalescer.stats()["merged"] == 0
+
+
+def test_exception_is_shared_with_waiters():
+    """Test that a failed computation raises for every waiter."""
+    coalescer = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            *(coalescer.run("key", compute) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert coalescer.stats()["executed"] == 1
+
+
+def test_coalesce_key_canonicalizes_changes():
+    """Test that parameter and dict key order do not change the key."""
+    first = coalesce_key("counterfactual", race_id="2024_01", changes={"a": 1, "b": 2})
+    second = coalesce_key("counterfactual", changes={"b": 2, "a": 1}, race_id="2024_01")
+
+    assert first == second
+    assert first != coalesce_key("counterfactual", race_id="2024_01", changes={"a": 2})
+    assert first != coalesce_key("explain", race_id="2024_01", changes={"a": 1, "b": 2})
+
+
+@pytest.mark.parametrize("value", [[1, 2], {"x": [1]}])
+def test_coalesce_key_is_hashable(value):
+    """Test that container values produce hashable keys."""
+    hash(coalesce_key("endpoint", value=value))
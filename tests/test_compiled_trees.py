@@ -0,0 +1,136 @@
+"""Tests for compiled flat-array tree inference."""
+
+import json
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.linear_model import LogisticRegression
+
+from f1.models.compiled_trees import compile_forest
+from f1.models.registry import ModelRegistry, predict_frame
+from tests.test_registry import ZOO_FEATURES, create_test_data
+
+
+def _training_data(n_rows: int = 400, n_features: int = 6):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_rows, n_features))
+    # Integer-valued columns put many samples exactly on split thresholds
+    X[:, 0] = rng.integers(1, 21, size=n_rows)
+    y_class = (X[:, 0] + X[:, 1] + rng.normal(scale=2.0, size=n_rows) < 5).astype(int)
+    y_reg = X[:, 0] * 0.5 + X[:, 2] + rng.normal(size=n_rows)
+    return X, y_class, y_reg
+
+
+def _model(library: str, classifier: bool):
+    """Small ensemble of the given library, skipping if it is not installed."""
+    if library == "sklearn":
+        cls = RandomForestClassifier if classifier else RandomForestRegressor
+        return cls(n_estimators=20, max_depth=8, random_state=0)
+
+    module = pytest.importorskip(library)
+    if library == "xgboost":
+        cls = module.XGBClassifier if classifier else module.XGBRegressor
+        return cls(n_estimators=30, max_depth=4, random_state=0)
+    if library == "lightgbm":
+        cls = module.LGBMClassifier if classifier else module.LGBMRegressor
+        return cls(n_estimators=30, max_depth=4, num_leaves=15, random_state=0, verbose=-1)
+    cls = module.CatBoostClassifier if classifier else module.CatBoostRegressor
+    return cls(iterations=30, depth=4, random_state=0, verbose=False)
+
+
+LIBRARIES = ["sklearn", "xgboost", "lightgbm", "catboost"]
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+def test_compiled_classifier_matches_native_predict_proba(library):
+    """Test that a classifier compiles to the same probabilities."""
+    X, y, _ = _training_data()
+    X_new = np.vstack([X[:50], np.round(X[50:100], 1)])
+    model = _model(library, classifier=True).fit(X, y)
+
+    compiled = compile_forest(model)
+    np.testing.assert_allclose(
+        compiled.predict_proba(X_new), model.predict_proba(X_new), rtol=1e-5, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+def test_compiled_regressor_matches_native_predict(library):
+    """Test that a regressor compiles to the same predictions."""
+    X, _, y = _training_data()
+    model = _model(library, classifier=False).fit(X, y)
+
+    compiled = compile_forest(model)
+    np.testing.assert_allclose(
+        compiled.predict(X[:100]), model.predict(X[:100]), rtol=1e-5, atol=1e-5
+    )
+    with pytest.raises(ValueError, match="requires a classifier"):
+        compiled.predict_proba(X[:1])
+
+
+def test_compile_rejects_non_tree_models():
+    """Test that non-ensemble models are reported as not compilable."""
+    X, y, _ = _training_data()
+    with pytest.raises(ValueError, match="not a supported tree ensemble"):
+        compile_forest(LogisticRegression().fit(X, y))
+
+
+def _save_rf(model_dir, data) -> None:
+    """Train a small random forest and save it in the registry layout."""
+    model = RandomForestClassifier(n_estimators=10, max_depth=3, random_state=0).fit(
+        data[ZOO_FEATURES].values, (data["finish_position"] == 1).astype(int).values
+    )
+    model_subdir = model_dir / "rf"
+    model_subdir.mkdir()
+    joblib.dump(model, model_subdir / "rf_win.joblib")
+    with open(model_subdir / "rf_win_metadata.json", "w") as f:
+        json.dump({"features": ZOO_FEATURES}, f)
+
+
+def test_registry_serves_compiled_backend(tmp_path):
+    """Test that tree models load compiled by default and predict as natively."""
+    data = create_test_data()
+    _save_rf(tmp_path, data)
+
+    compiled_info = ModelRegistry.load_model("rf", tmp_path)
+    native_info = ModelRegistry.load_model("rf", tmp_path, tree_backend="native")
+    assert compiled_info["engine"] == "compiled"
+    assert native_info["engine"] == "native"
+    assert native_info["compiled"] is None
+
+    compiled = predict_frame(compiled_info, data)
+    native = predict_frame(native_info, data)
+    np.testing.assert_allclose(compiled["win_prob"], native["win_prob"], rtol=1e-9)
+
+    with pytest.raises(ValueError, match="Invalid tree backend"):
+        ModelRegistry.load_model("rf", tmp_path, tree_backend="onnx")
+
+
+def test_compile_failure_falls_back_to_native(tmp_path, monkeypatch):
+    """Test that any compilation error leaves the model served natively."""
+    from f1.models import registry
+
+    data = create_test_data()
+    _save_rf(tmp_path, data)
+
+    def broken(_model):
+        raise AttributeError("dump API changed")
+
+    monkeypatch.setattr(registry, "compile_forest", broken)
+    model_info = ModelRegistry.load_model("rf", tmp_path)
+    assert model_info["engine"] == "native"
+    assert predict_frame(model_info, data)["win_prob"].notna().all()
+
+
+def test_model_cache_threads_tree_backend(tmp_path):
+    """Test that the model cache loads with its configured tree backend."""
+    from api.deps import ModelCache
+
+    _save_rf(tmp_path, create_test_data())
+
+    assert ModelCache().get_model("rf", tmp_path)["engine"] == "compiled"
+    assert ModelCache(tree_backend="native").get_model("rf", tmp_path)["engine"] == "native"
+    with pytest.raises(ValueError, match="Invalid tree backend"):
+        ModelCache(tree_backend="onnx")
@@ -1,12 +1,18 @@
 """Tests for counterfactual analysis."""
 
 import pandas as pd
+import pytest
 
 from f1.analysis.counterfactuals import (
     apply_deltas,
+    compute_counterfactual,
     sanity_test_qualifying_degradation,
     sanity_test_qualifying_improvement,
+    stack_scenarios,
+    sweep_scenarios,
 )
+from f1.models.registry import predict_frame, score_frame
+from f1.schemas import CounterfactualRequest
 
 
 def create_test_race_data():
@@ -128,6 +134,128 @@ def test_sanity_tests():
     print("✓ Sanity tests pass")
 
 
+def test_incremental_counterfactual_matches_full_recompute():
+    """Test that re-scoring one row and renormalizing equals scoring the modified race."""
+    from sklearn.linear_model import LogisticRegression
+
+    data = create_test_race_data()
+    cols = ["quali_position", "driver_rolling_avg_finish", "driver_rolling_dnf_rate"]
+    model = LogisticRegression().fit(data[cols], data["finish_position"] <= 2)
+    model_info = {"model": model, "metadata": {"features": cols}, "type": "zoo"}
+
+    changes = {"qualifying_position_delta": -2, "reliability_risk_delta": 0.1}
+    request = CounterfactualRequest(race_id="2024_01", driver_id="SAI", changes=changes)
+    response = compute_counterfactual(
+        request,
+        data,
+        "lr",
+        model_provider=lambda *_: model_info,
+        baseline_scores=score_frame(model_info, data),
+    )
+
+    full = predict_frame(model_info, apply_deltas(data, "SAI", changes))
+    sai = full["driver_id"] == "SAI"
+    assert response.counterfactual.win_prob == pytest.approx(full.loc[sai, "win_prob"].iloc[0])
+    assert response.counterfactual.podium_prob == pytest.approx(
+        full.loc[sai, "podium_prob"].iloc[0]
+    )
+    assert response.counterfactual.expected_finish == 1 + (
+        full["win_prob"] > full.loc[sai, "win_prob"].iloc[0]
+    ).sum()
+
+
+def test_counterfactual_baseline_matches_race_prediction(api_client):
+    """Test that the counterfactual baseline agrees with the race prediction."""
+    prediction = api_client.get("/api/f1/predict/race/2024_01?model=quali_freq").json()
+
+    for delta in (-1, 2):
+        response = api_client.post(
+            "/api/f1/counterfactual?model=quali_freq",
+            json={
+                "race_id": "2024_01",
+                "driver_id": "HAM",
+                "changes": {"qualifying_position_delta": delta},
+            },
+        )
+        assert response.status_code == 200
+        baseline = response.json()["baseline"]
+        assert baseline["win_prob"] == pytest.approx(prediction["win_prob"]["HAM"])
+        assert baseline["expected_finish"] == prediction["expected_finish"]["HAM"]
+
+
+def test_stacked_scenarios_match_apply_deltas():
+    """Test that each stacked block equals apply_deltas for its scenario."""
+    data = create_test_race_data()
+    scenarios = sweep_scenarios(
+        {
+            "qualifying_position_delta": [-3, 0, 2.5, 30],
+            "driver_form_delta": [0.0, 0.2],
+            "reliability_risk_delta": [-0.1, 0.05],
+        }
+    )
+    assert len(scenarios) == 16
+
+    stacked = stack_scenarios(data, "LEC", [{}] + scenarios)
+    assert len(stacked) == 17 * len(data)
+
+    for k, changes in enumerate([{}] + scenarios):
+        block = stacked.iloc[k * len(data) : (k + 1) * len(data)].reset_index(drop=True)
+        assert (block["race_id"] == k).all()
+        expected = apply_deltas(data, "LEC", changes)
+        pd.testing.assert_frame_equal(
+            block.drop(columns="race_id"), expected.drop(columns="race_id"), check_dtype=False
+        )
+
+
+def test_sweep_rejects_bad_grids():
+    """Test that unknown changes, empty values and oversized grids are rejected."""
+    with pytest.raises(ValueError, match="Unknown sweep changes"):
+        sweep_scenarios({"tire_strategy": [1.0]})
+    with pytest.raises(ValueError, match="at least one value"):
+        sweep_scenarios({"driver_form_delta": []})
+    with pytest.raises(ValueError, match="combinations"):
+        sweep_scenarios({"driver_form_delta": [0.1] * 30, "reliability_risk_delta": [0.1] * 30})
+    with pytest.raises(ValueError, match="not found"):
+        stack_scenarios(create_test_race_data(), "XXX", [{}])
+
+
+def test_sweep_endpoint_matches_single_counterfactuals(api_client):
+    """Test that every sweep point equals the single counterfactual endpoint."""
+    deltas = [-2, 0, 3]
+    response = api_client.post(
+        "/api/f1/counterfactual/sweep?model=quali_freq",
+        json={
+            "race_id": "2024_01",
+            "driver_id": "HAM",
+            "grid": {"qualifying_position_delta": deltas},
+        },
+    )
+    assert response.status_code == 200
+    sweep = response.json()
+    assert [point["changes"] for point in sweep["points"]] == [
+        {"qualifying_position_delta": delta} for delta in deltas
+    ]
+
+    for delta, point in zip(deltas, sweep["points"]):
+        single = api_client.post(
+            "/api/f1/counterfactual?model=quali_freq",
+            json={
+                "race_id": "2024_01",
+                "driver_id": "HAM",
+                "changes": {"qualifying_position_delta": delta},
+            },
+        ).json()
+        assert sweep["baseline"] == pytest.approx(single["baseline"])
+        assert point["outcome"] == pytest.approx(single["counterfactual"])
+        assert point["delta"] == pytest.approx(single["delta"])
+
+    bad = api_client.post(
+        "/api/f1/counterfactual/sweep?model=quali_freq",
+        json={"race_id": "2024_01", "driver_id": "HAM", "grid": {"tire_strategy": [1]}},
+    )
+    assert bad.status_code == 400
+
+
 if __name__ == "__main__":
     print("Running counterfactual tests...\n")
 
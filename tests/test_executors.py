@@ -0,0 +1,78 @@
+"""Tests for the compute executor layer."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from api.core.executors import ComputeExecutors, ExecutorBusyError
+
+
+def test_thread_work_does_not_block_event_loop():
+    """Test that blocking calls run concurrently off the event loop."""
+    executors = ComputeExecutors(threads=2, processes=0)
+
+    async def run():
+        start = time.perf_counter()
+        await asyncio.gather(
+            executors.run_thread(time.sleep, 0.2), executors.run_thread(time.sleep, 0.2)
+        )
+        return time.perf_counter() - start
+
+    try:
+        elapsed = asyncio.run(run())
+    finally:
+        executors.shutdown()
+
+    # Two 0.2s sleeps on two threads overlap
+    assert elapsed < 0.35
+
+
+def test_full_queue_raises_busy():
+    """Test that a saturated pool fails fast with 503 instead of queueing."""
+    executors = ComputeExecutors(threads=1, processes=0, thread_queue_size=0)
+    release = threading.Event()
+
+    async def run():
+        blocked = asyncio.ensure_future(executors.run_thread(release.wait, 5))
+        await asyncio.sleep(0.05)
+        try:
+            with pytest.raises(ExecutorBusyError) as exc_info:
+                await executors.run_thread(int, "1")
+        finally:
+            release.set()
+            await blocked
+        return exc_info.value
+
+    try:
+        error = asyncio.run(run())
+        assert error.status_code == 503
+        assert error.headers["Retry-After"] == "1"
+        # Slot is released once the blocking task finishes
+        assert executors.stats()["thread"]["in_flight"] == 0
+    finally:
+        executors.shutdown()
+
+
+def test_process_work_runs_in_worker_process():
+    """Test that process-pool work runs outside the API process."""
+    executors = ComputeExecutors(threads=1, processes=1)
+
+    try:
+        worker_pid = asyncio.run(executors.run_process(os.getpid))
+    finally:
+        executors.shutdown()
+
+    assert worker_pid != os.getpid()
+
+
+def test_explain_endpoint_runs_on_executor(api_client):
+    """Test that the explain endpoint works through the executor layer."""
+    response = api_client.get(
+        "/api/f1/explain/race/2024_01?driver_id=VER&model=quali_freq&top_k=3"
+    )
+
+    assert response.status_code == 200
+    assert response.json()["driver_id"] == "VER"
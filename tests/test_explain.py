@@ -0,0 +1,249 @@
+"""Tests for whole-race explanations and the explanation cache."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from f1.analysis.explain import explain_prediction, explain_race, select_explanation
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def features():
+    return pd.read_parquet(FIXTURES_DIR / "data" / "features.parquet")
+
+
+def test_explain_race_covers_every_driver(features):
+    """Test that one call explains all drivers and matches per-driver results."""
+    race_id = "2024_01"
+    drivers = set(features.loc[features["race_id"] == race_id, "driver_id"])
+
+    explanation = explain_race(race_id, "quali_freq", features, model_dir=FIXTURES_DIR / "models")
+    assert set(explanation) == drivers
+
+    single = explain_prediction(
+        race_id, "VER", "quali_freq", features, model_dir=FIXTURES_DIR / "models", top_k=3
+    )
+    assert select_explanation(explanation, race_id, "VER", "quali_freq", 3) == single
+
+
+def test_select_explanation_unknown_driver(features):
+    """Test that an unknown driver is a ValueError, not an empty response."""
+    explanation = explain_race(
+        "2024_01", "quali_freq", features, model_dir=FIXTURES_DIR / "models"
+    )
+
+    with pytest.raises(ValueError, match="not found"):
+        select_explanation(explanation, "2024_01", "XXX", "quali_freq", 3)
+
+
+def test_explain_prediction_checks_driver_within_race(features):
+    """Test that a driver from another race is rejected for this race."""
+    other_race = features.loc[features["race_id"] == "2024_02"].head(1).assign(driver_id="ZZZ")
+    data = pd.concat([features, other_race], ignore_index=True)
+
+    with pytest.raises(ValueError, match="Driver ZZZ not found in race 2024_01"):
+        explain_prediction("2024_01", "ZZZ", "quali_freq", data, model_dir=FIXTURES_DIR / "models")
+
+
+def test_explain_endpoint_rejects_unknown_driver_before_explaining(api_client):
+    """Test that an unknown driver is a 404 without computing the race."""
+    from api import deps
+    from api.main import app
+
+    explanation_cache = app.dependency_overrides[deps.get_explanation_cache]()
+
+    response = api_client.get("/api/f1/explain/race/2024_01?driver_id=XXX&model=quali_freq")
+    assert response.status_code == 404
+    assert explanation_cache.stats()["entries"] == 0
+
+
+def test_explain_endpoint_computes_race_once(api_client):
+    """Test that other drivers and top_k values are served from the cache."""
+    from api import deps
+    from api.main import app
+
+    explanation_cache = app.dependency_overrides[deps.get_explanation_cache]()
+
+    for driver_id, top_k in [("VER", 3), ("HAM", 3), ("VER", 1)]:
+        response = api_client.get(
+            f"/api/f1/explain/race/2024_01?driver_id={driver_id}&model=quali_freq&top_k={top_k}"
+        )
+        assert response.status_code == 200
+        assert response.json()["driver_id"] == driver_id
+        assert len(response.json()["top_features"]) <= top_k
+
+    stats = explanation_cache.stats()
+    assert stats["entries"] == 1
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+    missing = api_client.get("/api/f1/explain/race/2024_01?driver_id=XXX&model=quali_freq")
+    assert missing.status_code == 404
+
+
+def _tree_model_info(tmp_path):
+    """Zoo-style model info for a small tree model saved under tmp_path."""
+    import joblib
+    from sklearn.ensemble import RandomForestClassifier
+
+    from tests.test_registry import create_test_data
+
+    data = create_test_data()
+    X = data[["quali_position", "driver_rolling_avg_finish"]]
+    model = RandomForestClassifier(n_estimators=5, random_state=0).fit(
+        X, data["finish_position"] == 1
+    )
+    model_path = tmp_path / "xgb_win.joblib"
+    joblib.dump(model, model_path)
+    return {"model": model, "metadata": None, "type": "zoo", "task": "win", "path": model_path}
+
+
+def test_tree_explainer_built_once_per_model(tmp_path):
+    """Test that the explainer is kept with the model info and reused."""
+    pytest.importorskip("shap")
+    from f1.analysis.explain import tree_explainer
+
+    model_info = _tree_model_info(tmp_path)
+
+    explainer = tree_explainer(model_info)
+    assert tree_explainer(model_info) is explainer
+    assert not (tmp_path / "xgb_win_explainer.joblib").exists()
+
+
+def test_tree_explainer_persisted_next_to_artifact(tmp_path):
+    """Test that a saved explainer is reused until the artifact changes."""
+    import os
+
+    pytest.importorskip("shap")
+
+    from f1.analysis.explain import tree_explainer
+
+    model_info = _tree_model_info(tmp_path)
+    tree_explainer(model_info, persist=True)
+    saved_path = tmp_path / "xgb_win_explainer.joblib"
+    assert saved_path.exists()
+
+    # A fresh load (e.g. another worker) reads the saved explainer
+    saved_mtime = saved_path.stat().st_mtime_ns
+    reloaded = {key: value for key, value in model_info.items() if key != "explainer"}
+    assert tree_explainer(reloaded, persist=True) is not None
+    assert saved_path.stat().st_mtime_ns == saved_mtime
+
+    # A retrained artifact invalidates it and the explainer is rebuilt
+    stat = model_info["path"].stat()
+    os.utime(model_info["path"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    retrained = {key: value for key, value in model_info.items() if key != "explainer"}
+    tree_explainer(retrained, persist=True)
+    assert saved_path.stat().st_mtime_ns != saved_mtime
+
+
+def test_linear_attribution_is_exact(tmp_path):
+    """Test that lr impacts are |coef x (value - training mean)| per driver."""
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+
+    from tests.test_registry import create_test_data
+
+    data = create_test_data()
+    cols = ["quali_position", "driver_rolling_avg_finish"]
+    model = LogisticRegression().fit(data[cols], data["finish_position"] == 1)
+    means = {col: float(data[col].mean()) for col in cols}
+    model_info = {
+        "model": model,
+        "metadata": {"features": cols, "feature_means": means},
+        "type": "zoo",
+        "task": "win",
+    }
+
+    race_df = data[data["race_id"] == "2024_01"]
+    explanation = explain_race(
+        "2024_01", "lr", race_df, model_dir=tmp_path, model_provider=lambda *_: model_info
+    )
+
+    driver_id = race_df["driver_id"].iloc[0]
+    row = race_df.iloc[0]
+    expected = {
+        col: abs(coef * (row[col] - means[col])) for col, coef in zip(cols, model.coef_[0])
+    }
+    impacts = {impact.name: impact.impact for impact in explanation[driver_id]}
+    assert impacts == pytest.approx(expected)
+    assert [impact.impact for impact in explanation[driver_id]] == sorted(
+        expected.values(), reverse=True
+    )
+    assert np.isfinite(list(impacts.values())).all()
+
+
+def test_global_importance_cached_next_to_artifact(tmp_path):
+    """Test that global importance is reused until the artifact changes."""
+    import os
+
+    from f1.analysis.explain import load_global_importance, save_global_importance
+
+    model_info = _tree_model_info(tmp_path)
+    save_global_importance(model_info, {"quali_position": 0.2, "driver_rolling_avg_finish": 0.1})
+    assert (tmp_path / "xgb_win_importance.json").exists()
+
+    fresh = dict(model_info)
+    assert load_global_importance(fresh) == {
+        "quali_position": 0.2,
+        "driver_rolling_avg_finish": 0.1,
+    }
+
+    stat = model_info["path"].stat()
+    os.utime(model_info["path"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    retrained = dict(model_info)
+    assert load_global_importance(retrained) is None
+
+
+def test_nbt_tlf_ablation_batched_against_neutral_baseline(tmp_path):
+    """Test that one batched pass matches per-driver ablation with neutral inputs."""
+    torch = pytest.importorskip("torch")
+    from f1.models.nbt_tlf import NBTTLFModel
+
+    torch.manual_seed(0)
+    model = NBTTLFModel(n_drivers=4, n_constructors=3, n_tracks=2, embed_dim=4, temporal_dim=4)
+    config = {
+        "driver_to_idx": {"UNK": 0, "VER": 1, "HAM": 2, "LEC": 3},
+        "constructor_to_idx": {"UNK": 0, "Red Bull": 1, "Ferrari": 2},
+        "track_to_idx": {"UNK": 0, "bahrain": 1},
+    }
+    model_info = {"model": model, "config": config, "type": "nbt_tlf"}
+    race_df = pd.DataFrame(
+        {
+            "race_id": "r1",
+            "driver_id": ["VER", "HAM", "LEC"],
+            "team": ["Red Bull", "Ferrari", "Ferrari"],
+            "track_id": "bahrain",
+            # Race index season * 100 + round, within the encoding's range
+            "season": 5,
+            "round": 3,
+        }
+    )
+
+    explanation = explain_race(
+        "r1", "nbt_tlf", race_df, model_dir=tmp_path, model_provider=lambda *_: model_info
+    )
+
+    model.eval()
+    neutral = model.neutral_input()
+    segments = model.input_segments()
+    with torch.no_grad():
+        for i, driver_id in enumerate(race_df["driver_id"]):
+            inputs = model.score_inputs(
+                torch.tensor([config["driver_to_idx"][driver_id]]),
+                torch.tensor([config["constructor_to_idx"][race_df["team"][i]]]),
+                torch.tensor([1]),
+                torch.tensor([503]),
+            )
+            score = model.score_network(inputs).item()
+            expected = {}
+            for name, columns in segments.items():
+                ablated = inputs.clone()
+                ablated[:, columns] = neutral[columns]
+                expected[name] = abs(score - model.score_network(ablated).item())
+
+            impacts = {impact.name: impact.impact for impact in explanation[driver_id]}
+            assert impacts == pytest.approx(expected, abs=1e-6)
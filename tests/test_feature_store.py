@@ -0,0 +1,89 @@
+"""Tests for the memory-mapped Arrow feature store."""
+
+import numpy as np
+import pandas as pd
+
+from api.deps import DataCache
+from f1.storage.feature_store import arrow_path, ensure_arrow, read_mapped
+from f1.storage.predictions import features_version
+from tests.test_registry import create_test_data
+
+
+def _write_shuffled(path):
+    """Write test features with races interleaved and a float null."""
+    data = create_test_data().iloc[[3, 0, 4, 1, 5, 2]].reset_index(drop=True)
+    data.loc[0, "driver_rolling_avg_finish"] = np.nan
+    data.to_parquet(path)
+    return data
+
+
+def test_arrow_copy_is_sorted_and_zero_copy(tmp_path):
+    """Test that the Arrow copy is grouped by race and maps numeric columns."""
+    features_path = tmp_path / "features.parquet"
+    data = _write_shuffled(features_path)
+
+    path = ensure_arrow(features_path, tmp_path / "mmap", "v1")
+    mapped = read_mapped(path)
+
+    assert list(mapped["race_id"]) == sorted(data["race_id"])
+    # Stable: driver order within each race is preserved
+    for race_id, rows in data.groupby("race_id", sort=False):
+        mapped_drivers = mapped.loc[mapped["race_id"] == race_id, "driver_id"]
+        assert list(mapped_drivers) == list(rows["driver_id"])
+
+    # Float nulls become NaN, and numeric columns are read-only views of the map
+    assert mapped["driver_rolling_avg_finish"].isna().sum() == 1
+    assert not mapped["quali_position"].to_numpy().flags.writeable
+    assert not mapped["driver_rolling_avg_finish"].to_numpy().flags.writeable
+
+
+def test_large_table_maps_without_copying(tmp_path):
+    """Test that tables longer than one default Arrow batch are still zero-copy."""
+    n_rows = 100_000
+    features_path = tmp_path / "features.parquet"
+    pd.DataFrame(
+        {
+            "race_id": np.repeat([f"2024_{i:02d}" for i in range(20)], n_rows // 20),
+            "quali_position": np.arange(n_rows, dtype=np.float64),
+        }
+    ).to_parquet(features_path)
+
+    mapped = read_mapped(ensure_arrow(features_path, tmp_path / "mmap", "v1"))
+
+    assert len(mapped) == n_rows
+    assert not mapped["quali_position"].to_numpy().flags.writeable
+
+
+def test_new_version_replaces_stale_copy(tmp_path):
+    """Test that writing a new version removes copies of older versions."""
+    features_path = tmp_path / "features.parquet"
+    _write_shuffled(features_path)
+    store_dir = tmp_path / "mmap"
+
+    old = ensure_arrow(features_path, store_dir, "v1")
+    assert ensure_arrow(features_path, store_dir, "v1") == old
+
+    new = ensure_arrow(features_path, store_dir, "v2")
+    assert new == arrow_path(features_path, store_dir, "v2")
+    assert not old.exists()
+
+
+def test_data_cache_serves_mapped_features(tmp_path):
+    """Test that DataCache reads through the store and indexes without copying."""
+    features_path = tmp_path / "features.parquet"
+    data = _write_shuffled(features_path)
+
+    cache = DataCache()
+    cache.mmap_dir = tmp_path / "mmap"
+    try:
+        index = cache.get_index(features_path)
+    finally:
+        cache.mmap_dir = None
+
+    assert arrow_path(features_path, tmp_path / "mmap", features_version(features_path)).exists()
+    assert not index.features["quali_position"].to_numpy().flags.writeable
+
+    expected = data[data["race_id"] == "2024_02"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        index.race("2024_02").reset_index(drop=True), expected, check_dtype=False
+    )
@@ -0,0 +1,37 @@
+"""Import-time checks for the API.
+
+Each check runs in a fresh interpreter, since this process has usually
+imported everything already.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES = ("torch", "shap", "xgboost", "lightgbm", "catboost", "sklearn", "scipy")
+
+_PROBE = """
+import json, sys
+import api.main
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"heavy": heavy}}))
+"""
+
+
+def _probe_import() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES)],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_api_import_skips_heavy_frameworks():
+    """Test that importing the API does not import any ML framework."""
+    assert _probe_import()["heavy"] == []
+
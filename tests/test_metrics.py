@@ -0,0 +1,119 @@
+"""Tests for per-stage latency metrics."""
+
+import asyncio
+
+from api.core.executors import ComputeExecutors
+from api.core.metrics import Histogram, Metrics, hit_ratio, measured
+from f1.profiling import collect_stages, stage
+
+
+def test_stage_is_noop_outside_collection():
+    """Test that stage hooks record nothing unless stages are collected."""
+    with stage("inference"):
+        pass
+
+    with collect_stages() as stages, stage("inference"):
+        pass
+
+    assert [name for name, _ in stages] == ["inference"]
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test Prometheus histogram exposition."""
+    histogram = Histogram("latency_seconds", "Latency", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "inference")
+    histogram.observe(0.5, "inference")
+    histogram.observe(5.0, "inference")
+
+    lines = histogram.render()
+
+    assert 'latency_seconds_bucket{stage="inference",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{stage="inference",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{stage="inference",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{stage="inference"} 3' in lines
+
+
+def test_run_records_worker_stages():
+    """Test that stages recorded on a pool thread reach the metrics."""
+    metrics = Metrics()
+    executors = ComputeExecutors(threads=1, processes=0)
+
+    def work():
+        with stage("inference"):
+            return 42
+
+    try:
+        result = asyncio.run(metrics.run("predict_race", executors.run_thread, work))
+    finally:
+        executors.shutdown()
+
+    assert result == 42
+    for name in ("inference", "compute", "total", "executor_wait"):
+        assert metrics.stages.count("predict_race", name) == 1
+
+
+def test_disabled_metrics_record_nothing():
+    """Test that enable_metrics=False turns observations into no-ops."""
+    metrics = Metrics(enabled=False)
+    result, stages = measured(int, "7")
+    metrics.observe_stages("predict_race", stages)
+
+    assert result == 7
+    assert metrics.stages.count("predict_race", "compute") == 0
+
+
+def test_render_emits_counters_with_total_suffix():
+    """Test that counters render as Prometheus counters named *_total."""
+    metrics = Metrics()
+    text = metrics.render(
+        gauges={"f1_queue": ("Queued", "pool", {"thread": 2})},
+        counters={"f1_merged": ("Merged calls", "kind", {"merged": 5})},
+    )
+
+    assert "# TYPE f1_queue gauge" in text
+    assert "# TYPE f1_merged_total counter" in text
+    assert 'f1_merged_total{kind="merged"} 5' in text
+
+
+def test_export_textfile_rewrites_snapshot(tmp_path):
+    """Test that the textfile snapshot is refreshed while the process runs."""
+    metrics = Metrics()
+    renders = []
+
+    def render():
+        renders.append(len(renders) + 1)
+        return f"snapshot {renders[-1]}\n"
+
+    async def run_until_second_snapshot():
+        task = asyncio.create_task(metrics.export_textfile(tmp_path, render, 0.01))
+        while len(renders) < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(asyncio.wait_for(run_until_second_snapshot(), timeout=5))
+
+    (path,) = tmp_path.glob("api_*.prom")
+    assert path.read_text() == f"snapshot {renders[-1]}\n"
+
+
+def test_hit_ratio():
+    """Test cache hit ratio from counters."""
+    assert hit_ratio({"hits": 3, "misses": 1}) == 0.75
+    assert hit_ratio({"hits": 0, "misses": 0}) == 0.0
+
+
+def test_metrics_endpoint_exposes_prediction_stages(api_client):
+    """Test that /metrics reports stages of a served prediction."""
+    assert api_client.get("/api/f1/predict/race/2024_01?model=quali_freq").status_code == 200
+
+    response = api_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    body = response.text
+    for name in ("feature_lookup", "model_load", "inference", "calibration", "response"):
+        assert f'operation="predict_race",stage="{name}"' in body
+    assert 'f1_executor_queue_depth{pool="thread"}' in body
+    assert 'f1_cache_hit_ratio{cache="model"}' in body
+    assert "# TYPE f1_cache_misses_total counter" in body
+    assert 'f1_coalescing_requests_total{kind="calls"}' in body
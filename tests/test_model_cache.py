@@ -0,0 +1,103 @@
+"""Tests for the in-process model cache."""
+
+import os
+
+from api.core.cache import LRUCache
+from api.deps import ModelCache
+from f1.models.baselines import QualifyingFrequencyBaseline
+from f1.models.registry import ModelRegistry, predict_race
+from tests.test_registry import create_test_data
+
+
+def _save_baseline(model_dir):
+    """Train and save a quali_freq baseline into model_dir."""
+    model = QualifyingFrequencyBaseline()
+    model.fit(create_test_data())
+    model.save(model_dir / "quali_freq.joblib")
+
+
+def test_lru_cache_evicts_by_weight():
+    """Test that least recently used entries are evicted past max_weight."""
+    cache = LRUCache(max_weight=10)
+    cache.put("a", 1, weight=4)
+    cache.put("b", 2, weight=4)
+
+    # Touch "a" so "b" becomes least recently used
+    assert cache.get("a") == 1
+
+    cache.put("c", 3, weight=4)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.weight == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_keeps_single_oversized_entry():
+    """Test that an entry heavier than the bound is still cached."""
+    cache = LRUCache(max_weight=5)
+    cache.put("big", "value", weight=50)
+
+    assert cache.get("big") == "value"
+
+
+def test_model_cache_loads_once(tmp_path, monkeypatch):
+    """Test that warm requests are served without reloading the artifact."""
+    _save_baseline(tmp_path)
+
+    calls = []
+    original_load = ModelRegistry.load_model.__func__
+
+    def counting_load(cls, model_name, model_dir, task="win", device="cpu", **kwargs):
+        calls.append(model_name)
+        return original_load(cls, model_name, model_dir, task=task, device=device, **kwargs)
+
+    monkeypatch.setattr(ModelRegistry, "load_model", classmethod(counting_load))
+
+    cache = ModelCache(revalidate_seconds=60)
+    first = cache.get_model("quali_freq", tmp_path)
+    second = cache.get_model("quali_freq", tmp_path)
+
+    assert first is second
+    assert calls == ["quali_freq"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_model_cache_reloads_retrained_artifact(tmp_path):
+    """Test that a changed artifact fingerprint produces a fresh entry."""
+    _save_baseline(tmp_path)
+
+    cache = ModelCache(revalidate_seconds=0)
+    first = cache.get_model("quali_freq", tmp_path)
+
+    # Simulate a retrain by bumping the artifact mtime
+    artifact = tmp_path / "quali_freq.joblib"
+    stat = artifact.stat()
+    os.utime(artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = cache.get_model("quali_freq", tmp_path)
+
+    assert first is not second
+    # Superseded version is dropped rather than left to age out
+    assert cache.stats()["entries"] == 1
+
+
+def test_predict_race_uses_model_provider(tmp_path):
+    """Test that predict_race sources models from an injected provider."""
+    _save_baseline(tmp_path)
+    cache = ModelCache()
+
+    for _ in range(3):
+        response = predict_race(
+            race_id="2024_01",
+            model_name="quali_freq",
+            race_data=create_test_data(),
+            model_dir=tmp_path,
+            model_provider=cache.get_model,
+        )
+        assert set(response.win_prob) == {"VER", "HAM", "LEC"}
+
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
@@ -0,0 +1,211 @@
+"""Tests for batched NBT-TLF inference and the NumPy export."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from f1.models.nbt_tlf import (  # noqa: E402
+    NBTTLFModel,
+    NBTTLFTrainer,
+    predict_race,
+    score_drivers,
+)
+from f1.models.nbt_tlf_numpy import NUMPY_ARTIFACT  # noqa: E402
+from f1.models.nbt_tlf_numpy import score_drivers as numpy_score_drivers  # noqa: E402
+from f1.models.registry import ModelRegistry, predict_frame  # noqa: E402
+
+MAPPINGS = {
+    "driver_to_idx": {"UNK": 0, "VER": 1, "HAM": 2, "LEC": 3},
+    "constructor_to_idx": {"UNK": 0, "Red Bull": 1, "Mercedes": 2, "Ferrari": 3},
+    "track_to_idx": {"UNK": 0, "bahrain": 1},
+}
+
+
+def _race(race_id: str = "r1", round_num: int = 1) -> pd.DataFrame:
+    # Race index season * 100 + round must fit the temporal encoding table
+    return pd.DataFrame(
+        {
+            "race_id": race_id,
+            "driver_id": ["VER", "HAM", "LEC", "NEW"],
+            "team": ["Red Bull", "Mercedes", "Ferrari", "Haas"],
+            "track_id": "bahrain",
+            "season": 3,
+            "round": round_num,
+            "quali_position": [1.0, 2.0, np.nan, 4.0],
+        }
+    )
+
+
+def _per_row_scores(model, race_df, numeric_cols=()):
+    scores = []
+    with torch.no_grad():
+        for _, row in race_df.iterrows():
+            numeric = None
+            if numeric_cols:
+                values = [0.0 if pd.isna(row[c]) else row[c] for c in numeric_cols]
+                numeric = torch.tensor([values], dtype=torch.float32)
+            scores.append(
+                model.compute_score(
+                    torch.tensor([MAPPINGS["driver_to_idx"].get(row["driver_id"], 0)]),
+                    torch.tensor([MAPPINGS["constructor_to_idx"].get(row["team"], 0)]),
+                    torch.tensor([MAPPINGS["track_to_idx"].get(row["track_id"], 0)]),
+                    torch.tensor([int(row["season"] * 100 + row["round"])]),
+                    numeric,
+                ).item()
+            )
+    return np.array(scores)
+
+
+def test_batched_scores_match_per_row_loop():
+    """Test that one forward pass over several races equals per-driver calls."""
+    torch.manual_seed(0)
+    model = NBTTLFModel(n_drivers=4, n_constructors=4, n_tracks=2, embed_dim=4, temporal_dim=4)
+    model.eval()
+    races = pd.concat([_race("r1", 1), _race("r2", 2)], ignore_index=True)
+
+    scores = score_drivers(model, races, **MAPPINGS)
+
+    np.testing.assert_allclose(scores, _per_row_scores(model, races), rtol=1e-5, atol=1e-6)
+
+
+def test_numeric_features_fed_at_inference():
+    """Test that configured numeric columns reach the score network."""
+    torch.manual_seed(0)
+    model = NBTTLFModel(
+        n_drivers=4,
+        n_constructors=4,
+        n_tracks=2,
+        embed_dim=4,
+        temporal_dim=4,
+        numeric_features_dim=1,
+    )
+    model.eval()
+    race = _race()
+
+    scores = score_drivers(model, race, **MAPPINGS, numeric_feature_cols=["quali_position"])
+    np.testing.assert_allclose(
+        scores, _per_row_scores(model, race, ["quali_position"]), rtol=1e-5, atol=1e-6
+    )
+
+    predictions = predict_race(model, race, **MAPPINGS, numeric_feature_cols=["quali_position"])
+    assert list(predictions["driver_id"]) == list(race["driver_id"])
+    assert predictions["win_prob"].sum() == pytest.approx(1.0)
+
+
+def test_cached_projections_match_full_network_and_refresh_after_training():
+    """Test that inference uses the factorized first layer, rebuilt after train()."""
+    torch.manual_seed(0)
+    model = NBTTLFModel(
+        n_drivers=4,
+        n_constructors=4,
+        n_tracks=2,
+        embed_dim=4,
+        temporal_dim=4,
+        numeric_features_dim=1,
+    )
+    idx = (torch.tensor([0, 1, 2, 3]), torch.tensor([3, 2, 1, 0]), torch.tensor([1, 1, 0, 0]))
+    race_idx = torch.tensor([301, 301, 302, 302])
+    numeric = torch.tensor([[1.0], [-0.5], [0.0], [2.0]])
+
+    def full_network():
+        return model.score_network(model.score_inputs(*idx, race_idx, numeric))
+
+    model.eval()
+    with torch.no_grad():
+        np.testing.assert_allclose(
+            model.compute_score(*idx, race_idx, numeric), full_network(), rtol=1e-5, atol=1e-6
+        )
+        cached = model.compute_score(*idx, race_idx, numeric).clone()
+
+    # One optimizer step changes the weights; train() must drop the cache
+    model.train()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.5)
+    model.compute_score(*idx, race_idx, numeric).sum().backward()
+    optimizer.step()
+
+    model.eval()
+    with torch.no_grad():
+        refreshed = model.compute_score(*idx, race_idx, numeric)
+        np.testing.assert_allclose(refreshed, full_network(), rtol=1e-5, atol=1e-6)
+    assert not torch.allclose(refreshed, cached)
+
+
+def _save_model(model_dir, numeric_cols=()) -> NBTTLFModel:
+    torch.manual_seed(0)
+    model = NBTTLFModel(
+        n_drivers=4,
+        n_constructors=4,
+        n_tracks=2,
+        embed_dim=4,
+        temporal_dim=4,
+        numeric_features_dim=len(numeric_cols),
+    )
+    config = {
+        "n_drivers": 4,
+        "n_constructors": 4,
+        "n_tracks": 2,
+        "embed_dim": 4,
+        "temporal_dim": 4,
+        "numeric_features_dim": len(numeric_cols),
+        "numeric_feature_cols": list(numeric_cols),
+        **MAPPINGS,
+    }
+    NBTTLFTrainer(model).save(model_dir / "nbt_tlf", config)
+    model.eval()
+    return model
+
+
+def test_registry_serves_numpy_export_with_torch_scores(tmp_path):
+    """Test that save exports model.npz and the NumPy engine matches torch."""
+    model = _save_model(tmp_path, ["quali_position"])
+    assert (tmp_path / "nbt_tlf" / NUMPY_ARTIFACT).exists()
+
+    model_info = ModelRegistry.load_model("nbt_tlf", tmp_path)
+    assert model_info["engine"] == "numpy"
+    assert "trainer" not in model_info
+
+    races = pd.concat([_race("r1", 1), _race("r2", 2)], ignore_index=True)
+    np.testing.assert_allclose(
+        numpy_score_drivers(
+            model_info["model"], races, **MAPPINGS, numeric_feature_cols=["quali_position"]
+        ),
+        score_drivers(model, races, **MAPPINGS, numeric_feature_cols=["quali_position"]),
+        rtol=1e-5,
+        atol=1e-6,
+    )
+    np.testing.assert_allclose(
+        model_info["model"].neutral_input(),
+        model.neutral_input().detach().numpy(),
+        rtol=1e-5,
+        atol=1e-6,
+    )
+
+    predictions = predict_frame(model_info, races, calibrate=False)
+    assert predictions.groupby("race_id")["win_prob"].sum().to_numpy() == pytest.approx(1.0)
+
+
+def test_numpy_engine_does_not_import_torch(tmp_path):
+    """Test that serving an exported model leaves torch unimported."""
+    _save_model(tmp_path)
+    code = (
+        "import sys\n"
+        "import pandas as pd\n"
+        "from pathlib import Path\n"
+        "from f1.models.registry import ModelRegistry, predict_frame\n"
+        f"info = ModelRegistry.load_model('nbt_tlf', Path({str(tmp_path)!r}))\n"
+        "race = pd.DataFrame({'race_id': 'r1', 'driver_id': ['VER', 'HAM'],"
+        " 'team': ['Red Bull', 'Mercedes'], 'track_id': 'bahrain', 'season': 3, 'round': 1})\n"
+        "predict_frame(info, race)\n"
+        "assert 'torch' not in sys.modules, 'torch imported'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=Path(__file__).parents[1]
+    )
+    assert result.returncode == 0, result.stderr
+
@@ -0,0 +1,101 @@
+"""Tests for the torch-free NumPy NBT-TLF engine."""
+
+import numpy as np
+import pytest
+
+from f1.models.nbt_tlf_numpy import NumpyNBTTLF
+
+
+def _random_model(numeric_features_dim: int = 1) -> NumpyNBTTLF:
+    """NumpyNBTTLF with random float32 weights of the production layout."""
+    rng = np.random.default_rng(0)
+    embed, temporal, hidden = 4, 4, 8
+    input_dim = 3 * embed + temporal + numeric_features_dim
+
+    def array(*shape):
+        return rng.normal(size=shape).astype(np.float32)
+
+    return NumpyNBTTLF(
+        driver_embedding=array(4, embed),
+        constructor_embedding=array(4, embed),
+        track_embedding=array(2, embed),
+        pe=array(400, temporal),
+        layers=[
+            (array(hidden, input_dim), array(hidden)),
+            (array(hidden // 2, hidden), array(hidden // 2)),
+            (array(1, hidden // 2), array(1)),
+        ],
+        numeric_features_dim=numeric_features_dim,
+    )
+
+
+def _full_network(model: NumpyNBTTLF, inputs: np.ndarray) -> np.ndarray:
+    """Reference MLP without the first-layer factorization."""
+    hidden = inputs
+    for i, (weight_t, bias) in enumerate(model.layers):
+        hidden = hidden @ weight_t + bias
+        if i < len(model.layers) - 1:
+            hidden = np.maximum(hidden, 0.0)
+    return hidden
+
+
+def test_factorized_first_layer_matches_full_network():
+    """Test that cached projections reproduce the unfactorized network."""
+    model = _random_model()
+
+    drivers, constructors, tracks = np.arange(4), np.arange(4), np.arange(2)
+    d, c, t = (grid.ravel() for grid in np.meshgrid(drivers, constructors, tracks, indexing="ij"))
+    race = np.full(len(d), 301)
+    numeric = np.linspace(-1, 1, len(d), dtype=np.float32)[:, None]
+
+    inputs = model.score_inputs(d, c, t, race, numeric)
+    expected = _full_network(model, inputs)
+
+    np.testing.assert_allclose(
+        model.compute_score(d, c, t, race, numeric), expected, rtol=1e-5, atol=1e-5
+    )
+    np.testing.assert_allclose(model.score_network(inputs), expected, rtol=1e-5, atol=1e-5)
+
+
+def test_score_grid_matches_per_combination_scores():
+    """Test that the grid scores every combination with neutral numeric features."""
+    model = _random_model()
+    drivers, constructors, tracks = np.array([1, 3]), np.arange(4), np.array([1])
+    d, c, t = (grid.ravel() for grid in np.meshgrid(drivers, constructors, tracks, indexing="ij"))
+
+    grid = model.score_grid(drivers, constructors, tracks, 301)
+
+    assert grid.shape == (2, 4, 1)
+    np.testing.assert_allclose(
+        grid,
+        model.compute_score(d, c, t, np.full(len(d), 301), np.zeros((len(d), 1))).reshape(2, 4, 1),
+        rtol=1e-5,
+        atol=1e-5,
+    )
+
+
+def test_load_round_trips_exported_arrays(tmp_path):
+    """Test that load reads the export layout written by export_numpy."""
+    model = _random_model(numeric_features_dim=0)
+    arrays = {
+        "driver_embedding": model.driver_embedding,
+        "constructor_embedding": model.constructor_embedding,
+        "track_embedding": model.track_embedding,
+        "pe": model.pe,
+        "n_layers": np.array(len(model.layers)),
+        "numeric_features_dim": np.array(0),
+    }
+    for i, (weight_t, bias) in enumerate(model.layers):
+        arrays[f"linear_{i}_weight"] = weight_t.T
+        arrays[f"linear_{i}_bias"] = bias
+    np.savez_compressed(tmp_path / "model.npz", **arrays)
+
+    loaded = NumpyNBTTLF.load(tmp_path / "model.npz")
+    index = np.array([0, 1, 3])
+    np.testing.assert_array_equal(
+        loaded.compute_score(index, index, index % 2, index + 300),
+        model.compute_score(index, index, index % 2, index + 300),
+    )
+
+    with pytest.raises(FileNotFoundError):
+        NumpyNBTTLF.load(tmp_path / "missing.npz")
@@ -0,0 +1,88 @@
+"""Tests for the multi-race prediction endpoints."""
+
+import json
+
+
+def test_batch_predictions_match_single_endpoint(api_client):
+    """Test that batch results equal the single-race endpoint's results."""
+    response = api_client.post(
+        "/api/f1/predict/batch",
+        json={"race_ids": ["2024_01", "2024_03"], "models": ["quali_freq"]},
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["errors"] == []
+    assert [p["race_id"] for p in data["predictions"]] == ["2024_01", "2024_03"]
+
+    for prediction in data["predictions"]:
+        single = api_client.get(f"/api/f1/predict/race/{prediction['race_id']}?model=quali_freq")
+        assert single.json()["win_prob"] == prediction["win_prob"]
+
+
+def test_batch_reports_unknown_races_and_models(api_client):
+    """Test that bad races and models become errors without failing the batch."""
+    response = api_client.post(
+        "/api/f1/predict/batch",
+        json={"race_ids": ["2024_02", "1999_01"], "models": ["quali_freq", "gpt4"]},
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert [p["race_id"] for p in data["predictions"]] == ["2024_02"]
+
+    error_races = {e["race_id"] for e in data["errors"] if e["race_id"]}
+    error_models = {e["model_name"] for e in data["errors"] if e["model_name"]}
+    assert error_races == {"1999_01"}
+    assert error_models == {"gpt4"}
+
+
+def test_batch_rejects_empty_request(api_client):
+    """Test request validation for an empty race list."""
+    response = api_client.post("/api/f1/predict/batch", json={"race_ids": []})
+    assert response.status_code == 422
+
+
+def test_season_stream_yields_one_line_per_race(api_client):
+    """Test that the season stream emits one prediction per race in round order."""
+    with api_client.stream("GET", "/api/f1/predict/season/2024?model=quali_freq") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert [line["race_id"] for line in lines] == [f"2024_0{i}" for i in range(1, 6)]
+
+    single = api_client.get("/api/f1/predict/race/2024_02?model=quali_freq").json()
+    assert lines[1]["win_prob"] == single["win_prob"]
+
+
+def test_season_stream_unknown_season_or_model(api_client):
+    """Test that unknown seasons and models fail before streaming starts."""
+    assert api_client.get("/api/f1/predict/season/1999?model=quali_freq").status_code == 404
+    assert api_client.get("/api/f1/predict/season/2024?model=gpt4").status_code == 400
+
+
+def test_bulk_endpoints_columnar_format(api_client):
+    """Test that batch and season endpoints can return parallel arrays."""
+    mapping = api_client.get("/api/f1/predict/race/2024_01?model=quali_freq").json()
+
+    response = api_client.post(
+        "/api/f1/predict/batch?format=columnar",
+        json={"race_ids": ["2024_01"], "models": ["quali_freq"]},
+    )
+    assert response.status_code == 200
+    columnar = response.json()["predictions"][0]
+    assert columnar["driver_ids"] == list(mapping["win_prob"])
+    assert columnar["win_prob"] == list(mapping["win_prob"].values())
+    assert dict(zip(columnar["driver_ids"], columnar["expected_finish"])) == (
+        mapping["expected_finish"]
+    )
+
+    with api_client.stream(
+        "GET", "/api/f1/predict/season/2024?model=quali_freq&format=columnar"
+    ) as stream:
+        first = json.loads(next(line for line in stream.iter_lines() if line))
+    assert first == columnar
+
+    bad = api_client.get("/api/f1/predict/season/2024?model=quali_freq&format=csv")
+    assert bad.status_code == 422
@@ -0,0 +1,86 @@
+"""Tests for the prediction store and conditional prediction responses."""
+
+from api.core.http import etag_matches
+from f1.storage.predictions import PredictionKey, PredictionStore, payload_etag
+
+
+def _key(**overrides):
+    """Build a prediction key with test defaults."""
+    fields = {
+        "race_id": "2024_01",
+        "model_name": "xgb",
+        "task": "win",
+        "features_version": "feat1",
+        "model_version": "model1",
+    }
+    fields.update(overrides)
+    return PredictionKey(**fields)
+
+
+def test_store_roundtrip(tmp_path):
+    """Test that stored payloads are returned byte-for-byte."""
+    store = PredictionStore(tmp_path)
+    store.put(_key(), b'{"race_id": "2024_01"}')
+
+    assert store.get(_key()) == b'{"race_id": "2024_01"}'
+    # No temp files left behind
+    assert [p.suffix for p in tmp_path.rglob("*") if p.is_file()] == [".json"]
+
+
+def test_store_keys_pin_versions(tmp_path):
+    """Test that a new features or model version misses the old entry."""
+    store = PredictionStore(tmp_path)
+    store.put(_key(), b"old")
+
+    assert store.get(_key(features_version="feat2")) is None
+    assert store.get(_key(model_version="model2")) is None
+    assert store.get(_key(task="podium")) is None
+
+
+def test_etag_matching():
+    """Test If-None-Match parsing including lists, wildcard and weak prefix."""
+    etag = payload_etag(b"payload")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_predict_endpoint_etag_and_304(api_client):
+    """Test that race predictions carry an ETag and honour If-None-Match."""
+    response = api_client.get("/api/f1/predict/race/2024_01?model=quali_freq")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    # Second request is served from the store with identical bytes
+    repeat = api_client.get("/api/f1/predict/race/2024_01?model=quali_freq")
+    assert repeat.content == response.content
+    assert repeat.headers["etag"] == etag
+
+    not_modified = api_client.get(
+        "/api/f1/predict/race/2024_01?model=quali_freq", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_predict_endpoint_persists_to_store(api_client, api_settings):
+    """Test that a computed prediction is written to the on-disk store."""
+    from pathlib import Path
+
+    api_client.get("/api/f1/predict/race/2024_02?model=quali_freq")
+
+    stored = list(Path(api_settings.prediction_store_dir).rglob("2024_02.json"))
+    assert len(stored) == 1
+
+
+def test_predict_endpoint_unknown_race(api_client):
+    """Test that unknown races still return 400 and are not stored."""
+    response = api_client.get("/api/f1/predict/race/1999_01?model=quali_freq")
+
+    assert response.status_code == 400
+    assert "not found" in response.json()["detail"]
@@ -0,0 +1,95 @@
+"""Tests for the precomputed race catalog."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+from f1.data.race_catalog import RaceCatalog
+from f1.data.race_index import RaceIndex
+from tests.test_registry import create_test_data
+
+
+def _write_schedule(directory, season, races):
+    path = directory / f"{season}_season.json"
+    path.write_text(json.dumps({"season": season, "races": races}))
+    return path
+
+
+def _schedule_race(season, round_num, name, race_date):
+    return {
+        "race_id": f"{season}_{round_num:02d}",
+        "name": name,
+        "round": round_num,
+        "country": "Bahrain",
+        "track": "Bahrain International Circuit",
+        "date": race_date,
+    }
+
+
+def test_catalog_merges_features_and_schedules(tmp_path):
+    """Test that feature races get schedule names and schedule-only seasons are listed."""
+    _write_schedule(tmp_path, 2024, [_schedule_race(2024, 1, "Bahrain Grand Prix", "2024-03-02")])
+    _write_schedule(tmp_path, 2026, [_schedule_race(2026, 1, "Bahrain Grand Prix", "2026-03-01")])
+
+    catalog = RaceCatalog.build(RaceIndex(create_test_data(), version="v1"), tmp_path)
+
+    assert catalog.seasons == [2024, 2026]
+    season_2024 = catalog.races(season=2024)
+    assert [r["race_id"] for r in season_2024] == ["2024_01", "2024_02"]
+    assert season_2024[0]["name"] == "Bahrain Grand Prix"
+    assert season_2024[0]["date"] == "2024-03-02"
+    assert season_2024[1]["name"] == "Race 2024_02"
+    assert all(r["has_features"] for r in season_2024)
+
+    assert not catalog.races(season=2026)[0]["has_features"]
+    assert [r["race_id"] for r in catalog.races(featured_only=True)] == ["2024_01", "2024_02"]
+
+
+def test_catalog_upcoming_and_limit(tmp_path):
+    """Test upcoming-only filtering against a reference date, and limits."""
+    _write_schedule(
+        tmp_path,
+        2026,
+        [
+            _schedule_race(2026, 1, "Bahrain Grand Prix", "2026-03-01"),
+            _schedule_race(2026, 2, "Saudi Arabian Grand Prix", "2026-03-08"),
+            _schedule_race(2026, 3, "Australian Grand Prix", "2026-03-22"),
+        ],
+    )
+    catalog = RaceCatalog.build(None, tmp_path)
+
+    upcoming = catalog.races(season=2026, upcoming=True, today=date(2026, 3, 8))
+    assert [r["round"] for r in upcoming] == [2, 3]
+    assert len(catalog.races(season=2026, limit=1)) == 1
+    assert catalog.races(season=1999) == []
+
+
+def test_catalog_version_tracks_schedule_content(tmp_path):
+    """Test that the catalog version changes when a schedule file changes."""
+    index = RaceIndex(create_test_data(), version="v1")
+    path = _write_schedule(tmp_path, 2026, [_schedule_race(2026, 1, "A Grand Prix", "2026-03-01")])
+    first = RaceCatalog.build(index, tmp_path)
+    assert RaceCatalog.build(index, tmp_path).version == first.version
+
+    path.write_text(json.dumps({"season": 2026, "races": []}))
+    assert RaceCatalog.build(index, tmp_path).version != first.version
+
+
+def test_available_races_served_from_catalog_with_etag(api_client, api_settings):
+    """Test that /api/f1/races lists featured races only and honors If-None-Match."""
+    features_dir = Path(api_settings.data_dir) / "features"
+    _write_schedule(
+        features_dir, 2026, [_schedule_race(2026, 1, "Bahrain Grand Prix", "2026-03-01")]
+    )
+
+    response = api_client.get("/api/f1/races")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == len(data["races"]) > 0
+    assert all(r["season"] != 2026 for r in data["races"])
+    assert all(isinstance(r["date"], int) for r in data["races"])
+
+    etag = response.headers["etag"]
+    cached = api_client.get("/api/f1/races", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
@@ -0,0 +1,87 @@
+"""Tests for the race-partitioned feature index."""
+
+import pandas as pd
+
+from f1.data.race_index import RaceIndex
+
+
+def create_interleaved_data():
+    """Create feature rows where races are not stored contiguously."""
+    rows = []
+    for race_id, season, round_num in [
+        ("2024_02", 2024, 2),
+        ("2023_01", 2023, 1),
+        ("2024_01", 2024, 1),
+    ]:
+        for driver in ["VER", "HAM", "LEC"]:
+            rows.append(
+                {
+                    "race_id": race_id,
+                    "season": season,
+                    "round": round_num,
+                    "driver_id": driver,
+                    "quali_position": len(rows) % 3 + 1,
+                }
+            )
+
+    df = pd.DataFrame(rows)
+    # Interleave races so a naive slice would be wrong
+    return df.sample(frac=1.0, random_state=0).reset_index(drop=True)
+
+
+def test_race_lookup_matches_boolean_filter():
+    """Test that race slices contain exactly the race's rows."""
+    data = create_interleaved_data()
+    index = RaceIndex(data)
+
+    for race_id in data["race_id"].unique():
+        expected = data[data["race_id"] == race_id]
+        race_df = index.race(race_id)
+
+        assert len(race_df) == len(expected)
+        assert (race_df["race_id"] == race_id).all()
+        # Driver order within the race is preserved from the source table
+        assert race_df["driver_id"].tolist() == expected["driver_id"].tolist()
+
+
+def test_unknown_race_returns_empty_frame():
+    """Test that unknown races give an empty frame with the same columns."""
+    data = create_interleaved_data()
+    index = RaceIndex(data)
+
+    race_df = index.race("1999_01")
+
+    assert race_df.empty
+    assert list(race_df.columns) == list(data.columns)
+    assert not index.has_race("1999_01")
+
+
+def test_season_index_ordered_by_round():
+    """Test season lookups and chronological race ordering."""
+    index = RaceIndex(create_interleaved_data())
+
+    assert index.seasons == [2023, 2024]
+    assert index.season_races(2024) == ["2024_01", "2024_02"]
+    assert index.season_races(2022) == []
+    assert index.race_ids == ["2023_01", "2024_01", "2024_02"]
+
+
+def test_driver_index_returns_rows_in_race_order():
+    """Test driver lookups return every race for the driver."""
+    index = RaceIndex(create_interleaved_data())
+
+    driver_df = index.driver("HAM")
+
+    assert (driver_df["driver_id"] == "HAM").all()
+    assert driver_df["race_id"].tolist() == ["2023_01", "2024_01", "2024_02"]
+    assert index.driver("XXX").empty
+
+
+def test_races_stacks_requested_races():
+    """Test multi-race lookup keeps request order and skips unknown races."""
+    index = RaceIndex(create_interleaved_data())
+
+    stacked = index.races(["2024_02", "missing", "2023_01"])
+
+    assert stacked["race_id"].unique().tolist() == ["2024_02", "2023_01"]
+    assert len(stacked) == 6
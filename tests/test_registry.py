@@ -1,11 +1,22 @@
 """Tests for model registry."""
 
+import json
 from pathlib import Path
 
+import joblib
 import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
 
 from f1.models.baselines import QualifyingFrequencyBaseline
-from f1.models.registry import ModelRegistry, predict_race
+from f1.models.registry import ModelRegistry, predict_race, predict_races
+
+ZOO_FEATURES = [
+    "quali_position",
+    "driver_rolling_avg_finish",
+    "driver_rolling_avg_points",
+    "constructor_rolling_avg_points",
+]
 
 
 def create_test_data():
@@ -104,6 +115,80 @@ def test_predict_race_with_baseline(tmp_path):
         print(f"⚠ predict_race baseline test skipped: {e}")
 
 
+def save_zoo_model(model_dir: Path, data: pd.DataFrame, model_name: str = "lr") -> None:
+    """Train a small zoo classifier and save it in the registry layout."""
+    model = LogisticRegression().fit(
+        data[ZOO_FEATURES].values, (data["finish_position"] == 1).astype(int).values
+    )
+
+    model_subdir = model_dir / model_name
+    model_subdir.mkdir(parents=True, exist_ok=True)
+    joblib.dump(model, model_subdir / f"{model_name}_win.joblib")
+    with open(model_subdir / f"{model_name}_win_metadata.json", "w") as f:
+        json.dump({"features": ZOO_FEATURES}, f)
+
+
+def test_predict_races_matches_single_race(tmp_path):
+    """Test that stacked multi-race scoring equals per-race predictions."""
+    data = create_test_data()
+    save_zoo_model(tmp_path, data)
+
+    batch = predict_races(
+        race_ids=["2024_02", "2024_01"], model_name="lr", race_data=data, model_dir=tmp_path
+    )
+
+    # Results come back in request order
+    assert list(batch) == ["2024_02", "2024_01"]
+
+    for race_id, response in batch.items():
+        single = predict_race(race_id=race_id, model_name="lr", race_data=data, model_dir=tmp_path)
+        # Stacked BLAS calls may differ from single-race ones in the last ulp
+        assert response.win_prob == pytest.approx(single.win_prob, rel=1e-9, abs=1e-12)
+        assert response.podium_prob == pytest.approx(single.podium_prob, rel=1e-9, abs=1e-12)
+        assert response.expected_finish == pytest.approx(single.expected_finish, rel=1e-9)
+        # Normalization happens per race, not across the stacked frame
+        assert abs(sum(response.win_prob.values()) - 1.0) < 1e-9
+
+
+def test_predict_races_skips_unknown_races(tmp_path):
+    """Test that unknown races are omitted and all-unknown raises."""
+    data = create_test_data()
+    save_zoo_model(tmp_path, data)
+
+    batch = predict_races(
+        race_ids=["2024_01", "1999_01"], model_name="lr", race_data=data, model_dir=tmp_path
+    )
+    assert list(batch) == ["2024_01"]
+
+    with pytest.raises(ValueError, match="not found in data"):
+        predict_races(race_ids=["1999_01"], model_name="lr", race_data=data, model_dir=tmp_path)
+
+
+def test_predictions_to_responses_splits_interleaved_races():
+    """Test array-based response assembly on interleaved race rows."""
+    from f1.models.registry import _predictions_to_responses
+
+    predictions = pd.DataFrame(
+        {
+            "race_id": ["2024_02", "2024_01", "2024_02", "2024_01", "2024_02"],
+            "driver_id": ["VER", "VER", "HAM", "HAM", "LEC"],
+            "win_prob": [0.2, 0.7, 0.5, 0.3, 0.3],
+            "podium_prob": [0.6, 0.9, 0.8, 0.7, 0.6],
+        }
+    )
+
+    responses = _predictions_to_responses("lr", predictions)
+
+    assert list(responses) == ["2024_02", "2024_01"]
+    race = responses["2024_02"]
+    assert list(race.win_prob) == ["VER", "HAM", "LEC"]
+    assert race.podium_prob == {"VER": 0.6, "HAM": 0.8, "LEC": 0.6}
+    # Rank by descending win probability
+    assert race.expected_finish == {"HAM": 1.0, "LEC": 2.0, "VER": 3.0}
+    assert responses["2024_01"].expected_finish == {"VER": 1.0, "HAM": 2.0}
+    assert all(isinstance(p, float) for p in race.win_prob.values())
+
+
 def test_prediction_response_format():
     """Test that predictions match PredictionResponse schema."""
     from datetime import datetime
@@ -0,0 +1,141 @@
+"""Tests for hot reload of features and model artifacts."""
+
+import os
+from pathlib import Path
+
+from api.core.reload import ArtifactWatcher
+from api.deps import DataCache, ModelCache, PredictionCache
+from f1.schemas import PredictionResponse
+from f1.storage.predictions import PredictionKey
+from tests.test_model_cache import _save_baseline
+from tests.test_registry import create_test_data
+
+
+def _bump_mtime(path):
+    """Move a file's mtime forward so its signature changes."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _response(race_id):
+    return PredictionResponse(
+        race_id=race_id,
+        model_name="quali_freq",
+        win_prob={"VER": 1.0},
+        podium_prob={"VER": 1.0},
+        expected_finish={"VER": 1.0},
+    )
+
+
+def test_data_cache_swaps_in_new_features(tmp_path):
+    """Test that changed features are reloaded while old snapshots stay valid."""
+    features_path = tmp_path / "features.parquet"
+    data = create_test_data()
+    data.to_parquet(features_path)
+
+    cache = DataCache()
+    old_index = cache.get_index(features_path)
+
+    # Unchanged content: no rebuild even though the mtime moved
+    _bump_mtime(features_path)
+    assert cache.refresh(features_path) is None
+    assert cache.get_index(features_path) is old_index
+
+    data[data["race_id"] == "2024_01"].to_parquet(features_path)
+    versions = cache.refresh(features_path)
+
+    new_index = cache.get_index(features_path)
+    assert versions == (old_index.version, new_index.version)
+    assert new_index.race_ids == ["2024_01"]
+    # A request holding the old index still sees the old data
+    assert len(old_index.race_ids) > 1
+
+
+def test_model_cache_refresh_preloads_new_version(tmp_path):
+    """Test that refresh loads a retrained artifact and retires the old one."""
+    _save_baseline(tmp_path)
+
+    cache = ModelCache(revalidate_seconds=60)
+    first = cache.get_model("quali_freq", tmp_path)
+    old_fingerprint, _ = cache.fingerprint("quali_freq", tmp_path)
+
+    assert cache.refresh() == []
+
+    _bump_mtime(tmp_path / "quali_freq.joblib")
+    swapped = cache.refresh()
+
+    new_fingerprint, _ = cache.fingerprint("quali_freq", tmp_path)
+    assert swapped == [("quali_freq", old_fingerprint, new_fingerprint)]
+    # Served from the preloaded entry despite the long revalidate window
+    assert cache.get_model("quali_freq", tmp_path) is not first
+    assert cache.stats()["entries"] == 1
+
+
+def test_watcher_drops_predictions_by_version(tmp_path):
+    """Test that only predictions pinned to the superseded model are dropped."""
+    _save_baseline(tmp_path)
+    features_path = tmp_path / "features.parquet"
+    create_test_data().to_parquet(features_path)
+
+    data_cache = DataCache()
+    model_cache = ModelCache(revalidate_seconds=60)
+    prediction_cache = PredictionCache()
+
+    index = data_cache.get_index(features_path)
+    model_cache.get_model("quali_freq", tmp_path)
+    old_fingerprint, _ = model_cache.fingerprint("quali_freq", tmp_path)
+
+    stale = PredictionKey("2024_01", "quali_freq", "win", index.version, old_fingerprint)
+    other = PredictionKey("2024_01", "elo", "win", index.version, "other")
+    prediction_cache.put(stale, _response("2024_01"))
+    prediction_cache.put(other, _response("2024_01"))
+
+    watcher = ArtifactWatcher(features_path, data_cache, model_cache, prediction_cache)
+    _bump_mtime(tmp_path / "quali_freq.joblib")
+    result = watcher.check()
+
+    assert result["features"] is None
+    assert len(result["models"]) == 1
+    assert prediction_cache.get(stale) is None
+    assert prediction_cache.get(other) is not None
+    assert watcher.reloads == 1
+
+
+def test_watcher_drops_counterfactual_scores_by_version(api_client, api_settings):
+    """Test that a reload after a counterfactual drops its cached raw outputs."""
+    import pandas as pd
+
+    from api import deps
+    from api.main import app
+
+    features_path = Path(api_settings.data_dir) / "features" / "features.parquet"
+    model_dir = Path(api_settings.model_dir)
+    data_cache = deps.get_data_cache()
+    model_cache = app.dependency_overrides[deps.get_model_cache]()
+    prediction_cache = app.dependency_overrides[deps.get_prediction_cache]()
+
+    response = api_client.post(
+        "/api/f1/counterfactual?model=quali_freq",
+        json={
+            "race_id": "2024_01",
+            "driver_id": "HAM",
+            "changes": {"qualifying_position_delta": -1},
+        },
+    )
+    assert response.status_code == 200
+
+    old_version = data_cache.get_index(features_path).version
+    model_version, _ = model_cache.fingerprint("quali_freq", model_dir, "win")
+    stale = PredictionKey("2024_01", "quali_freq", "win", old_version or "", model_version)
+
+    data = pd.read_parquet(features_path)
+    data[data["race_id"] == "2024_01"].to_parquet(features_path)
+    watcher = ArtifactWatcher(features_path, data_cache, model_cache, prediction_cache)
+    result = watcher.check()
+    assert result["features"][0] == old_version
+
+    recomputed = []
+    prediction_cache.get_or_compute_scores(
+        stale, lambda: recomputed.append(True) or pd.DataFrame({"score": [0.0]})
+    )
+    assert recomputed == [True]
@@ -0,0 +1,82 @@
+"""Tests for season-scale counterfactual scenarios."""
+
+import pandas as pd
+import pytest
+
+from f1.analysis.counterfactuals import apply_deltas
+from f1.analysis.scenarios import apply_rules
+from f1.schemas import ScenarioRule
+from tests.test_registry import create_test_data
+
+
+def test_rules_match_apply_deltas_row_by_row():
+    """Test that rules select by team and round and apply apply_deltas semantics."""
+    data = create_test_data()
+    rules = [
+        ScenarioRule(teams=["Ferrari"], from_round=2, changes={"constructor_form_delta": 0.15}),
+        ScenarioRule(driver_ids=["LEC"], changes={"qualifying_position_delta": -1}),
+    ]
+
+    modified, affected = apply_rules(data, rules)
+    assert affected == ["2024_01", "2024_02"]
+
+    # Rules stack in order on the rows they both match
+    expected = data.copy()
+    for race_id, rules_changes in [
+        ("2024_01", [{"qualifying_position_delta": -1}]),
+        ("2024_02", [{"constructor_form_delta": 0.15}, {"qualifying_position_delta": -1}]),
+    ]:
+        race = expected[expected["race_id"] == race_id]
+        for changes in rules_changes:
+            race = apply_deltas(race, "LEC", changes)
+        expected.loc[race.index] = race
+
+    pd.testing.assert_frame_equal(modified, expected, check_dtype=False)
+
+
+def test_rules_leave_unmatched_races_untouched():
+    """Test that only races with a matching row are reported as affected."""
+    data = create_test_data()
+
+    _, affected = apply_rules(
+        data, [ScenarioRule(driver_ids=["VER"], to_round=1, changes={"driver_form_delta": 0.1})]
+    )
+    assert affected == ["2024_01"]
+
+    _, affected = apply_rules(
+        data, [ScenarioRule(driver_ids=["XXX"], changes={"driver_form_delta": 0.1})]
+    )
+    assert affected == []
+
+    with pytest.raises(ValueError, match="Unknown scenario changes"):
+        apply_rules(data, [ScenarioRule(changes={"tire_strategy": 1.0})])
+
+
+def test_season_scenario_endpoint(api_client):
+    """Test that a scenario reports per-driver totals and per-model errors."""
+    response = api_client.post(
+        "/api/f1/scenarios/season",
+        json={
+            "season": 2024,
+            "rules": [{"driver_ids": ["HAM"], "changes": {"qualifying_position_delta": -5}}],
+            "models": ["quali_freq", "gpt4"],
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["affected_races"]
+    impacts = {impact["driver_id"]: impact for impact in body["results"]["quali_freq"]}
+    assert 1 <= impacts["HAM"]["races"] <= len(body["affected_races"])
+    assert impacts["HAM"]["delta"]["expected_wins"] == pytest.approx(
+        impacts["HAM"]["scenario"]["expected_wins"] - impacts["HAM"]["baseline"]["expected_wins"]
+    )
+    # Probabilities are renormalized per race, so total expected wins is unchanged
+    assert sum(i["delta"]["expected_wins"] for i in impacts.values()) == pytest.approx(0.0)
+    assert [error["model_name"] for error in body["errors"]] == ["gpt4"]
+
+    missing = api_client.post(
+        "/api/f1/scenarios/season",
+        json={"season": 1999, "rules": [{"changes": {"driver_form_delta": 0.1}}]},
+    )
+    assert missing.status_code == 404
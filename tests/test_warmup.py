@@ -0,0 +1,62 @@
+"""Tests for startup warm-up and the readiness probe."""
+
+import asyncio
+from pathlib import Path
+
+from api.core.executors import ComputeExecutors
+from api.core.warmup import Warmup, warmup_models
+from api.deps import DataCache, ModelCache
+
+
+def test_warmup_preloads_features_and_models(api_settings):
+    """Test that warm-up loads features and models and records timings."""
+    warmup = Warmup()
+    model_cache = ModelCache()
+    executors = ComputeExecutors(threads=2, processes=0)
+
+    assert not warmup.ready
+
+    try:
+        asyncio.run(
+            warmup.run(
+                features_path=Path(api_settings.data_dir) / "features" / "features.parquet",
+                model_dir=Path(api_settings.model_dir),
+                model_names=["quali_freq", "xgb"],
+                data_cache=DataCache(),
+                model_cache=model_cache,
+                executors=executors,
+            )
+        )
+    finally:
+        executors.shutdown()
+
+    assert warmup.ready
+    report = warmup.report()
+    assert report["items"]["features"]["status"] == "ok"
+    assert report["items"]["model:quali_freq"]["status"] == "ok"
+    # No xgb artifact in the fixtures
+    assert report["items"]["model:xgb"]["status"] == "skipped"
+    assert model_cache.stats()["entries"] == 1
+
+
+def test_warmup_models_filters_invalid_names():
+    """Test that unknown configured model names are dropped."""
+    assert warmup_models(["quali_freq", "gpt4"]) == ["quali_freq"]
+    assert "nbt_tlf" in warmup_models(None)
+
+
+def test_ready_endpoint_reflects_warmup(api_client):
+    """Test that /health/ready is 503 until warm-up finishes."""
+    from api import deps
+    from api.main import app
+
+    warmup = Warmup()
+    app.dependency_overrides[deps.get_warmup] = lambda: warmup
+
+    assert api_client.get("/health/ready").status_code == 503
+    assert api_client.get("/health").status_code == 200
+
+    warmup.skip()
+    response = api_client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "disabled"